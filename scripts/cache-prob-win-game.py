@@ -2,30 +2,25 @@
 
 """
 This script computes and caches the probability that the player serving wins the game, given their 
-probability of winning a point on serve. This is useful because this calculation is expensive.
-The script performs the calculation over a 1-D grid of point-winning probabilities, and the resulting 
-game-winning probabilities are saved as an interpolated function that can be evaluated quickly. 
-One such function is generated and cached for every possible starting score in the game.
-
-Each function is saved in a separate file. Example filenames:
- + prob_win_game_20.pkl
- + prob_win_game_noad_03.pkl
-where we used the following conventions:
- + "noad" indicates no-ad scoring.
- + The final two digits represent the starting score (server first).
-   For example, "20" corresponds to 30-0.
-
-Example of how to use such a cached function:
-
-    with open('data-cache/prob_win_game_00.pkl', 'rb') as fh:
-        f = pickle.load(fh)
-        prob_win_point = 0.3   # the probability that the player serving wins the point
-        prob_win_game  = f(prob_win_point).item()
+probability of winning a point on serve. The script performs the calculation over a 1-D grid of
+point-winning probabilities, for every possible starting score in the game, both for regular and
+'no ad' scoring. The results are saved as a single table, in 'data-cache/prob_win_game.npy':
+ + axis 0: the scoring rules (0 = regular, 1 = 'no ad')
+ + axis 1: the number of points won by the player serving
+ + axis 2: the number of points won by the player receiving
+ + axis 3: the point-winning probability, an evenly spaced grid over [0, 1]
+Entries for scores that are not valid are NaN.
+
+Example of how to use the cached table:
+
+    table = np.load('data-cache/prob_win_game.npy', mmap_mode='r')
+    Ps    = np.linspace(0, 1, table.shape[-1])
+    prob_win_point = 0.3   # the probability that the player serving wins the point
+    prob_win_game  = np.interp(prob_win_point, Ps, table[0, 2, 0])   # regular scoring, from 30-0
 """
-from pathlib           import Path
-from scipy.interpolate import interp1d
-from typing            import Literal
-import os, pickle, sys
+from pathlib import Path
+from typing  import Literal
+import os, sys
 import numpy as np
 
 # add path to the src directory if not in PYTHONPATH already
@@ -35,10 +30,10 @@ if SRC_DIR not in sys.path:
     sys.path.append(SRC_DIR)
 
 from tennis_lab.core.game_score        import GameScore
-from tennis_lab.core.match_format      import MatchFormat
-from tennis_lab.paths.game_probability import probabilityServerWinsGame
+from tennis_lab.core.match_format      import MatchFormat, POINTS_TO_WIN_GAME
+from tennis_lab.paths.game_probability import probabilityServerWinsGameArray
 
-# The directory where to store (pickle) the interpolated functions
+# The directory where to store the table
 DIRPATH = Path(PROJECT_ROOT, "data-cache")
 DIRPATH.mkdir(exist_ok=True)
 
@@ -50,61 +45,22 @@ PLAYER_SERVING: Literal[1,2] = 1
 # that the player serving wins the point
 Ps = np.linspace(0, 1, 100)
 
-# List all possible scores in a game.
-initScoresInter = [(0,0), (0,1), (0,2), (0,3),
-                   (1,0), (1,1), (1,2), (1,3),
-                   (2,0), (2,1), (2,2), (2,3),
-                   (3,0), (3,1), (3,2), (3,3)]   # intermediate scores: the game is not over
-initScoresWon   = [(4,0), (4,1), (4,2)]          # game is over: player serving won
-initScoresLost  = [(0,4), (1,4), (2,4)]          # game is over: player serving lost
-initScore34     = [(3,4)]                        # special score
-initScore43     = [(4,3)]                        # special score
-initScores      = initScoresInter + initScoresWon + initScoresLost + initScore34 + initScore43
-
 # Match formats for regular and no-ad scoring
 FORMAT_REGULAR = MatchFormat(noAdRule=False)
 FORMAT_NO_AD   = MatchFormat(noAdRule=True)
 
-# Calculate the probability of winning the game starting from all possible scores.
-# Two such calculations are performed - both for when using regular scoring or the 'no ad' format.
-for i, (pointsP1, pointsP2) in enumerate(initScores):
-    print(f"\r[{i+1:2d}/{len(initScores):2d}] Processing score ({pointsP1}, {pointsP2})...", end="", flush=True)
-    scoreRglr = GameScore(pointsP1, pointsP2, FORMAT_REGULAR)
-    scoreNoAd = GameScore(pointsP1, pointsP2, FORMAT_NO_AD)
-
-    if (pointsP1, pointsP2) in initScoresInter:
-        ProbGameRGLR = [probabilityServerWinsGame(scoreRglr, PLAYER_SERVING, p) for p in Ps]  # regular scoring
-        ProbGameNOAD = [probabilityServerWinsGame(scoreNoAd, PLAYER_SERVING, p) for p in Ps]  # 'no ad' scoring
-    elif (pointsP1, pointsP2) in initScoresWon:
-        # serving player won => prob win game is 1.0
-        ProbGameRGLR = [1.0 for p in Ps]  # regular scoring
-        ProbGameNOAD = [1.0 for p in Ps]  # 'no ad' scoring
-    elif (pointsP1, pointsP2) in initScoresLost:
-        # serving player lost => prob win game is 0.0
-        ProbGameRGLR = [0.0 for p in Ps]  # regular scoring
-        ProbGameNOAD = [0.0 for p in Ps]  # 'no ad' scoring
-    elif (pointsP1, pointsP2) in initScore34:
-        # when using 'no ad' format, serving player lost
-        ProbGameRGLR = [probabilityServerWinsGame(scoreRglr, PLAYER_SERVING, p) for p in Ps]  # regular scoring
-        ProbGameNOAD = [0.0 for p in Ps]
-    elif (pointsP1, pointsP2) in initScore43:
-        # when using 'no ad' format, serving player won
-        ProbGameRGLR = [probabilityServerWinsGame(scoreRglr, PLAYER_SERVING, p) for p in Ps]  # regular scoring
-        ProbGameNOAD = [1.0 for p in Ps]
-    else:
-        raise Exception(f"Unknown score: {scoreRglr}")
-
-    # Save to 1-D interpolation objects, for both the regular and the 'no-ad' score format.
-    probWinGameRglrInterp = interp1d(Ps, ProbGameRGLR, kind='linear', fill_value="extrapolate")
-    probWinGameNoAdInterp = interp1d(Ps, ProbGameNOAD, kind='linear', fill_value="extrapolate")
-
-    # Save the interpolated functions to file
-    fnameRglr = f"prob_win_game_{pointsP1}{pointsP2}.pkl"
-    with open(Path(DIRPATH, fnameRglr), 'wb') as fh:
-        pickle.dump(probWinGameRglrInterp, fh)
-
-    fnameNoAd = f"prob_win_game_noad_{pointsP1}{pointsP2}.pkl"
-    with open(Path(DIRPATH, fnameNoAd), 'wb') as fh:
-        pickle.dump(probWinGameNoAdInterp, fh)
-print("\rDone" + 50 * ' ')
-
+# Calculate the probability of winning the game starting from all possible scores (capped scores
+# go up to 4 points). Two such calculations are performed - for regular and for 'no ad' scoring.
+numPoints = POINTS_TO_WIN_GAME + 1
+table     = np.full((2, numPoints, numPoints, len(Ps)), np.nan)
+for noAdRule, matchFormat in enumerate([FORMAT_REGULAR, FORMAT_NO_AD]):
+    for pointsServ in range(numPoints):
+        for pointsRecv in range(numPoints):
+            try:
+                score = GameScore(pointsServ, pointsRecv, matchFormat)
+            except ValueError:
+                continue   # not a valid score (e.g. 4-4)
+            table[noAdRule, pointsServ, pointsRecv] = probabilityServerWinsGameArray(score, PLAYER_SERVING, Ps)
+
+np.save(Path(DIRPATH, "prob_win_game.npy"), table)
+print("Done")
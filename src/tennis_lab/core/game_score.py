@@ -6,6 +6,7 @@ from tennis_lab.core.match_format import MatchFormat, POINTS_TO_WIN_GAME
 class GameScore:
     """
     Represents the running score of a tennis game.
+    Instances use __slots__ (no per-instance __dict__): games are scored point by point in large numbers.
 
     Attributes:
     -----------
@@ -40,6 +41,8 @@ class GameScore:
         Returns the traditional score format for display.
     """
 
+    __slots__ = ('_currPointsP1', '_currPointsP2', '_matchFormat', '_noAdRule', '_capPoints', '_winner')
+
     def __init__(self,
                  pointsP1   : int,
                  pointsP2   : int,
@@ -79,6 +82,10 @@ class GameScore:
         if self._capPoints:
             self._cap_score()
 
+        # the winner (if any) is only recomputed when the score changes, see '_updateWinner'
+        self._winner: Optional[Literal[1, 2]] = None
+        self._updateWinner()
+
     @property
     def isBlank(self) -> bool:
         """
@@ -101,7 +108,7 @@ class GameScore:
         """
         Returns whether this is a final score (game decided).
         """
-        return self._playerWon(1) or self._playerWon(2)
+        return self._winner is not None
 
     @property
     def playerWithAdvantage(self) -> Optional[Literal[1, 2]]:
@@ -119,11 +126,7 @@ class GameScore:
         """
         Returns which player won the game, None if score is not final.
         """
-        if self._playerWon(1):
-            return 1
-        if self._playerWon(2):
-            return 2
-        return None
+        return self._winner
 
     def recordPoint(self, pointWinner: Literal[1, 2]):
         """
@@ -147,6 +150,7 @@ class GameScore:
 
         if self._capPoints:
             self._cap_score()
+        self._updateWinner()
 
     def asPoints(self, pov: Literal[1, 2]) -> tuple[int, int]:
         """
@@ -221,6 +225,15 @@ class GameScore:
         return GameScore(self._currPointsP1+1, self._currPointsP2  , self._matchFormat), \
                GameScore(self._currPointsP1  , self._currPointsP2+1, self._matchFormat)
 
+    def _updateWinner(self):
+        """
+        Recomputes which player won the game (None if nobody did yet), after the score changed.
+        'isFinal' and 'winner' return this stored value instead of re-applying the scoring rules.
+        """
+        if   self._playerWon(1): self._winner = 1
+        elif self._playerWon(2): self._winner = 2
+        else:                    self._winner = None
+
     def _playerWon(self, player: Literal[1, 2]) -> bool:
         """
         Tests whether a given player won the game, considering the current score.
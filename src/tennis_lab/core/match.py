@@ -1,7 +1,7 @@
 """Match class representing an entire tennis match."""
 
 from copy   import deepcopy
-from typing import List, Literal, Optional
+from typing import List, Literal, Optional, Sequence
 
 from tennis_lab.core.match_format import MatchFormat
 from tennis_lab.core.match_score  import MatchScore
@@ -127,10 +127,12 @@ class Match:
         """
         Which player won each point ex: [1, 1, 2, ...]
         """
-        points = [myset.pointHistory for myset in self.setHistory]
+        points = []
+        for myset in self.setHistory:
+            points.extend(myset.pointHistory)
         if self.currentSet is not None:
-            points.append(self.currentSet.pointHistory)
-        return sum(points, [])
+            points.extend(self.currentSet.pointHistory)
+        return points
 
     @property
     def totalPoints(self) -> tuple[int, int]:
@@ -176,11 +178,15 @@ class Match:
                 self.currentSet = Set(servingNext, self.score._isFinalSet(), self.score.currSetScore,
                                       self._matchFormat, _shareInitScore=True)
 
-    def recordPoints(self, pointWinners: list[Literal[1, 2]]):
+    def recordPoints(self, pointWinners: Sequence[Literal[1, 2]]):
         """
         Update the match state with the result of multiple points.
-        pointWinners - which player won each point (1 or 2)
+        pointWinners - which player won each point (1 or 2); a list, an array('B') or a NumPy integer array
         """
+        # unbox array/memoryview/ndarray buffers into Python ints in a single C-level pass
+        if hasattr(pointWinners, "tolist"):
+            pointWinners = pointWinners.tolist()
+
         for pointWinner in pointWinners:
             self.recordPoint(pointWinner)
 
@@ -36,8 +36,44 @@ class MatchFormat:
         Whether games use the 'no ad' rule (default: False)
     capPoints: bool
         Whether to represent all deuces as 3-3 and all adds as 3-4 or 4-3. (default: True)
+
+    MatchFormat instances are interned: constructing a MatchFormat with the same parameters
+    as an existing one returns that same (shared) instance. They are therefore immutable:
+    assigning or deleting an attribute after construction raises AttributeError.
     """
 
+    # interned instances, keyed on the (type, value) of every constructor argument
+    _instances: dict[tuple, "MatchFormat"] = {}
+
+    # the key this instance is interned under (None if an argument is unhashable)
+    _internKey: Optional[tuple]
+
+    def __new__(cls,
+                bestOfSets    : Optional[int] = None,
+                matchTiebreak : bool          = False,
+                setLength     : int           = 6,
+                setEnding     : SetEnding     = SetEnding.TIEBREAK,
+                finalSetEnding: SetEnding     = SetEnding.TIEBREAK,
+                noAdRule      : bool          = False,
+                capPoints     : bool          = True):
+        """
+        Return the interned instance for these parameters if there is one, else a new instance.
+        The argument types are part of the key, so that for example 'noAdRule=1' is not
+        confused with 'noAdRule=True' and still fails validation in '__init__'.
+        """
+        args = (bestOfSets, matchTiebreak, setLength, setEnding, finalSetEnding, noAdRule, capPoints)
+        key  = tuple((type(arg), arg) for arg in args)
+        internKey: Optional[tuple] = key
+        try:
+            instance = cls._instances.get(key)
+        except TypeError:   # unhashable (hence invalid) argument: '__init__' will reject it
+            internKey, instance = None, None
+
+        if instance is None:
+            instance = super().__new__(cls)
+            instance._internKey = internKey
+        return instance
+
     def __init__(self,
                  bestOfSets    : Optional[int] = None,
                  matchTiebreak : bool          = False,
@@ -63,6 +99,10 @@ class MatchFormat:
         -------
         ValueError - if any of the inputs are invalid
         """
+        # an interned instance was already validated and initialized with these exact inputs
+        if getattr(self, "_validated", False):
+            return
+
         if bestOfSets is not None and (not isinstance(bestOfSets, int) or bestOfSets < 1):
             raise ValueError(f"Invalid bestOfSets: {bestOfSets}. Must be None or a positive integer.")
         if not isinstance(matchTiebreak, bool):
@@ -86,6 +126,38 @@ class MatchFormat:
         self.noAdRule      : bool          = noAdRule
         self.capPoints     : bool          = capPoints
 
+        self._hash         : int           = hash((bestOfSets, matchTiebreak, setLength, setEnding,
+                                                   finalSetEnding, noAdRule, capPoints))
+
+        # all inputs checked above: a MatchFormat instance is always valid, so consumers
+        # only need an isinstance check (from here on the instance is frozen, see '__setattr__')
+        self._validated    : bool          = True
+
+        if self._internKey is not None:
+            MatchFormat._instances.setdefault(self._internKey, self)
+
+    def __setattr__(self, name: str, value) -> None:
+        """
+        Set an attribute while the instance is being initialized.
+
+        Raises:
+        -------
+        AttributeError - once initialized, as the instance may be shared (see interning above)
+        """
+        if getattr(self, "_validated", False):
+            raise AttributeError(f"MatchFormat instances are immutable: cannot set '{name}'.")
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name: str) -> None:
+        """
+        Attributes of a MatchFormat cannot be deleted.
+
+        Raises:
+        -------
+        AttributeError - always, as the instance may be shared (see interning above)
+        """
+        raise AttributeError(f"MatchFormat instances are immutable: cannot delete '{name}'.")
+
     def __repr__(self) -> str:
         """Valid Python expression that can be used to recreate this MatchFormat instance."""
         return (f"MatchFormat(bestOfSets={self.bestOfSets}, matchTiebreak={self.matchTiebreak}, "
@@ -104,8 +176,40 @@ class MatchFormat:
                 f"  finalSetEnding: {finalSetEndingStr}\n"
                 f"  noAdRule      : {self.noAdRule}")
 
+    def asDict(self) -> dict:
+        """Plain dictionary describing this match format, from which 'fromDict' recreates it."""
+        return {"bestOfSets"    : self.bestOfSets,
+                "matchTiebreak" : self.matchTiebreak,
+                "setLength"     : self.setLength,
+                "setEnding"     : self.setEnding.value,
+                "finalSetEnding": self.finalSetEnding.value,
+                "noAdRule"      : self.noAdRule,
+                "capPoints"     : self.capPoints}
+
+    @classmethod
+    def fromDict(cls, d: dict) -> "MatchFormat":
+        """
+        Recreate a match format from the dictionary produced by 'asDict'.
+
+        Raises:
+        -------
+        ValueError - if the dictionary does not describe a valid match format
+        """
+        try:
+            return cls(bestOfSets     = d["bestOfSets"],
+                       matchTiebreak  = d["matchTiebreak"],
+                       setLength      = d["setLength"],
+                       setEnding      = SetEnding(d["setEnding"]),
+                       finalSetEnding = SetEnding(d["finalSetEnding"]),
+                       noAdRule       = d["noAdRule"],
+                       capPoints      = d["capPoints"])
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Invalid MatchFormat dictionary: {d}") from e
+
     def __eq__(self, other) -> bool:
         """Check equality between two MatchFormat instances."""
+        if self is other:
+            return True
         if not isinstance(other, MatchFormat):
             return False
         return (self.bestOfSets     == other.bestOfSets     and
@@ -117,5 +221,21 @@ class MatchFormat:
                 self.capPoints      == other.capPoints)
 
     def __hash__(self) -> int:
-        return hash((self.bestOfSets, self.matchTiebreak, self.setLength,
-                     self.setEnding, self.finalSetEnding, self.noAdRule, self.capPoints))
+        """
+        Hash consistent with '__eq__', computed once at construction (instances are immutable).
+        Lets a MatchFormat be part of a cache key, ex: the cache of 'GamePath.generateAllPaths'.
+        """
+        return self._hash
+
+    def __reduce__(self):
+        """Pickle by constructor arguments, so that unpickling goes through the interning."""
+        return (MatchFormat, (self.bestOfSets, self.matchTiebreak, self.setLength,
+                              self.setEnding, self.finalSetEnding, self.noAdRule, self.capPoints))
+
+    def __copy__(self) -> "MatchFormat":
+        """MatchFormat instances are shared, so a copy is the instance itself."""
+        return self
+
+    def __deepcopy__(self, memo) -> "MatchFormat":
+        """MatchFormat instances are shared, so a copy is the instance itself."""
+        return self
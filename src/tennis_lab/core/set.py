@@ -1,7 +1,8 @@
 """Set class representing a set in a tennis match."""
 
+from array  import array
 from copy   import deepcopy
-from typing import List, Literal, Optional
+from typing import List, Literal, Optional, Sequence
 
 from tennis_lab.core.game         import Game
 from tennis_lab.core.match_format import MatchFormat
@@ -40,6 +41,8 @@ class Set:
         The match format for this set.
     gameHistory: list[Game|Tiebreak]
         The games that have been completed so far (including the tiebreaker) in this set.
+    gameWinners: array
+        Which player won each completed game (including the tiebreaker), ex: array('B', [1, 2, 2, ...])
     pointHistory: list[Literal[1,2]]
         Which player won each point ex: [1, 1, 2, ...]
 
@@ -92,7 +95,8 @@ class Set:
         if initScore is not None and initScore._isFinalSet != isFinalSet:
             raise ValueError(f"initScore.isFinalSet ({initScore._isFinalSet}) must match isFinalSet ({isFinalSet}).")
         if initScore is not None and matchFormat is not None:
-            if initScore._matchFormat != matchFormat:
+            # the same (shared) format object needs no field-by-field comparison
+            if initScore._matchFormat is not matchFormat and initScore._matchFormat != matchFormat:
                 raise ValueError("initScore.matchFormat must match matchFormat.")
 
         self._isFinalSet : bool        = isFinalSet
@@ -114,11 +118,14 @@ class Set:
         # object that represents the tiebreak being played next (if any)
         # Note the '_shareInitScore=True' argument.
         self.tiebreaker: Optional[Tiebreak] = None
+        self._atTiebreak: bool              = False   # whether the next point is part of a tiebreak
         if self.score.nextPointIsTiebreak:
             self.tiebreaker = Tiebreak(playerServing=playerServing, isSuper=self.score.tiebreakScore._isSuper,
                                        initScore=self.score.tiebreakScore, matchFormat=self._matchFormat, _shareInitScore=True)
+            self._atTiebreak = True
 
-        self.gameHistory: List[Game|Tiebreak] = []   # completed Game/Tiebreak instances
+        self.gameHistory : List[Game|Tiebreak] = []            # completed Game/Tiebreak instances
+        self._gameWinners: array               = array('B')    # winner of each completed Game/Tiebreak
 
     @property
     def servesNext(self) -> Literal[1, 2]:
@@ -161,12 +168,22 @@ class Set:
         """
         Which player won each point ex: [1, 1, 2, ...]
         """
-        points = [item.pointHistory for item in self.gameHistory]
+        points = []
+        for item in self.gameHistory:
+            points.extend(item.pointHistory)
         if self.currentGame is not None:
-            points.append(self.currentGame.pointHistory)
+            points.extend(self.currentGame.pointHistory)
         if self.tiebreaker is not None:
-            points.append(self.tiebreaker.pointHistory)
-        return sum(points, [])  # sum of lists is a list
+            points.extend(self.tiebreaker.pointHistory)
+        return points
+
+    @property
+    def gameWinners(self) -> array:
+        """
+        Which player won each completed game (including the tiebreaker) ex: array('B', [1, 2, 2, ...])
+        Parallel to 'gameHistory', but packed as unsigned bytes for cheap aggregation.
+        """
+        return self._gameWinners
 
     @property
     def totalPoints(self) -> tuple[int, int]:
@@ -203,36 +220,24 @@ class Set:
             raise ValueError(f"Invalid pointWinner: {pointWinner}. Must be 1 or 2.")
         if self.isOver:
             return
+        self._playPoint(pointWinner)
 
-        # check that either a regular game or a tiebreaker
-        # is in progress, but not both at the same time
-        if not ((self.currentGame is not None) ^ (self.tiebreaker is not None)):
-            raise RuntimeError("Invalid state: exactly one of 'currentGame' or 'tiebreaker' attributes must be set.")
-
-        # notify the appropriate sub-object to do its own point recording
-        # NOTE: the 'score: SetScore' attribute of this Set instance *shares* the GameScore/TiebreakScore
-        #       attribute of the Game or Tiebreak sub-object, so it does not need to be updates explicitly.
-        if self.currentGame is not None:
-            self.currentGame.recordPoint(pointWinner)
-            gameOver = self.currentGame.isOver
-        else:
-            self.tiebreaker.recordPoint(pointWinner)
-            gameOver = self.tiebreaker.isOver
-
-        # handle game/tiebreak completion 
-        if gameOver:
-            if self.currentGame is not None:
-                self._onGameOver()
-            else:
-                self._onTiebreakOver()
-
-    def recordPoints(self, pointWinners: list[Literal[1, 2]]):
+    def recordPoints(self, pointWinners: Sequence[Literal[1, 2]]):
         """
         Update the set state with the result of multiple points.
-        pointWinners - which player won each point (1 or 2)
+        pointWinners - which player won each point (1 or 2); a list, an array('B') or a NumPy integer array
         """
+        # unbox array/memoryview/ndarray buffers into Python ints in a single C-level pass
+        if hasattr(pointWinners, "tolist"):
+            pointWinners = pointWinners.tolist()
+
+        score = self.score
         for pointWinner in pointWinners:
-            self.recordPoint(pointWinner)
+            if pointWinner not in (1, 2):
+                raise ValueError(f"Invalid pointWinner: {pointWinner}. Must be 1 or 2.")
+            if score.isFinal:
+                continue
+            self._playPoint(pointWinner)
 
     def scoreHistory(self) -> str:
         """
@@ -278,12 +283,35 @@ class Set:
             s += f"P{self.winner} wins set"
         return s
 
+    def _playPoint(self, pointWinner: Literal[1, 2]):
+        """
+        Records a (validated) point on the game or tiebreak in progress and handles its completion.
+        Shared by 'recordPoint' and 'recordPoints'; the set must not be over.
+        """
+        # check that either a regular game or a tiebreaker is in
+        # progress (not both), and that '_atTiebreak' agrees with it
+        if (self.tiebreaker is not None) is not self._atTiebreak or (self.currentGame is None) is not self._atTiebreak:
+            raise RuntimeError("Invalid state: exactly one of 'currentGame' or 'tiebreaker' attributes must be set.")
+
+        # notify the appropriate sub-object to do its own point recording
+        # NOTE: the 'score: SetScore' attribute of this Set instance *shares* the GameScore/TiebreakScore
+        #       attribute of the Game or Tiebreak sub-object, so it does not need to be updates explicitly.
+        if self.currentGame is not None:
+            self.currentGame.recordPoint(pointWinner)
+            if self.currentGame.isOver:
+                self._onGameOver()
+        else:
+            self.tiebreaker.recordPoint(pointWinner)
+            if self.tiebreaker.isOver:
+                self._onTiebreakOver()
+
     def _onGameOver(self):
         """
         Updates the set state when a game completes.
         """
         # archive the completed game and determine next server
         self.gameHistory.append(self.currentGame)
+        self._gameWinners.append(self.currentGame.winner)
         servingNext = 3 - self.currentGame.server
 
         # update the set score at the game/tiebreaker granularity level
@@ -300,6 +328,7 @@ class Set:
                                         initScore=self.score.tiebreakScore, matchFormat=self._matchFormat,
                                         _shareInitScore=True)
             self.currentGame = None
+            self._atTiebreak = True
 
         else:
             self.currentGame = Game(playerServing=servingNext, initScore=self.score.currGameScore,
@@ -312,13 +341,15 @@ class Set:
         """
         # archive the completed tiebreak
         self.gameHistory.append(self.tiebreaker)
+        self._gameWinners.append(self.tiebreaker.winner)
 
         # update the set score at the game/tiebreaker granularity level
         # NOTE: at the point level, it has been updated via the shared TiebreakScore object
         self.score._recordTiebreak(self.tiebreaker.winner)
 
         # the set is over after a tiebreak
-        self.tiebreaker = None
+        self.tiebreaker  = None
+        self._atTiebreak = False
 
     def __str__(self) -> str:
         """
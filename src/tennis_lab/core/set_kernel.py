@@ -0,0 +1,97 @@
+"""
+Lightweight set 'kernel': plays a sequence of points through a set using plain integer state.
+
+It applies the same scoring rules as the 'Set' class (games, no-ad games, tiebreaks,
+super-tiebreaks and advantage sets) but keeps no history and builds no score objects,
+which makes it suitable for Monte Carlo code that only needs the outcome of a set.
+
+Functions:
+----------
+simulateSet - play a sequence of points from 0-0 and return the resulting set score
+"""
+
+from typing import Literal, Optional, Sequence
+
+from tennis_lab.core.match_format import MatchFormat, SetEnding, POINTS_TO_WIN_GAME, \
+                                         POINTS_TO_WIN_TIEBREAK, POINTS_TO_WIN_SUPERTIEBREAK
+
+def simulateSet(pointWinners: Sequence[int],
+                matchFormat : MatchFormat,
+                isFinalSet  : bool = False) -> tuple[Optional[Literal[1, 2]], int, int]:
+    """
+    Play a sequence of points through a set starting at 0-0.
+    Points recorded after the set is decided are ignored, as in 'Set.recordPoints'.
+
+    Parameters:
+    -----------
+    pointWinners - which player won each point (1 or 2); a list, an array('B') or a NumPy integer array
+    matchFormat  - describes the match format
+    isFinalSet   - whether this is the final set of the match
+
+    Returns:
+    --------
+    A tuple (winner, gamesP1, gamesP2), where 'winner' is None if the set is not over.
+    A set won in a tiebreak counts the tiebreak as a game (ex: 7-6).
+
+    Raises:
+    -------
+    ValueError - if any of the point winners is not 1 or 2
+    """
+    if not isinstance(matchFormat, MatchFormat):
+        raise ValueError(f"Invalid matchFormat: must be a MatchFormat instance.")
+
+    # unpack the format into plain locals used by the point loop
+    setLength = matchFormat.setLength
+    noAdRule  = matchFormat.noAdRule
+    ending    = matchFormat.finalSetEnding if isFinalSet else matchFormat.setEnding
+    tbToWin   = POINTS_TO_WIN_SUPERTIEBREAK if ending == SetEnding.SUPERTIEBREAK else POINTS_TO_WIN_TIEBREAK
+    hasTB     = ending != SetEnding.ADVANTAGE
+
+    # iterating over Python ints is much faster than over NumPy scalars
+    if hasattr(pointWinners, "tolist"):
+        pointWinners = pointWinners.tolist()
+
+    games1, games2   = 0, 0       # games won in the set
+    points1, points2 = 0, 0       # points won in the current game/tiebreak
+    atTiebreak       = False
+    winner: Optional[Literal[1, 2]] = None
+    gameWinner: Literal[1, 2]     # winner of the game or tiebreak just completed
+
+    for pointWinner in pointWinners:
+        if pointWinner != 1 and pointWinner != 2:
+            raise ValueError(f"Invalid pointWinner: {pointWinner}. Must be 1 or 2.")
+        if winner is not None:
+            continue
+
+        if pointWinner == 1: points1 += 1
+        else:                points2 += 1
+
+        # did the point end the game or tiebreak?
+        if atTiebreak:
+            if   points1 >= tbToWin and points1 - points2 > 1: gameWinner = 1
+            elif points2 >= tbToWin and points2 - points1 > 1: gameWinner = 2
+            else:                                              continue
+        elif noAdRule:
+            if   points1 == POINTS_TO_WIN_GAME: gameWinner = 1
+            elif points2 == POINTS_TO_WIN_GAME: gameWinner = 2
+            else:                               continue
+        else:
+            if   points1 >= POINTS_TO_WIN_GAME and points1 - points2 > 1: gameWinner = 1
+            elif points2 >= POINTS_TO_WIN_GAME and points2 - points1 > 1: gameWinner = 2
+            else:                                                         continue
+
+        if gameWinner == 1: games1 += 1
+        else:               games2 += 1
+        points1, points2 = 0, 0
+
+        # did the game end the set?
+        if atTiebreak:
+            winner = gameWinner
+        elif games1 >= setLength and games1 - games2 > 1:
+            winner = 1
+        elif games2 >= setLength and games2 - games1 > 1:
+            winner = 2
+        elif hasTB and games1 == setLength and games2 == setLength:
+            atTiebreak = True
+
+    return winner, games1, games2
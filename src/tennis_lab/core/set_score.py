@@ -1,7 +1,7 @@
 """SetScore class representing the score in a tennis set."""
 
 from copy import deepcopy
-from typing import Literal, Optional
+from typing import Literal, Optional, Sequence
 
 from tennis_lab.core.game_score     import GameScore
 from tennis_lab.core.match_format   import MatchFormat, SetEnding
@@ -10,6 +10,7 @@ from tennis_lab.core.tiebreak_score import TiebreakScore
 class SetScore:
     """
     Represents the running score of a tennis set.
+    Instances use __slots__, which keeps the many copies made while enumerating set paths small.
 
     Attributes:
     -----------
@@ -59,6 +60,8 @@ class SetScore:
         Returns the score in "X-Y" format from Player 1's perspective.
     """
 
+    __slots__ = ('_gamesP1', '_gamesP2', '_isFinalSet', '_matchFormat', 'currGameScore', 'tiebreakScore')
+
     def __init__(self,
                  gamesP1      : int,
                  gamesP2      : int,
@@ -279,6 +282,45 @@ class SetScore:
         return SetScore(self.gamesPlayer1+1, self.gamesPlayer2,   self._isFinalSet, self._matchFormat), \
                SetScore(self.gamesPlayer1,   self.gamesPlayer2+1, self._isFinalSet, self._matchFormat)
 
+    def asDict(self) -> dict:
+        """
+        Plain dictionary describing this score, from which 'fromDict' recreates it.
+        The current game/tiebreak scores are stored as (pointsP1, pointsP2) tuples, or None.
+        """
+        return {"gamesP1"      : self.gamesPlayer1,
+                "gamesP2"      : self.gamesPlayer2,
+                "isFinalSet"   : self._isFinalSet,
+                "matchFormat"  : self._matchFormat.asDict(),
+                "gameScore"    : self.currGameScore.asPoints(1) if self.currGameScore else None,
+                "tiebreakScore": self.tiebreakScore.asPoints(1) if self.tiebreakScore else None}
+
+    @classmethod
+    def fromDict(cls, d: dict) -> "SetScore":
+        """
+        Recreate a score from the dictionary produced by 'asDict'.
+
+        Raises:
+        -------
+        ValueError - if the dictionary does not describe a valid score
+        """
+        try:
+            matchFormat   = MatchFormat.fromDict(d["matchFormat"])
+            gameScore     = d["gameScore"]
+            tiebreakScore = d["tiebreakScore"]
+            gamesP1, gamesP2, isFinalSet = d["gamesP1"], d["gamesP2"], d["isFinalSet"]
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Invalid SetScore dictionary: {d}") from e
+
+        if gameScore is not None:
+            pointsP1, pointsP2 = gameScore
+            gameScore = GameScore(pointsP1, pointsP2, matchFormat)
+        if tiebreakScore is not None:
+            pointsP1, pointsP2 = tiebreakScore
+            ending        = matchFormat.finalSetEnding if isFinalSet else matchFormat.setEnding
+            isSuper       = ending == SetEnding.SUPERTIEBREAK
+            tiebreakScore = TiebreakScore(pointsP1, pointsP2, isSuper=isSuper, matchFormat=matchFormat)
+        return cls(gamesP1, gamesP2, isFinalSet, matchFormat, gameScore=gameScore, tiebreakScore=tiebreakScore)
+
     def recordPoint(self, pointWinner: Literal[1, 2]):
         """
         Update the score with the result of the next point.
@@ -312,6 +354,54 @@ class SetScore:
             if self.tiebreakScore.isFinal:
                 self._recordTiebreak(self.tiebreakScore.winner)
 
+    def recordPoints(self, pointWinners: Sequence[Literal[1, 2]]):
+        """
+        Update the score with the result of multiple points.
+        Equivalent to calling 'recordPoint' for each point, but all point winners are
+        validated up front and whether the set is over is only re-checked when a game ends.
+
+        Parameters:
+        -----------
+        pointWinners - which player won each point (1 or 2); any iterable, including an array('B') or a NumPy integer array
+
+        Raises:
+        -------
+        ValueError - if any pointWinner is not 1 or 2, or if a point is recorded after the set is over
+        """
+        # materialize the points once: they are iterated twice (validation, then recording)
+        if hasattr(pointWinners, "tolist"):
+            pointWinners = pointWinners.tolist()
+        else:
+            pointWinners = list(pointWinners)
+        for pointWinner in pointWinners:
+            if pointWinner not in (1, 2):
+                raise ValueError(f"Invalid pointWinner: {pointWinner}. Must be 1 or 2.")
+        if self.currGameScore is not None and self.tiebreakScore is not None:
+            raise RuntimeError("Invalid state: either playing a game or a tiebreak.")
+
+        isOver = self.isFinal
+        for pointWinner in pointWinners:
+            if isOver:
+                raise ValueError("Cannot record point: set is already over.")
+
+            if self.currGameScore is not None:
+                gameScore = self.currGameScore
+                gameScore.recordPoint(pointWinner)
+                if gameScore.isFinal:
+                    gameWinner = gameScore.winner
+                    assert gameWinner is not None           # a final game has a winner
+                    self._recordGame(gameWinner)
+                    isOver = self.isFinal
+            else:
+                tiebreakScore = self.tiebreakScore
+                assert tiebreakScore is not None            # the set is not over, so a tiebreak is in progress
+                tiebreakScore.recordPoint(pointWinner)
+                if tiebreakScore.isFinal:
+                    tiebreakWinner = tiebreakScore.winner
+                    assert tiebreakWinner is not None       # a final tiebreak has a winner
+                    self._recordTiebreak(tiebreakWinner)
+                    isOver = True
+
     def _recordGame(self, gameWinner: Literal[1, 2]):
         """
         Update the score with the result of the current game.
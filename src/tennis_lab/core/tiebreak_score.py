@@ -6,6 +6,7 @@ from tennis_lab.core.match_format import MatchFormat, POINTS_TO_WIN_TIEBREAK, PO
 class TiebreakScore:
     """
     Represents the running score of a tiebreak or super-tiebreak.
+    Instances use __slots__, so attributes outside the fixed set listed there cannot be added.
 
     Attributes:
     -----------
@@ -40,6 +41,8 @@ class TiebreakScore:
         Returns the score in "X-Y" format from Player 1's perspective.
     """
 
+    __slots__ = ('_currPointsP1', '_currPointsP2', '_isSuper', '_matchFormat', '_capPoints')
+
     def __init__(self, pointsP1: int, pointsP2: int, isSuper: bool, matchFormat: Optional[MatchFormat] = None):
         """
         Initialize the score to an arbitrary (but valid) initial value.
@@ -4,10 +4,13 @@ Functions for Monte Carlo simulation of a tennis match.
 Functions:
 ----------
 probabilityP1WinsMatch - probability that Player1 wins the match from a given score
+simulateMatchWinners   - winners of a batch of simulated matches
 """
 
 import random
-from   typing import Literal
+from   concurrent.futures import ProcessPoolExecutor
+from   copy               import deepcopy
+from   typing             import Callable, Iterator, Literal, Optional
 
 import numpy as np
 import numpy.typing as npt
@@ -17,6 +20,20 @@ from tennis_lab.core.match_format import MatchFormat
 from tennis_lab.core.match_score  import MatchScore
 from tennis_lab.paths.match_probability import probabilityP1WinsMatch as probabilityP1WinsMatchAnalytic
 
+# Memoized analytic match probabilities, keyed on (score, server, probWinPointP1, probWinPointP2).
+# Simulated matches revisit the same scores (every match starts at 0-0, deuces repeat, etc.)
+# and the 'static' probabilities always use the same priors, so most lookups are hits.
+_probP1WinsMatchCache: dict[tuple, float] = {}
+_PROB_CACHE_MAX_SIZE = 100_000
+
+# Number of uniform random numbers drawn from a NumPy Generator at a time, per set in the match:
+# enough for most sets (up to 13 games of 8 points); more are drawn if a match runs longer.
+_UNIFORMS_PER_SET = 13 * 8
+
+# Smallest batch of matches that 'simulateMatchWinners' splits across worker processes:
+# below this, starting the workers costs more than simulating the matches serially.
+_PARALLEL_MIN_SIMS = 2_000
+
 def probabilityP1WinsMatch(initScore    : MatchScore,
                            playerServing: Literal[1, 2],
                            probWinPoint1: float,
@@ -62,11 +79,88 @@ def probabilityP1WinsMatch(initScore    : MatchScore,
             numWins += 1
     return numWins / numSims
 
+def simulateMatchWinners(matchFormat: MatchFormat,
+                         P1actual   : float,
+                         P2actual   : float,
+                         numSims    : int,
+                         seed       : Optional[int] = None,
+                         numWorkers : int = 1) -> npt.NDArray[np.int8]:
+    """
+    Simulates playing multiple full matches from 0-0 and returns the winner of each one.
+
+    Use this instead of calling 'simulateMatchWinProbabilityEvolution' repeatedly when only
+    the match outcomes are needed: the outcome of a match depends only on the true point
+    probabilities, so no match-winning probabilities are calculated along the way.
+
+    Parameters:
+    -----------
+    matchFormat - the match format
+    P1actual    - the true probability that Player1 wins a point when serving
+    P2actual    - the true probability that Player2 wins a point when serving
+    numSims     - number of matches to simulate
+    seed        - seed for the random number generator (None for a non-reproducible batch)
+    numWorkers  - number of processes to simulate the matches in; batches smaller than
+                  _PARALLEL_MIN_SIMS are always simulated in the calling process
+
+    Returns:
+    --------
+    An int8 array with the winner (1 or 2) of each simulated match.
+    The i-th match draws from its own substream of a single PCG64 stream, obtained by jumping
+    ahead 'i' times; its outcome therefore only depends on 'seed' and 'i', not on 'numSims',
+    'numWorkers' or on the order in which the matches are played.
+
+    Raises:
+    -------
+    ValueError - if any of the inputs are invalid
+    """
+    if not isinstance(matchFormat, MatchFormat):
+        raise ValueError(f"Invalid matchFormat: must be a MatchFormat instance.")
+    if not (0 <= P1actual <= 1):
+        raise ValueError(f"Invalid P1actual: {P1actual}. Must be between 0 and 1.")
+    if not (0 <= P2actual <= 1):
+        raise ValueError(f"Invalid P2actual: {P2actual}. Must be between 0 and 1.")
+    if not isinstance(numSims, int) or numSims <= 0:
+        raise ValueError(f"Invalid numSims: {numSims}. Must be a positive integer.")
+    if not isinstance(numWorkers, int) or numWorkers <= 0:
+        raise ValueError(f"Invalid numWorkers: {numWorkers}. Must be a positive integer.")
+
+    bitGenerator = np.random.PCG64(seed)
+    if numWorkers == 1 or numSims < _PARALLEL_MIN_SIMS:
+        return _simulateMatchWinnersRange(matchFormat, P1actual, P2actual, bitGenerator, 0, numSims)
+
+    # The matches are independent, so each worker simulates a contiguous range of them.
+    # Every worker receives the same bit generator and jumps it to each match's substream,
+    # so the winners are the same as when simulating serially.
+    bounds = np.linspace(0, numSims, numWorkers + 1).astype(int)
+    with ProcessPoolExecutor(max_workers=numWorkers) as executor:
+        chunks = executor.map(_simulateMatchWinnersRange,
+                              [matchFormat] * numWorkers, [P1actual] * numWorkers, [P2actual] * numWorkers,
+                              [bitGenerator] * numWorkers, bounds[:-1], bounds[1:])
+        return np.concatenate(list(chunks))
+
+def _simulateMatchWinnersRange(matchFormat : MatchFormat,
+                               P1actual    : float,
+                               P2actual    : float,
+                               bitGenerator: np.random.PCG64,
+                               start       : int,
+                               stop        : int) -> npt.NDArray[np.int8]:
+    """
+    Simulates the matches with indices in [start, stop) of a 'simulateMatchWinners' batch,
+    the i-th one drawing from the substream obtained by jumping 'bitGenerator' ahead 'i' times.
+    Returns an int8 array with the winner (1 or 2) of each match.
+    """
+    winners = np.empty(stop - start, dtype=np.int8)
+    for i in range(start, stop):
+        rng                = np.random.Generator(bitGenerator.jumped(i))
+        winners[i - start] = _simulateMatchWinner(matchFormat, P1actual, P2actual, _uniformStream(rng, matchFormat))
+    return winners
+
 def simulateMatchWinProbabilityEvolution(matchFormat: MatchFormat,
                                          P1actual   : float, 
                                          P2actual   : float,
                                          P1prior    : float, alpha1: float,
-                                         P2prior    : float, alpha2: float) \
+                                         P2prior    : float, alpha2: float,
+                                         rng        : Optional[np.random.Generator] = None) \
         -> tuple[npt.NDArray[np.floating], npt.NDArray[np.floating],
                  npt.NDArray[np.floating], npt.NDArray[np.floating]]:
     """
@@ -107,6 +201,8 @@ def simulateMatchWinProbabilityEvolution(matchFormat: MatchFormat,
     alpha1      - the width of the Beta distribution describing the prior for P1actual
     P2prior     - the mode  of the Beta distribution describing the prior for P2actual
     alpha2      - the width of the Beta distribution describing the prior for P2actual
+    rng         - NumPy random generator used to simulate the points; if None (default) the points
+                  are simulated with the 'random' module, so that 'random.seed' makes the result reproducible
 
     Returns:
     --------
@@ -127,11 +223,20 @@ def simulateMatchWinProbabilityEvolution(matchFormat: MatchFormat,
     beta1 = ((1 - P1prior) * alpha1 + 2 * P1prior - 1) / P1prior
     beta2 = ((1 - P2prior) * alpha2 + 2 * P2prior - 1) / P2prior
 
+    # The Beta prior is conjugate to the (Bernoulli) serve outcomes: after 'y' points won out of 'n'
+    # served the posterior is Beta(alpha + y, beta + n - y). We therefore only keep two running
+    # counters per player, and the posterior mode (a - 1) / (a + b - 2) costs one division per point.
+    a1, b1 = alpha1, beta1
+    a2, b2 = alpha2, beta2
+
     # since we haven't observed any data,
     # the posterior is equal to the prior
     P1postr = P1prior
     P2postr = P2prior
 
+    # source of the uniform random numbers deciding each point
+    uniform = random.random if rng is None else _uniformStream(rng, matchFormat)
+
     # create a new object representing a tennis match;
     # it is initialized with a score of 0-0
     # which player serves first is irrelevant
@@ -140,8 +245,8 @@ def simulateMatchWinProbabilityEvolution(matchFormat: MatchFormat,
     # these two arrays store the probability that Player1 wins the match, 
     # calculated for each point in the match.
     # we add here the first entry: the probability the Player1 wins the match at 0-0
-    probWinsMatchStatic  = [probabilityP1WinsMatchAnalytic(match.score, 1, [P1prior], P2prior)[0]]
-    probWinsMatchDynamic = [probabilityP1WinsMatchAnalytic(match.score, 1, [P1postr], P2postr)[0]]
+    probWinsMatchStatic  = [_probabilityP1WinsMatchAt(match.score, 1, P1prior, P2prior)]
+    probWinsMatchDynamic = [_probabilityP1WinsMatchAt(match.score, 1, P1postr, P2postr)]
 
     # these two arrays store the most recent Bayesian update for the probability that a player wins on serve
     P1updated = [P1prior]
@@ -154,7 +259,7 @@ def simulateMatchWinProbabilityEvolution(matchFormat: MatchFormat,
         # this is done using the 'true' probability values
         server = match.servesNext
         p = P1actual if server == 1 else P2actual
-        serverWonPoint = True if random.random() < p else False
+        serverWonPoint = True if uniform() < p else False
         p1Won = ((server == 1) and serverWonPoint) or \
                 ((server == 2) and not serverWonPoint)
         match.recordPoint(1 if p1Won else 2)
@@ -163,26 +268,22 @@ def simulateMatchWinProbabilityEvolution(matchFormat: MatchFormat,
 
         # calculate the new probability of Player1 winning the match
         # this is the 'static' calculation based on frozen initial estimates for P1actual and P2actual
-        pStatic = probabilityP1WinsMatchAnalytic(match.score, match.servesNext, [P1prior], P2prior)[0]
+        pStatic = _probabilityP1WinsMatchAt(match.score, match.servesNext, P1prior, P2prior)
         probWinsMatchStatic.append(pStatic)
 
-        # update the posterior distribution
+        # update the posterior distribution of the server
         if server == 1:
-            if p1Won:
-                alpha1 += 1
-            else:
-                beta1 += 1
-            P1postr = (alpha1 - 1) / (alpha1 + beta1 - 2)
+            if serverWonPoint: a1 += 1
+            else:              b1 += 1
+            P1postr = (a1 - 1) / (a1 + b1 - 2)
         else:
-            if p1Won:
-                beta2 += 1
-            else:
-                alpha2 += 1
-            P2postr = (alpha2 - 1) / (alpha2 + beta2 - 2)
+            if serverWonPoint: a2 += 1
+            else:              b2 += 1
+            P2postr = (a2 - 1) / (a2 + b2 - 2)
 
         # calculate the new probability of Player1 winning the match
         # this is the 'dynamic' calculation based on updated estimates for P1actual and P2actual
-        pDynamic = probabilityP1WinsMatchAnalytic(match.score, match.servesNext, [P1postr], P2postr)[0]
+        pDynamic = _probabilityP1WinsMatchAt(match.score, match.servesNext, P1postr, P2postr)
         probWinsMatchDynamic.append(pDynamic)
 
         # remember the history of posterior updates
@@ -193,4 +294,54 @@ def simulateMatchWinProbabilityEvolution(matchFormat: MatchFormat,
     probWinsMatchStatic.append (1 if match.winner == 1 else 0)
     probWinsMatchDynamic.append(1 if match.winner == 1 else 0)
 
-    return np.array(probWinsMatchStatic), np.array(probWinsMatchDynamic), np.array(P1updated), np.array(P2updated)
\ No newline at end of file
+    return np.array(probWinsMatchStatic), np.array(probWinsMatchDynamic), np.array(P1updated), np.array(P2updated)
+
+def _simulateMatchWinner(matchFormat: MatchFormat,
+                         P1actual   : float,
+                         P2actual   : float,
+                         uniform    : Callable[[], float]) -> Literal[1, 2]:
+    """
+    Plays a full match from 0-0 (Player1 serving first) and returns its winner.
+    'uniform' returns the next uniform random number in [0, 1), used to decide each point.
+    """
+    match = Match(playerServing=1, matchFormat=matchFormat)
+    while not match.isOver:
+        server = match.servesNext
+        p      = P1actual if server == 1 else P2actual
+        receiver: Literal[1, 2] = 2 if server == 1 else 1
+        match.recordPoint(server if uniform() < p else receiver)
+    winner = match.winner
+    assert winner is not None       # the match is over
+    return winner
+
+def _uniformStream(rng: np.random.Generator, matchFormat: MatchFormat) -> Callable[[], float]:
+    """
+    Returns a function producing the uniform random numbers drawn by 'rng', one per call.
+    The numbers are drawn in buffers sized for a typical match, instead of one 'rng.random()'
+    call (and NumPy scalar) per point.
+    """
+    bufferSize = _UNIFORMS_PER_SET * (matchFormat.bestOfSets or 1)
+    def uniforms() -> Iterator[float]:
+        while True:
+            yield from rng.random(bufferSize).tolist()
+    return uniforms().__next__
+
+def _probabilityP1WinsMatchAt(score         : MatchScore,
+                              playerServing : Literal[1, 2],
+                              probWinPointP1: float,
+                              probWinPointP2: float) -> float:
+    """
+    Memoized analytic probability that Player1 wins the match from a given score.
+    The score is snapshotted before being used as a cache key, since the caller keeps mutating it.
+    """
+    key = (score, playerServing, probWinPointP1, probWinPointP2)
+    try:
+        return _probP1WinsMatchCache[key]
+    except KeyError:
+        pass
+
+    prob = float(probabilityP1WinsMatchAnalytic(score, playerServing, [probWinPointP1], probWinPointP2)[0])
+    if len(_probP1WinsMatchCache) >= _PROB_CACHE_MAX_SIZE:
+        _probP1WinsMatchCache.clear()
+    _probP1WinsMatchCache[(deepcopy(score), playerServing, probWinPointP1, probWinPointP2)] = prob
+    return prob
\ No newline at end of file
@@ -5,10 +5,10 @@ from .tiebreak_path import TiebreakPath
 from .set_path import SetPath
 from .match_path import MatchPath
 
-from .game_probability import probabilityServerWinsGame
+from .game_probability import probabilityServerWinsGame, probabilityServerWinsGameArray
 from .tiebreak_probability import probabilityP1WinsTiebreak
 from .set_probability import probabilityP1WinsSet
-from .match_probability import probabilityP1WinsMatch
+from .match_probability import probabilityP1WinsMatch, probabilityP1WinsMatchGrid
 
 __all__ = [
     # Path classes
@@ -18,7 +18,9 @@ __all__ = [
     "MatchPath",
     # Probability functions
     "probabilityServerWinsGame",
+    "probabilityServerWinsGameArray",
     "probabilityP1WinsTiebreak",
     "probabilityP1WinsSet",
     "probabilityP1WinsMatch",
+    "probabilityP1WinsMatchGrid",
 ]
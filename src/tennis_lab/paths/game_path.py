@@ -1,8 +1,11 @@
 """GamePath class representing possible score progressions in a tennis game."""
 
 from __future__ import annotations
-from copy import deepcopy
-from tennis_lab.core.game_score import GameScore
+from functools import lru_cache
+from typing    import Literal, Optional
+
+from tennis_lab.core.game_score   import GameScore
+from tennis_lab.core.match_format import MatchFormat
 
 class GamePath:
     """
@@ -11,8 +14,12 @@ class GamePath:
 
     Attributes:
     -----------
-    scoreHistory: list[GameScore]
+    scoreHistory: tuple[GameScore, ...]
        The score history of the game.
+    finalWinner: Optional[Literal[1, 2]]
+       Which player won the game at the end of the path (None if the path ends at deuce, or mid-game).
+    finalPoints: tuple[int, int]
+       The score at the end of the path, as points won by each player (from Player1's point of view).
 
     Methods:
     --------
@@ -40,95 +47,138 @@ class GamePath:
         """
         if not isinstance(initialScore, GameScore):
             raise ValueError(f"Invalid initialScore: must be a GameScore instance.")
-        self._scores: list[GameScore] = [initialScore]
+        self._scores: tuple[GameScore, ...] = (initialScore,)
 
     @property
-    def scoreHistory(self) -> list[GameScore]:
+    def scoreHistory(self) -> tuple[GameScore, ...]:
         """
         The score history of the game.
         """
         return self._scores
 
+    @property
+    def finalWinner(self) -> Optional[Literal[1, 2]]:
+        """
+        Which player won the game at the end of the path (None if the path ends before the game is over).
+        """
+        return self._scores[-1].winner
+
+    @property
+    def finalPoints(self) -> tuple[int, int]:
+        """
+        The score at the end of the path, as points won by each player (from Player1's point of view).
+        """
+        return self._scores[-1].asPoints(pov=1)
+
     def increment(self) -> tuple["GamePath", "GamePath"] | "GamePath":
         """
         Extend the current path by one point, a win for either Player1 or Player2.
-        This process creates two new paths.
+        This process creates two new paths, which share the scores of this path (the scores
+        are never modified by a path; each new path only adds its own final score).
 
         Returns:
         --------
-        Two new paths if the game is not over, copy of self otherwise.
+        Two new paths if the game is not over, copy of self otherwise (sharing its scores).
         """
         lastScore = self._scores[-1]
 
         # the game is over, we cannot increment this path
         if lastScore.isFinal:
-            return deepcopy(self)
+            path = GamePath.__new__(GamePath)
+            path._scores = self._scores
+            return path
 
-        # calculate the next possible two scores
+        # calculate the next possible two scores (the game is not over, so there are two)
         nextScores = lastScore.nextScores()
+        assert nextScores is not None
 
         # create two new paths, one for each possible outcome of the next point
-        path1 = deepcopy(self); path1._scores.append(nextScores[0])
-        path2 = deepcopy(self); path2._scores.append(nextScores[1])
+        return self._extended(nextScores[0]), self._extended(nextScores[1])
 
-        return path1, path2
+    def _extended(self, score: GameScore) -> "GamePath":
+        """
+        Helper method, creating a new path made of this path's scores followed by the given score.
+        The score tuple is concatenated rather than deep-copied, so the two paths share their prefix.
+        """
+        path = GamePath.__new__(GamePath)
+        path._scores = self._scores + (score,)
+        return path
 
     @staticmethod
     def generateAllPaths(initialScore: GameScore) -> list["GamePath"]:
         """
         Factory method generating all possible score paths that start from a given initial score.
 
+        The paths only depend on the initial points and on the match format, so their point
+        sequences are generated once per such combination and cached. Every call still returns
+        new GamePath instances, holding new GameScore objects after 'initialScore'. As with paths
+        created by 'increment', the paths returned by one call share the GameScore object of each
+        score they have in common (one object per distinct score); separate calls share none.
+
         Parameters:
         -----------
         initialScore - the starting score for all paths
+
+        Raises:
+        -------
+        ValueError - if initialScore is not a GameScore instance
         """
-        seedPath = GamePath(initialScore)
-        return GamePath._extendPaths([seedPath])
+        if not isinstance(initialScore, GameScore):
+            raise ValueError(f"Invalid initialScore: must be a GameScore instance.")
 
+        matchFormat = initialScore._matchFormat
+        initPoints  = initialScore.asPoints(pov=1)
+
+        # build one GameScore per distinct score reached by the paths (a game has only a few dozen)
+        scores = {initPoints: initialScore}
+        paths  = []
+        for pointsHistory in GamePath._generateAllPointPaths(initPoints, matchFormat):
+            for points in pointsHistory:
+                if points not in scores:
+                    scores[points] = GameScore(points[0], points[1], matchFormat)
+            path = GamePath(initialScore)
+            path._scores = tuple(scores[points] for points in pointsHistory)
+            paths.append(path)
+        return paths
 
     @staticmethod
-    def _extendPaths(paths: list["GamePath"]) -> list["GamePath"]:
-        """
-        Helper method, used to extend each given score path until the game is over, or it reaches deuce.
+    @lru_cache(maxsize=None)
+    def _generateAllPointPaths(points: tuple[int, int], matchFormat: MatchFormat) -> tuple[tuple[tuple[int, int], ...], ...]:
         """
-        # attempt to extend each given path by one point
-        pathsIncremented = GamePath._incrementPaths(paths)
-
-        # we are done when no input path can be incremented further
-        doneExtending = len(pathsIncremented) == len(paths)
+        Helper method, generating (and caching) all score paths starting from a given score.
+        Each path is stored as an immutable snapshot: the sequence of its scores as (P1, P2) points.
 
-        # if we're not done, attempt to increment the paths again
-        return paths if doneExtending else GamePath._extendPaths(pathsIncremented)
-
-    @staticmethod
-    def _incrementPaths(paths: list["GamePath"]) -> list["GamePath"]:
-        """
-        Helper method, used to increment each given path by one point, using 'self.increment()'.
-        
-        It imposes a cutoff: paths for which the current score is a deuce (when playing using
-        standard 'advantage' rules) are not incremented, they are returned unmodified. 
-        This implies that the length of the output list equals the length of the input list iff 
-        none of the given paths can be incremented.        
-        """
-        pathsIncremented = []   # stores incremented paths
-        for path in paths:
-            lastScore = path._scores[-1]
-
-            # we don't increment a path which reached 'deuce' (unless the game is played w/o adds)
-            isDeuce         = lastScore.isDeuce
-            standardScoring = not lastScore._matchFormat.noAdRule
-            if isDeuce and standardScoring:
-                pathsIncremented.append(deepcopy(path))
+        The paths are extended with an explicit stack (depth-first, Player1 winning the point first),
+        which yields them in the same order as extending all paths one point at a time.
+        """
+        paths = []
+        stack: list[tuple[tuple[int, int], ...]] = [(points,)]
+        while stack:
+            pointsHistory = stack.pop()
+            nextPoints    = GamePath._nextPoints(pointsHistory[-1], matchFormat)
+            if nextPoints is None:
+                paths.append(pointsHistory)
                 continue
+            stack.append(pointsHistory + (nextPoints[1],))   # pushed first, so popped last
+            stack.append(pointsHistory + (nextPoints[0],))
+        return tuple(paths)
 
-            # increment the score unless the score is final
-            if not lastScore.isFinal:
-                pathsNew = path.increment()
-                pathsIncremented.extend(pathsNew)
-            else:
-                pathsIncremented.append(deepcopy(path))
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _nextPoints(points: tuple[int, int], matchFormat: MatchFormat) -> tuple[tuple[int, int], tuple[int, int]] | None:
+        """
+        Helper method, returning the scores (as points) reached if Player1 or Player2 wins the next point.
 
-        return pathsIncremented
+        It imposes a cutoff, returning None when a path ending at this score is not extended further:
+        the game is over, or the score is a deuce (when playing using standard 'advantage' rules).
+        """
+        score = GameScore(points[0], points[1], matchFormat)
+        if score.isFinal or (score.isDeuce and not matchFormat.noAdRule):
+            return None
+        nextScores = score.nextScores()
+        assert nextScores is not None
+        nextScoreP1, nextScoreP2 = nextScores
+        return nextScoreP1.asPoints(pov=1), nextScoreP2.asPoints(pov=1)
 
     def __str__(self) -> str:
         """
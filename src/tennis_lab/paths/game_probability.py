@@ -3,17 +3,22 @@ Functions for calculating game-level probabilities in tennis.
 
 Functions:
 ----------
-pathProbability           - probability that a given score path occurs during a game
-probabilityServerWinsGame - probability that the server wins the game from a given score
-loadCachedFunction        - loads a cached version of probabilityServerWinsGame
+pathProbability                - probability that a given score path occurs during a game
+probabilityServerWinsGame      - probability that the server wins the game from a given score
+probabilityServerWinsGameArray - probabilityServerWinsGame, vectorized over point-winning probabilities
+loadCachedFunction             - loads a cached version of probabilityServerWinsGame
 """
 
-import os, pickle
-from copy import deepcopy
+import numpy as np
+import numpy.typing as npt
+import os
+from copy      import deepcopy
+from functools import lru_cache
 
 from typing import Callable, Literal, Optional
 from tennis_lab.paths.game_path import GamePath
 from tennis_lab.core.game_score import GameScore
+from tennis_lab.core.match_format import POINTS_TO_WIN_GAME
 
 def pathProbability(path         : GamePath,
                     playerServing: Literal[1,2],
@@ -39,18 +44,15 @@ def pathProbability(path         : GamePath,
     if not isinstance(probWinPoint, (int, float)) or not (0 <= probWinPoint <= 1):
         raise ValueError("probWinPoint must be a number between 0 and 1")
 
-    probPath = 1.0
-    scores = path.scoreHistory        # the scores that make up the path
-    for i in range(1, len(scores)):   # loop over score *changes*
+    # Every score change is a point won by one of the players, so the path probability
+    # is p^wins * (1-p)^losses. The serving player won the point if their score went up,
+    # or if the receiver's score went down (a capped score going from 'ad out' back to deuce).
+    points = [score.asPoints(pov=playerServing) for score in path.scoreHistory]
+    wins   = sum(1 for (servPrev, recvPrev), (servCurr, recvCurr) in zip(points, points[1:])
+                 if servCurr > servPrev or recvCurr < recvPrev)
+    losses = len(points) - 1 - wins
 
-        pointsServerCurr = scores[i  ].asPoints(pov=playerServing)[0]   # serving player # points now
-        pointsServerPrev = scores[i-1].asPoints(pov=playerServing)[0]   # serving player # points previously
-        serverWonPoint   = pointsServerCurr > pointsServerPrev          # did serving player win the point ?
-
-        # multiply probs of score changes
-        probPath *= probWinPoint if serverWonPoint else (1-probWinPoint)
-
-    return probPath
+    return probWinPoint**wins * (1-probWinPoint)**losses
 
 def probabilityServerWinsGame(initScore     : GameScore,
                               playerServing : Literal[1, 2],
@@ -58,17 +60,16 @@ def probabilityServerWinsGame(initScore     : GameScore,
     """
     Calculates the probability that the player serving wins the game from a given score.
 
-    This probability is calculated the following way:
-      + generate all possible game score paths starting from the given initial score
-      + calculate the probability the serving player wins the game along each of these paths
-      + sum up all these probabilities
+    This probability is calculated by backward induction on the score lattice: the probability
+    of winning from a score is p times the probability of winning from the score reached if the
+    server wins the next point, plus (1-p) times the one reached if the receiver wins it. This
+    sums the probabilities of all score paths without enumerating them one by one.
     The calculation takes as input the probability that the player serving wins a point.
 
     NOTE:
-    We don't actually generate *all* possible score paths, as - when playing using standard
-    advantage rules - there is an infinite number of them. Path generation ends at deuce.
-    For paths ending in deuce, we use a closed-form formula for the probability  of winning
-    from deuce:
+    When playing using standard advantage rules there is an infinite number of score paths,
+    as deuce can repeat forever. The induction therefore stops at deuce, where we use a
+    closed-form formula for the probability of winning from deuce:
                       p^2 / (1 - 2*p*(1-p))
     where p is the probability of winning a point on serve. This formula is derived from the
     geometric series of deuce repetitions. For more details see:
@@ -89,47 +90,118 @@ def probabilityServerWinsGame(initScore     : GameScore,
     if not isinstance(probWinPoint, (int, float)) or not (0 <= probWinPoint <= 1):
         raise ValueError("probWinPoint must be a number between 0 and 1")
 
-    # generate all possible game paths starting from the initial score
-    allPaths = GamePath.generateAllPaths(initScore)
+    # a game that is already decided
+    if initScore.isFinal:
+        return 1.0 if initScore.winner == playerServing else 0.0
 
-    # add up the probability of winning the game in each path
-    probWinGame = 0.0
-    for path in allPaths:
+    # Cap the score to normalize deuces & advantages (e.g., 5-5 → 3-3, 5-4 → 4-3)
+    cappedScore = deepcopy(initScore)
+    cappedScore._cap_score()
 
-        # the probability of this path occurring
-        probPath = pathProbability(path, playerServing, probWinPoint)
+    pointsServ, pointsRecv = cappedScore.asPoints(pov=playerServing)
+    return _probFromScore(pointsServ, pointsRecv, float(probWinPoint), initScore._noAdRule)
 
-        # how did this path end ?
-        lastScore = path.scoreHistory[-1]
-        winner    = lastScore.winner
-        deuce     = lastScore.isDeuce
+def probabilityServerWinsGameArray(initScore    : GameScore,
+                                   playerServing: Literal[1, 2],
+                                   probWinPoint : npt.ArrayLike) -> npt.NDArray[np.floating]:
+    """
+    Vectorized version of 'probabilityServerWinsGame()': calculates the probability that
+    the player serving wins the game from a given score, for an array of point-winning
+    probabilities at once. The backward induction on the score lattice is evaluated with
+    element-wise NumPy operations, instead of one Python call per probability.
+
+    Parameters:
+    -----------
+    initScore     - the initial score in the game
+    playerServing - which player is serving this game (1 or 2)
+    probWinPoint  - array of probabilities that the player serving wins a point
 
-        # the probability the serving player wins when reaching the end of this path is:
-        #  1 if the path ends with the serving player winning the game
-        #  0 if the path ends with the serving player losing the game
-        #  p**2/(1-2*p*(1-p)) if this path ends in a deuce (this formula is proved elsewhere)
-        if deuce:
-            probWinFromDeuce = probWinPoint**2 / (1-2*probWinPoint*(1-probWinPoint))
-            probWinPath      = probPath * probWinFromDeuce
-        else:
-            serverWon   = (winner == playerServing)
-            probWinPath = probPath * (1.0 if serverWon else 0.0)
+    Returns:
+    --------
+    An array of probabilities that the player serving wins the game, one for each value in probWinPoint.
+    """
+    if not isinstance(initScore, GameScore):
+        raise ValueError("initScore must be a GameScore instance")
+    if not isinstance(playerServing, int) or playerServing not in [1, 2]:
+        raise ValueError("playerServing must be 1 or 2")
+    p = np.asarray(probWinPoint, dtype=float)
+    if not np.all((0 <= p) & (p <= 1)):
+        raise ValueError("all probWinPoint must be numbers between 0 and 1")
 
-        probWinGame += probWinPath
+    # a game that is already decided
+    if initScore.isFinal:
+        return np.full(p.shape, 1.0 if initScore.winner == playerServing else 0.0)
 
-    return probWinGame
+    # Cap the score to normalize deuces & advantages (e.g., 5-5 → 3-3, 5-4 → 4-3)
+    cappedScore = deepcopy(initScore)
+    cappedScore._cap_score()
+    pointsServ, pointsRecv = cappedScore.asPoints(pov=playerServing)
+
+    noAdRule = initScore._noAdRule
+    margin   = 1 if noAdRule else 2
+    q        = 1 - p
+    deuce    = p.copy() if noAdRule else p**2 / (1 - 2*p*q)     # a copy, not to hand back the caller's array
+
+    # backward induction on the lattice, each score evaluated once for the whole array
+    values = {}
+    def value(s: int, r: int) -> npt.NDArray[np.floating]:
+        if (s, r) not in values:
+            if s >= POINTS_TO_WIN_GAME and s - r >= margin:
+                values[s, r] = np.ones_like(p)
+            elif r >= POINTS_TO_WIN_GAME and r - s >= margin:
+                values[s, r] = np.zeros_like(p)
+            elif s == r >= POINTS_TO_WIN_GAME - 1:
+                values[s, r] = deuce
+            else:
+                values[s, r] = p * value(s+1, r) + q * value(s, r+1)
+        return values[s, r]
+
+    return value(pointsServ, pointsRecv)
+
+@lru_cache(maxsize=65536)
+def _probFromScore(pointsServ  : int,
+                   pointsRecv  : int,
+                   probWinPoint: float,
+                   noAdRule    : bool) -> float:
+    """
+    Probability that the server wins the game from a given (capped) score, by backward
+    induction on the score lattice: p * P(server wins next point) + (1-p) * P(receiver does).
+    At deuce we use the closed-form formula p^2 / (1 - 2*p*(1-p)), or simply p under 'no ad'
+    scoring, where the next point decides the game.
+
+    Parameters:
+    -----------
+    pointsServ   - number of points won by the server (capped score)
+    pointsRecv   - number of points won by the receiver (capped score)
+    probWinPoint - probability that the player serving wins a point
+    noAdRule     - whether the game is played using 'no ad' scoring
+
+    Returns:
+    --------
+    The probability that the player serving wins the game from the given score.
+    """
+    margin = 1 if noAdRule else 2
+    if pointsServ >= POINTS_TO_WIN_GAME and pointsServ - pointsRecv >= margin:
+        return 1.0
+    if pointsRecv >= POINTS_TO_WIN_GAME and pointsRecv - pointsServ >= margin:
+        return 0.0
+    if pointsServ == pointsRecv >= POINTS_TO_WIN_GAME - 1:
+        if noAdRule:
+            return probWinPoint
+        return probWinPoint**2 / (1 - 2*probWinPoint*(1-probWinPoint))
+
+    return probWinPoint     * _probFromScore(pointsServ+1, pointsRecv, probWinPoint, noAdRule) + \
+           (1-probWinPoint) * _probFromScore(pointsServ, pointsRecv+1, probWinPoint, noAdRule)
 
 def loadCachedFunction(initScore    : GameScore,
                        playerServing: Literal[1, 2])-> Optional[Callable[[float], float]]:
     """
     Loads a cached version of 'probabilityServerWinsGame()'.
 
-    Evaluating 'probabilityServerWinsGame(...)' can be expensive, especially when called repeatedly,
-    because it iterates over all possible score progressions. To avoid repeating this computation,
-    the script 'scripts/cache-prob-win-game.py' pre-computes and caches the server's game-winning
-    probability for every possible starting score and across a grid of point-winning probabilities.
-    A 1-D interpolator is constructed from this grid and saved as a callable, which is loaded and
-    returned by this function.
+    The script 'scripts/cache-prob-win-game.py' pre-computes the server's game-winning probability
+    for every possible starting score and across a grid of point-winning probabilities, and saves
+    them as a single table in a '.npy' file. The table is memory-mapped once, and the returned
+    callable linearly interpolates the row of the given score with 'np.interp'.
 
     Parameters:
     -----------
@@ -160,20 +232,32 @@ def loadCachedFunction(initScore    : GameScore,
     # Get the score from the server's perspective
     pointsServ, pointsRecv = cappedScore.asPoints(pov=playerServing)
 
-    # Build the filename based on the score and scoring rules
-    noAdRule = initScore._noAdRule
-    fileName = f"prob_win_game_noad_{pointsServ}{pointsRecv}.pkl" if noAdRule else \
-               f"prob_win_game_{pointsServ}{pointsRecv}.pkl"
-               
-    # Build the filepath
-    DIRPATH = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'data-cache')           
-    filePath = os.path.join(DIRPATH, fileName)
+    # Look up the row of the table for this score and scoring rules
+    table = _loadCachedTable()
+    if table is None or pointsServ >= table.shape[1] or pointsRecv >= table.shape[2]:
+        return None
+    probWinGame   = table[int(initScore._noAdRule), pointsServ, pointsRecv]
+    probWinPoints = np.linspace(0, 1, table.shape[-1])
+
+    def wrapper(p: float) -> float:
+        return float(np.interp(p, probWinPoints, probWinGame))
+    return wrapper
 
+@lru_cache(maxsize=1)
+def _loadCachedTable() -> Optional[npt.NDArray[np.floating]]:
+    """
+    Memory-maps the table of game-winning probabilities saved by 'scripts/cache-prob-win-game.py'.
+    The table is indexed by [noAdRule, server points, receiver points, point-winning probability],
+    the last axis being an evenly spaced grid over [0, 1].
+
+    Returns:
+    --------
+    The table, or None if it is not available.
+    """
+    DIRPATH  = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'data-cache')
+    filePath = os.path.join(DIRPATH, "prob_win_game.npy")
     try:
-        with open(filePath, "rb") as fh:
-            probWinGameInterpFunction = pickle.load(fh)
-            def wrapper(p: float) -> float:
-                return probWinGameInterpFunction(p).item()
-            return wrapper
+        table: npt.NDArray[np.floating] = np.load(filePath, mmap_mode='r')
     except Exception:
         return None
+    return table
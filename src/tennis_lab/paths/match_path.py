@@ -1,7 +1,6 @@
 """MatchPath class representing possible score progressions in a tennis match."""
 
 from __future__ import annotations
-from copy       import deepcopy
 from typing     import Literal
 from tennis_lab.core.match_score import MatchScore
 
@@ -14,6 +13,9 @@ class MatchPath:
     score history represents the match score after a complete set. The initial score cannot have
     a set in progress.
 
+    Paths created from one another share their MatchScore entries (only the lists holding them
+    are copied), so the scores in a path's history must not be modified.
+
     Attributes:
     -----------
     scoreHistory: list[MatchScore]
@@ -71,16 +73,16 @@ class MatchPath:
 
         # the match is over, we cannot increment this path
         if lastScore.isFinal:
-            return deepcopy(self)
+            return self._copy()
 
         # calculate the next possible two scores
         nextScores = lastScore.nextSetScores()
 
         # create two new paths, one for each possible outcome of the next set
-        path1 = deepcopy(self)
+        path1 = self._copy()
         path1._scores.append(nextScores[0])
 
-        path2 = deepcopy(self)
+        path2 = self._copy()
         path2._scores.append(nextScores[1])
 
         return path1, path2
@@ -129,10 +131,19 @@ class MatchPath:
                 pathsNew = path.increment()
                 pathsIncremented.extend(pathsNew)
             else:
-                pathsIncremented.append(deepcopy(path))
+                pathsIncremented.append(path._copy())
 
         return pathsIncremented
 
+    def _copy(self) -> "MatchPath":
+        """
+        Helper method, returns a copy of this path with its own score list.
+        The scores themselves are shared with this path, not copied.
+        """
+        path = MatchPath.__new__(MatchPath)
+        path._scores = list(self._scores)
+        return path
+
     def __str__(self) -> str:
         """
         Returns a string representation of the path, as a list of scores.
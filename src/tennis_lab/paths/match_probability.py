@@ -3,20 +3,25 @@ Functions for calculating match-level probabilities in tennis.
 
 Functions:
 ----------
-pathProbability - probability that a given score path occurs during a match
+pathProbability            - probability that a given score path occurs during a match
+pathProbabilities          - probabilities that each of several score paths occurs during a match
+probabilityP1WinsMatch     - probability that P1 wins the match from a given score
+probabilityP1WinsMatchGrid - probabilityP1WinsMatch, over a grid of both players' point-winning probabilities
 """
 
 import os
 import pickle
 import numpy as np
 import numpy.typing as npt
-from typing import Callable, Iterator, Literal, Optional
+from functools import lru_cache
+from math import comb
+from typing import Callable, Iterable, Iterator, Literal, Optional
 
 from tennis_lab.core.match_format     import MatchFormat
 from tennis_lab.core.match_score      import MatchScore
 from tennis_lab.core.set_score        import SetScore
 from tennis_lab.paths.match_path      import MatchPath
-from tennis_lab.paths.set_probability import probabilityP1WinsSet, _loadCachedFunction as loadCachedFunction_Set
+from tennis_lab.paths.set_probability import _asProbabilityArray, _probabilityP1WinsSetFast, _GameProbabilities, _gameProbabilities, _loadCachedFunction as loadCachedFunction_Set
 
 def pathProbability(path          : MatchPath,
                     probWinPointP1: float,
@@ -46,16 +51,7 @@ def pathProbability(path          : MatchPath,
     if not isinstance(probWinPointP2, (int, float)) or not (0 <= probWinPointP2 <= 1):
         raise ValueError("probWinPointP2 must be a number between 0 and 1")
     
-    # We need to calculate the probability of winning the set from the probability 
-    # of winning the point when serving. We try to load this data from the cache first; 
-    # if not available, we fall back to calculating it directly.
-    # Since we are starting the game from 0-0, it does not matter which player serves.    
-    initScore = SetScore(0, 0, False, MatchFormat())
-    cachedFunction = loadCachedFunction_Set(initScore, playerServing=1)
-    if cachedFunction is not None:
-        probP1WinsSetFunction = cachedFunction
-    else:
-        probP1WinsSetFunction = lambda p1, p2: probabilityP1WinsSet(initScore, 1, [p1], p2)[0]
+    probP1WinsSetFunction = _probP1WinsSetFunction()
 
     probPath = 1.0
     scores   = path.scoreHistory          # the scores that make up the path
@@ -76,6 +72,45 @@ def pathProbability(path          : MatchPath,
 
     return probPath
 
+def pathProbabilities(paths         : Iterable[MatchPath],
+                      probWinPointP1: float,
+                      probWinPointP2: float) -> npt.NDArray[np.floating]:
+    """
+    Calculates the probability that each of the given score paths occurs during a match.
+    Takes as input the probability of each player winning the point when serving.
+
+    This is the batched version of 'pathProbability()'. Every set is played from 0-0, so
+    Player1 wins each set with the same probability; a path along which Player1 wins k sets
+    and Player2 wins m sets therefore has probability P(P1 wins set)^k * P(P2 wins set)^m.
+    The set-winning probability is calculated once, rather than once for each set of each path.
+
+    Parameters:
+    -----------
+    paths          - the match score paths whose probabilities we calculate
+    probWinPointP1 - probability that Player1 wins the point when serving
+    probWinPointP2 - probability that Player2 wins the point when serving
+
+    Returns:
+    --------
+    An array with the probability of each path occurring, in the order the paths were given.
+    """
+    paths = list(paths)
+    for path in paths:
+        if not isinstance(path, MatchPath):
+            raise ValueError("all paths must be MatchPath instances")
+    if not isinstance(probWinPointP1, (int, float)) or not (0 <= probWinPointP1 <= 1):
+        raise ValueError("probWinPointP1 must be a number between 0 and 1")
+    if not isinstance(probWinPointP2, (int, float)) or not (0 <= probWinPointP2 <= 1):
+        raise ValueError("probWinPointP2 must be a number between 0 and 1")
+
+    # there is no set to play if no path is given
+    if len(paths) == 0:
+        return np.empty(0)
+
+    setsWonP1, setsWonP2 = _setsWonAlongPaths(paths)
+    probP1WinsSet = _probP1WinsSetFunction()(probWinPointP1, probWinPointP2)
+    return _pathProbabilitiesFromSetProbs(setsWonP1, setsWonP2, np.array([probP1WinsSet]))[:, 0]
+
 def probabilityP1WinsMatch(initScore      : MatchScore,
                            playerServing  : Literal[1, 2],
                            probWinPointP1s: Iterator[float],
@@ -105,39 +140,96 @@ def probabilityP1WinsMatch(initScore      : MatchScore,
     if not isinstance(probWinPointP2, (int, float)) or not (0 <= probWinPointP2 <= 1):
         raise ValueError("probWinPointP2 must be a number between 0 and 1")
 
-    # Convert iterator to list, since we need to iterate multiple times over it
-    probWinPointP1s = list(probWinPointP1s)
-    for p in probWinPointP1s:
-        if not isinstance(p, (int, float)) or not (0 <= p <= 1):
-            raise ValueError("all probWinPointP1s must be numbers between 0 and 1")
+    # Materialize the iterator, since we need to iterate multiple times over it
+    probsP1 = _asProbabilityArray(probWinPointP1s)
+
+    return _probabilityP1WinsMatchFast(initScore, playerServing, probsP1, probWinPointP2)
+
+def probabilityP1WinsMatchGrid(initScore      : MatchScore,
+                               playerServing  : Literal[1, 2],
+                               probWinPointP1s: Iterator[float],
+                               probWinPointP2s: Iterator[float]) -> npt.NDArray[np.floating]:
+    """
+    Calculates the probability that Player1 wins the match from a given score, for every
+    combination of the probability that Player1 wins the point when serving and the
+    probability that Player2 wins the point when serving.
+
+    This is the two-dimensional version of 'probabilityP1WinsMatch()', suited for plotting or
+    fitting over a grid: the inputs are validated once, and each column of the grid (one value
+    for Player2) is calculated in a single call vectorized over all the values for Player1.
 
+    Parameters:
+    -----------
+    initScore       - the initial score in the match
+    playerServing   - which player is serving next point (1 or 2)
+    probWinPointP1s - iterable of probabilities that Player1 wins the point when serving
+    probWinPointP2s - iterable of probabilities that Player2 wins the point when serving
+
+    Returns:
+    --------
+    An array of shape (len(probWinPointP1s), len(probWinPointP2s)), whose element [i, j] is the
+    probability that Player1 wins the match given probWinPointP1s[i] and probWinPointP2s[j].
+    """
+    if not isinstance(initScore, MatchScore):
+        raise ValueError("initScore must be a MatchScore instance")
+    if not isinstance(playerServing, int) or playerServing not in [1, 2]:
+        raise ValueError("playerServing must be 1 or 2")
+
+    # Materialize the iterators and check all the values at once
+    probsP1 = _asProbabilityArray(probWinPointP1s)
+    probsP2 = _asProbabilityArray(probWinPointP2s, "probWinPointP2s")
+
+    grid = np.empty((len(probsP1), len(probsP2)))
+    for j, probWinPointP2 in enumerate(probsP2.tolist()):
+        grid[:, j] = _probabilityP1WinsMatchFast(initScore, playerServing, probsP1, probWinPointP2)
+    return grid
+
+def _probabilityP1WinsMatchFast(initScore      : MatchScore,
+                                playerServing  : Literal[1, 2],
+                                probWinPointP1s: npt.NDArray[np.floating],
+                                probWinPointP2 : float) -> npt.NDArray[np.floating]:
+    """
+    Same as 'probabilityP1WinsMatch()', minus the input validation: the inputs are assumed to be
+    valid, and the probabilities that Player1 wins the point when serving must be given as an array.
+    Intended for callers evaluating the match probability many times with already validated inputs.
+    """
     # the number of sets completed so far by the two players
     setsP1, setsP2 = initScore.sets(pov=1)
     matchFormat    = initScore._matchFormat
 
+    # The game-level probabilities (holding serve, winning a tiebreak) do not depend on the
+    # score, so they are calculated once and shared by all the sets calculated below.
+    gameProbs = _gameProbabilities(probWinPointP1s, probWinPointP2)
+
     # Case 1: we are in the middle of a set
     # Calculate probability using conditional probabilities on set outcome
     if initScore.setInProgress:
         setScore = initScore.currSetScore
+        assert setScore is not None
 
         # calculate the probability that Player1 wins the set in progress
-        pP1WinsSet = probabilityP1WinsSet(setScore, playerServing, probWinPointP1s, probWinPointP2)
+        pP1WinsSet = _probabilityP1WinsSetFast(setScore, playerServing, probWinPointP1s, probWinPointP2, gameProbs)
+
+        scoreIfWon  = MatchScore(setsP1 + 1, setsP2, matchFormat)
+        scoreIfLost = MatchScore(setsP1, setsP2 + 1, matchFormat)
+        cachedMatchFuncWon  = _loadCachedFunction(scoreIfWon)
+        cachedMatchFuncLost = _loadCachedFunction(scoreIfLost)
+
+        # without a cached match function, we need the probability that Player1 wins each following set
+        if cachedMatchFuncWon is None or cachedMatchFuncLost is None:
+            pP1WinsNextSets = _probabilityP1WinsSetArray(probWinPointP1s, probWinPointP2, gameProbs)
 
         # P(win match | won set)
-        scoreIfWon = MatchScore(setsP1 + 1, setsP2, matchFormat)
-        cachedMatchFuncWon = _loadCachedFunction(scoreIfWon)
         if cachedMatchFuncWon is not None:
-            pP1WinsMatchWon = np.array([cachedMatchFuncWon(p1, probWinPointP2) for p1 in probWinPointP1s])
+            pP1WinsMatchWon = _probabilityP1WinsMatchCached(cachedMatchFuncWon, scoreIfWon, probWinPointP1s, probWinPointP2)
         else:
-            pP1WinsMatchWon = np.array([_probabilityP1WinsMatchFromSetBoundary(scoreIfWon, p1, probWinPointP2) for p1 in probWinPointP1s])
+            pP1WinsMatchWon = _probabilityP1WinsMatchFromSetProbs(scoreIfWon, pP1WinsNextSets)
 
         # P(win match | lost set)
-        scoreIfLost = MatchScore(setsP1, setsP2 + 1, matchFormat)
-        cachedMatchFuncLost = _loadCachedFunction(scoreIfLost)
         if cachedMatchFuncLost is not None:
-            pP1WinsMatchLost = np.array([cachedMatchFuncLost(p1, probWinPointP2) for p1 in probWinPointP1s])
+            pP1WinsMatchLost = _probabilityP1WinsMatchCached(cachedMatchFuncLost, scoreIfLost, probWinPointP1s, probWinPointP2)
         else:
-            pP1WinsMatchLost = np.array([_probabilityP1WinsMatchFromSetBoundary(scoreIfLost, p1, probWinPointP2) for p1 in probWinPointP1s])
+            pP1WinsMatchLost = _probabilityP1WinsMatchFromSetProbs(scoreIfLost, pP1WinsNextSets)
 
         # total probability
         return pP1WinsSet * pP1WinsMatchWon + (1 - pP1WinsSet) * pP1WinsMatchLost
@@ -146,9 +238,49 @@ def probabilityP1WinsMatch(initScore      : MatchScore,
     else:
         cachedMatchFunc = _loadCachedFunction(initScore)
         if cachedMatchFunc is not None:
-            return np.array([cachedMatchFunc(p1, probWinPointP2) for p1 in probWinPointP1s])
+            return _probabilityP1WinsMatchCached(cachedMatchFunc, initScore, probWinPointP1s, probWinPointP2)
         else:
-            return np.array([_probabilityP1WinsMatchFromSetBoundary(initScore, p1, probWinPointP2) for p1 in probWinPointP1s])
+            pP1WinsSets = _probabilityP1WinsSetArray(probWinPointP1s, probWinPointP2, gameProbs)
+            return _probabilityP1WinsMatchFromSetProbs(initScore, pP1WinsSets)
+
+def _probabilityP1WinsMatchCached(cachedMatchFunc: Callable[[float, float], float],
+                                  initScore      : MatchScore,
+                                  probWinPointP1s: npt.NDArray[np.floating],
+                                  probWinPointP2 : float) -> npt.NDArray[np.floating]:
+    """
+    Helper function, evaluates a cached match function (see '_loadCachedFunction()') from a given
+    set boundary, for each given probability that Player1 wins the point when serving.
+
+    When the outcome of every set is certain (see '_certainSetOutcomes()'), so is the outcome of
+    the match: for these values the probability is calculated exactly, in closed form, instead of
+    being interpolated one value at a time.
+    """
+    probP1WinsSet = _certainSetOutcomes(probWinPointP1s, probWinPointP2)
+    probWinMatch  = np.array(_probabilityP1WinsMatchFromSetProbs(initScore, probP1WinsSet), dtype=float)
+
+    uncertain = np.isnan(probP1WinsSet)
+    probWinMatch[uncertain] = [cachedMatchFunc(p1, probWinPointP2) for p1 in probWinPointP1s[uncertain]]
+    return probWinMatch
+
+def _certainSetOutcomes(probWinPointP1s: npt.NDArray[np.floating],
+                        probWinPointP2 : float) -> npt.NDArray[np.floating]:
+    """
+    Helper function, identifies the point-winning probabilities for which the outcome of a set
+    played from 0-0 is certain. Returns an array holding, for each given probability that Player1
+    wins the point when serving, 1.0 (Player1 surely wins the set), 0.0 (Player1 surely loses it),
+    or NaN (the outcome is uncertain).
+
+    A player who wins every point on serve never loses a game on serve, nor a tiebreak unless the
+    opponent also wins every point on serve. Likewise, a player who never wins a point on serve
+    cannot win the set, unless the opponent never wins a point on serve either. So, Player1 surely:
+      + wins the set if p1 == 1 and p2 < 1, or if p1 > 0 and p2 == 0
+      + loses the set if p1 == 0 and p2 > 0, or if p1 < 1 and p2 == 1
+    """
+    p1, p2  = probWinPointP1s, probWinPointP2
+    outcome = np.full(p1.shape, np.nan)
+    outcome[((p1 == 1) & (p2 < 1)) | ((p1 > 0) & (p2 == 0))] = 1.0
+    outcome[((p1 == 0) & (p2 > 0)) | ((p1 < 1) & (p2 == 1))] = 0.0
+    return outcome
 
 def _probabilityP1WinsMatchFromSetBoundary(initScore     : MatchScore,
                                            probWinPointP1: float,
@@ -161,15 +293,14 @@ def _probabilityP1WinsMatchFromSetBoundary(initScore     : MatchScore,
     in the middle of a set. Valid examples (as number of sets): 0-0, 1-0, 1-1, 2-1 
     (with no set in progress).
 
-    This probability is calculated the following way:
-      + generate all possible score paths starting from the given initial score (at 'set' granularity)
-      + calculate the probability that Player1 wins the match along each path
-      + sum up all these probabilities
+    This probability is the sum, over all possible score paths starting from the given initial
+    score (at 'set' granularity), of the probability that Player1 wins the match along each path.
+    Since every set is played from 0-0, that sum only depends on the number of sets each player
+    still needs, and is calculated in closed form by '_probabilityP1WinsMatchFromSetScore()'.
     The calculation takes as input each player's probability of winning a point on their serve.
 
-    For efficiency, pre-generated score paths can be passed in via the 'paths' parameter, to avoid
-    regenerating them on each call. If not provided, all possible score paths that start from the
-    initial score are generated internally.
+    Alternatively, score paths can be passed in via the 'paths' parameter, in which case the
+    sum is taken over the given paths.
 
     Parameters:
     -----------
@@ -197,32 +328,135 @@ def _probabilityP1WinsMatchFromSetBoundary(initScore     : MatchScore,
             if path.scoreHistory[0] != initScore:
                 raise ValueError("all paths must start with 'initScore'")
 
-    # Generate all possible paths starting from the initial score
-    # (unless we were given a pre-calculated list of paths)
+    probP1WinsSet = _probP1WinsSetFunction()(probWinPointP1, probWinPointP2)
+
+    # Without pre-calculated paths, the probability only depends on the set score
     # NOTE: if given a set of paths, we do not check whether they
     #       represent *all* the score paths that start with 'initScore'
-    allPaths = paths if paths else MatchPath.generateAllPaths(initScore)
-
-    # add up the probability of winning the match along each path
-    probWinMatch = 0.0
-    for path in allPaths:
+    if not paths:
+        setsP1, setsP2 = initScore.sets(pov=1)
+        bestOfSets     = initScore._matchFormat.bestOfSets
+        assert bestOfSets is not None
+        return float(_probabilityP1WinsMatchFromSetScore(setsP1, setsP2, bestOfSets, probP1WinsSet))
+
+    # the probability of each path occurring
+    setsWonP1, setsWonP2 = _setsWonAlongPaths(paths)
+    P1won     = np.array([path.scoreHistory[-1].winner == 1 for path in paths], dtype=bool)
+    probPaths = _pathProbabilitiesFromSetProbs(setsWonP1, setsWonP2, np.array([probP1WinsSet]))[:, 0]
+
+    # add up the probability of the paths along which Player1 wins the match
+    return float(probPaths[P1won].sum())
+
+def _probabilityP1WinsMatchFromSetProbs(initScore    : MatchScore,
+                                        probP1WinsSet: npt.NDArray[np.floating]) -> npt.NDArray[np.floating]:
+    """
+    Calculates the probability that Player1 wins the match from a given set boundary,
+    for each given probability that Player1 wins a set.
 
-        # the probability of this path occurring
-        probPath = pathProbability(path, probWinPointP1, probWinPointP2)
+    This is the vectorized counterpart of '_probabilityP1WinsMatchFromSetBoundary()': it unwraps
+    the score and hands the set counts to '_probabilityP1WinsMatchFromSetScore()'.
 
-        # how did this path end?
-        lastScore = path.scoreHistory[-1]
-        P1won     = lastScore.winner == 1
+    Parameters:
+    -----------
+    initScore     - the initial score in the match (must not have a set in progress)
+    probP1WinsSet - array of probabilities that Player1 wins a set (played from 0-0)
 
-        # the probability that Player1 wins the match when it reaches the end of this path is:
-        #  1 if the path ends with P1 winning the match
-        #  0 if the path ends with P1 losing the match
-        probWinPath = probPath * (1.0 if P1won else 0.0)
+    Returns:
+    --------
+    An array of probabilities that Player1 wins the match, one for each value in probP1WinsSet.
+    """
+    setsP1, setsP2 = initScore.sets(pov=1)
+    bestOfSets     = initScore._matchFormat.bestOfSets
+    assert bestOfSets is not None
+    return _probabilityP1WinsMatchFromSetScore(setsP1, setsP2, bestOfSets, probP1WinsSet)
+
+def _probabilityP1WinsMatchFromSetScore(setsP1       : int,
+                                        setsP2       : int,
+                                        bestOfSets   : int,
+                                        probP1WinsSet: npt.ArrayLike) -> npt.NDArray[np.floating]:
+    """
+    Calculates the probability that Player1 wins the match from a set boundary, given only the
+    number of sets won by each player and the probability that Player1 wins a set (a scalar or
+    an array, the arithmetic is element-wise).
+
+    Every set is played from 0-0, so Player1 wins each one with the same probability p. If Player1
+    still needs 'a' sets and Player2 needs 'b', Player1 wins the match iff Player1 wins the a-th
+    set before losing b of them. Adding up over the number k < b of sets lost along the way:
+        P(win match) = sum_k C(a-1+k, k) * p^a * (1-p)^k
+    which is the sum over all the score paths, without enumerating them.
+    """
+    p = np.asarray(probP1WinsSet, dtype=float)
+    setsToWin    = bestOfSets // 2 + 1
+    setsNeededP1 = setsToWin - setsP1
+    setsNeededP2 = setsToWin - setsP2
 
-        probWinMatch += probWinPath
+    # a match that is already decided
+    if setsNeededP1 == 0 or setsNeededP2 == 0:
+        return np.full(p.shape, 1.0 if setsNeededP1 == 0 else 0.0)
 
+    probWinMatch: npt.NDArray[np.floating] = sum(comb(setsNeededP1 - 1 + k, k) * p**setsNeededP1 * (1 - p)**k for k in range(setsNeededP2))
     return probWinMatch
 
+def _setsWonAlongPaths(paths: list[MatchPath]) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+    """
+    Helper function, returns the number of sets won by Player1 and by Player2 along each path.
+    """
+    setsWonP1 = np.empty(len(paths), dtype=np.int64)
+    setsWonP2 = np.empty(len(paths), dtype=np.int64)
+    for i, path in enumerate(paths):
+        setsFirstP1, setsFirstP2 = path.scoreHistory[ 0].sets(pov=1)
+        setsLastP1,  setsLastP2  = path.scoreHistory[-1].sets(pov=1)
+        setsWonP1[i] = setsLastP1 - setsFirstP1
+        setsWonP2[i] = setsLastP2 - setsFirstP2
+    return setsWonP1, setsWonP2
+
+def _pathProbabilitiesFromSetProbs(setsWonP1    : npt.NDArray[np.int64],
+                                   setsWonP2    : npt.NDArray[np.int64],
+                                   probP1WinsSet: npt.NDArray[np.floating]) -> npt.NDArray[np.floating]:
+    """
+    Helper function, calculates the probability that each path occurs for each given probability
+    that Player1 wins a set. The paths are given by the number of sets won by each player along them.
+    Returns an array of shape (number of paths, number of probabilities).
+
+    A path along which Player1 wins k sets and Player2 wins m sets occurs with probability
+    P(P1 wins set)^k * P(P2 wins set)^m, since every set is played from 0-0.
+    """
+    probP1WinsSet = np.asarray(probP1WinsSet, dtype=np.float64)
+    return probP1WinsSet[np.newaxis, :] ** setsWonP1[:, np.newaxis] * \
+        (1 - probP1WinsSet)[np.newaxis, :] ** setsWonP2[:, np.newaxis]
+
+def _probabilityP1WinsSetArray(probWinPointP1s: npt.NDArray[np.floating],
+                               probWinPointP2 : float,
+                               gameProbs      : Optional[_GameProbabilities] = None) -> npt.NDArray[np.floating]:
+    """
+    Helper function, calculates the probability that Player1 wins a set played from 0-0,
+    for each given probability that Player1 wins the point when serving.
+
+    We try to load this function from the cache first; if not available, we fall back to
+    calculating the probabilities directly, all in one call, from the game-level probabilities
+    'gameProbs' if the caller already calculated them.
+    """
+    initScore = SetScore(0, 0, False, MatchFormat())
+    cachedFunction = loadCachedFunction_Set(initScore, playerServing=1)
+    if cachedFunction is not None:
+        return np.asarray(cachedFunction(np.asarray(probWinPointP1s, dtype=float), probWinPointP2))
+    return _probabilityP1WinsSetFast(initScore, 1, np.asarray(probWinPointP1s, dtype=float), probWinPointP2, gameProbs)
+
+def _probP1WinsSetFunction() -> Callable[[float, float], float]:
+    """
+    Helper function, returns a function mapping each player's probability of winning the point
+    when serving to the probability that Player1 wins a set played from 0-0.
+
+    We try to load this function from the cache first; if not available, we fall back to
+    calculating the probability directly. Since the set starts from 0-0, it does not matter
+    which player serves.
+    """
+    initScore = SetScore(0, 0, False, MatchFormat())
+    cachedFunction = loadCachedFunction_Set(initScore, playerServing=1)
+    if cachedFunction is not None:
+        return lambda p1, p2: float(cachedFunction(p1, p2))
+    return lambda p1, p2: float(_probabilityP1WinsSetFast(initScore, 1, np.array([p1], dtype=float), p2)[0])
+
 def _loadCachedFunction(initScore: MatchScore) -> Optional[Callable[[float, float], float]]:
     """
     Loads a cached version of '_probabilityP1WinsMatchFromSetBoundary()'.
@@ -264,15 +498,29 @@ def _loadCachedFunction(initScore: MatchScore) -> Optional[Callable[[float, floa
     # Build the filename based on the score
     fileName = f"prob_win_match_bo{bestOf}_{setsP1}{setsP2}.pkl"
 
-    # Build the filepath
-    DIRPATH = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'data-cache')
-    filePath = os.path.join(DIRPATH, fileName)
+    # Load the interpolator (once per file, see '_loadInterpolator()')
+    probP1WinMatchInterpFunction = _loadInterpolator(fileName)
+    if probP1WinMatchInterpFunction is None:
+        return None
+    def wrapper(p1: float, p2: float) -> float:
+        return probP1WinMatchInterpFunction(p1, p2).item()
+    return wrapper
 
+@lru_cache(maxsize=None)
+def _loadInterpolator(fileName: str) -> Optional[Callable]:
+    """
+    Unpickles an interpolator of match-winning probabilities saved by 'scripts/cache-prob-win-match.py'.
+    The result (including a missing file) is cached, so each file is read at most once per process.
+
+    Returns:
+    --------
+    The interpolator, or None if it is not available.
+    """
+    DIRPATH  = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'data-cache')
+    filePath = os.path.join(DIRPATH, fileName)
     try:
         with open(filePath, "rb") as fh:
-            probP1WinMatchInterpFunction = pickle.load(fh)
-            def wrapper(p1: float, p2: float) -> float:
-                return probP1WinMatchInterpFunction(p1, p2).item()
-            return wrapper
+            interpolator: Callable = pickle.load(fh)
     except Exception:
         return None
+    return interpolator
@@ -2,9 +2,12 @@
 
 from __future__  import annotations
 from collections import namedtuple
-from copy        import deepcopy
+from functools   import lru_cache
 from typing      import Literal
-from tennis_lab.core.set_score import SetScore
+import numpy as np
+import numpy.typing as npt
+from tennis_lab.core.match_format import MatchFormat
+from tennis_lab.core.set_score    import SetScore
 
 class SetPath:
     """
@@ -20,6 +23,8 @@ class SetPath:
     -----------
     scoreHistory: list[PathEntry]
        The score history of the set (including which player is serving next game).
+    scoreArray: np.ndarray
+       The score history as an (n, 3) int8 array of rows (gamesP1, gamesP2, playerServing).
 
     Methods:
     --------
@@ -36,6 +41,8 @@ class SetPath:
     # A "path entry" bundles together two items:
     #  + the set score (an instance of SetScore)
     #  + which player serves next game (1 or 2)
+    # Paths extended from a common path share its entries (see 'increment'), so an entry,
+    # and the score it holds, must never be modified once it is part of a path.
     PathEntry = namedtuple('PathEntry', ('score', 'playerServing'))
 
     def __init__(self, initialScore: SetScore, playerServing: Literal[1, 2]):
@@ -72,21 +79,32 @@ class SetPath:
         """
         return self._entries
 
+    @property
+    def scoreArray(self) -> npt.NDArray[np.int8]:
+        """
+        The score history as an (n, 3) int8 array, one row (gamesP1, gamesP2, playerServing) per entry.
+        Built from the score history on each access, so it is a copy: a compact form for vectorized
+        calculations over the path, which need no SetScore objects.
+        """
+        return np.array([(*entry.score.games(pov=1), entry.playerServing) for entry in self._entries],
+                        dtype=np.int8)
+
     def increment(self) -> tuple["SetPath", "SetPath"] | "SetPath":
         """
         Extend the current path by one game, a win for either Player1 or Player2.
-        This process creates two new paths.
+        This process creates two new paths, which share the entries of this path (the entries
+        are immutable and never modified by a path; each new path only adds its own last entry).
 
         Returns:
         --------
-        Two new paths if the set is not over, copy of self otherwise.
+        Two new paths if the set is not over, copy of self otherwise (sharing its entries).
         """
         lastEntry = self._entries[-1]
         lastScore = lastEntry.score
 
         # the set is over, we cannot increment this path
         if lastScore.isFinal:
-            return deepcopy(self)
+            return self._extended()
 
         # calculate the next possible two scores
         nextScores = lastScore.nextGameScores()
@@ -95,70 +113,88 @@ class SetPath:
         playerServingNext = 3 - lastEntry.playerServing
 
         # create two new paths, one for each possible outcome of the next game
-        path1 = deepcopy(self)
-        path1._entries.append(SetPath.PathEntry(score=nextScores[0], playerServing=playerServingNext))
-
-        path2 = deepcopy(self)
-        path2._entries.append(SetPath.PathEntry(score=nextScores[1], playerServing=playerServingNext))
-
+        path1 = self._extended(SetPath.PathEntry(score=nextScores[0], playerServing=playerServingNext))
+        path2 = self._extended(SetPath.PathEntry(score=nextScores[1], playerServing=playerServingNext))
         return path1, path2
 
+    def _extended(self, *entries: PathEntry) -> "SetPath":
+        """
+        Helper method, creating a new path made of this path's entries followed by the given ones.
+        Only the list of entries is copied, not the entries themselves, so the paths share their prefix;
+        each path owns its list, so appending to one path's entries does not affect the other.
+        """
+        path = SetPath.__new__(SetPath)
+        path._entries = self._entries + list(entries)
+        return path
+
     @staticmethod
     def generateAllPaths(initialScore: SetScore,
                          playerServing: Literal[1, 2]) -> list["SetPath"]:
         """
         Factory method generating all possible score paths that start from a given initial score.
 
+        The paths only depend on the initial games, on whether this is the final set and on the
+        match format, so their game sequences are generated once per such combination and cached.
+        Every call still returns new SetPath instances, holding new SetScore objects after
+        'initialScore'. The paths returned by one call share the SetScore object of each score
+        they have in common (one object per distinct score); separate calls share none.
+
         Parameters:
         -----------
         initialScore  - the starting score for all paths
         playerServing - which player is serving next game
-        """
-        seedPath = SetPath(initialScore, playerServing)
-        return SetPath._extendPaths([seedPath])
 
-    @staticmethod
-    def _extendPaths(paths: list["SetPath"]) -> list["SetPath"]:
-        """
-        Helper method, used to extend each given score path until the set is over,
-        or it reaches the tied score (e.g., 6-6).
+        Raises:
+        -------
+        ValueError - if initialScore is not a valid initial score (see '__init__')
+        ValueError - if playerServing is not 1 or 2
         """
-        # attempt to extend each given path by one game
-        pathsIncremented = SetPath._incrementPaths(paths)
-
-        # we are done when no input path can be incremented further
-        doneExtending = len(pathsIncremented) == len(paths)
-
-        # if we're not done, attempt to increment the paths again
-        return paths if doneExtending else SetPath._extendPaths(pathsIncremented)
+        SetPath(initialScore, playerServing)   # validates the inputs
+
+        isFinalSet  = initialScore._isFinalSet
+        matchFormat = initialScore._matchFormat
+        initGames   = initialScore.games(pov=1)
+
+        # build one SetScore per distinct score reached by the paths (a set has at most a few dozen)
+        scores = {initGames: initialScore}
+        paths  = []
+        for gamesHistory in SetPath._generateAllGamePaths(initGames, isFinalSet, matchFormat):
+            path = SetPath.__new__(SetPath)
+            path._entries = []
+            for i, games in enumerate(gamesHistory):
+                if games not in scores:
+                    scores[games] = SetScore(games[0], games[1], isFinalSet, matchFormat)
+                # in sets, serve alternates every game
+                server = playerServing if i % 2 == 0 else 3 - playerServing
+                path._entries.append(SetPath.PathEntry(score=scores[games], playerServing=server))
+            paths.append(path)
+        return paths
 
     @staticmethod
-    def _incrementPaths(paths: list["SetPath"]) -> list["SetPath"]:
+    @lru_cache(maxsize=None)
+    def _generateAllGamePaths(games      : tuple[int, int],
+                              isFinalSet : bool,
+                              matchFormat: MatchFormat) -> tuple[tuple[tuple[int, int], ...], ...]:
         """
-        Helper method, used to increment each given path by one game, using 'self.increment()'.
+        Helper method, generating (and caching) all score paths starting from a given score.
+        Each path is stored as an immutable snapshot: the sequence of its scores as (P1, P2) games.
 
-        It imposes a cutoff: paths for which the current score is tied (e.g., 6-6)
-        are not incremented, they are returned unmodified.
-        This implies that the length of the output list equals the length of the input list
-        iff none of the given paths can be incremented.
+        The paths are extended with an explicit stack (depth-first, Player1 winning the game first),
+        which yields them in the same order as extending all paths one game at a time. A path is
+        not extended past a final score, nor past the tied score (e.g., 6-6).
         """
-        pathsIncremented = []   # stores incremented paths
-        for path in paths:
-            lastScore = path._entries[-1].score
-
-            # don't increment a path which reaches the tied score (e.g., 6-6)
-            if lastScore.isTied:
-                pathsIncremented.append(deepcopy(path))
+        paths = []
+        stack: list[tuple[tuple[int, int], ...]] = [(games,)]
+        while stack:
+            gamesHistory = stack.pop()
+            gamesP1, gamesP2 = gamesHistory[-1]
+            score = SetScore(gamesP1, gamesP2, isFinalSet, matchFormat)
+            if score.isFinal or score.isTied:
+                paths.append(gamesHistory)
                 continue
-
-            # increment the score unless the score is final
-            if not lastScore.isFinal:
-                pathsNew = path.increment()
-                pathsIncremented.extend(pathsNew)
-            else:
-                pathsIncremented.append(deepcopy(path))
-
-        return pathsIncremented
+            stack.append(gamesHistory + ((gamesP1, gamesP2 + 1),))   # pushed first, so popped last
+            stack.append(gamesHistory + ((gamesP1 + 1, gamesP2),))
+        return tuple(paths)
 
     def __str__(self) -> str:
         """
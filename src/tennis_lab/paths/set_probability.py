@@ -4,23 +4,31 @@ Functions for calculating set-level probabilities in tennis.
 Functions:
 ----------
 pathProbability      - probability that a given score path occurs during a set
+pathProbabilities    - probability of each of the given score paths occurring during a set
 probabilityP1WinsSet - probability that P1 wins the set from a given score
 """
 
+from __future__ import annotations
 import numpy as np
 import numpy.typing as npt
-import os, pickle
-from typing import Callable, Iterator, Literal, Optional
+import os
+from collections import namedtuple
+from functools import lru_cache
+from typing import Callable, Iterable, Iterator, Literal, Optional
 
 from tennis_lab.paths.set_path             import SetPath
 from tennis_lab.paths.game_probability     import loadCachedFunction as loadCachedFunction_Game
-from tennis_lab.paths.game_probability     import probabilityServerWinsGame
+from tennis_lab.paths.game_probability     import probabilityServerWinsGameArray
 from tennis_lab.paths.tiebreak_probability import loadCachedFunction as loadCachedFunction_Tiebreak
-from tennis_lab.paths.tiebreak_probability import probabilityP1WinsTiebreak
-from tennis_lab.core.game_score            import GameScore
+from tennis_lab.paths.tiebreak_probability import _probabilityP1WinsTiebreakArray
 from tennis_lab.core.set_score             import SetScore
 from tennis_lab.core.tiebreak_score        import TiebreakScore
 
+# The game-level probabilities a set is built from, as calculated by '_gameProbabilities()':
+# each player's probability of holding serve, and Player1's probability of winning a tiebreak
+# with Player1 / Player2 serving first. They depend on the point-winning probabilities only.
+_GameProbabilities = namedtuple('_GameProbabilities', ('probHoldP1', 'probHoldP2', 'probTiebreakP1Serves', 'probTiebreakP2Serves'))
+
 def pathProbability(path          : SetPath,
                     probWinPointP1: float,
                     probWinPointP2: float) -> float:
@@ -54,39 +62,107 @@ def pathProbability(path          : SetPath,
     if not isinstance(probWinPointP2, (int, float)) or not (0 <= probWinPointP2 <= 1):
         raise ValueError("probWinPointP2 must be a number between 0 and 1")
 
-    # We need to calculate the probability of winning the game when serving from the 
-    # probability of winning the point when serving. We try to load this data from 
-    # the cache first; if not available, we fall back to calculating it directly.
+    # We need the probability of each player winning the game when serving, which we
+    # calculate in closed form from the probability of winning the point when serving.
     # Since we are starting the game from 0-0, it does not matter which player serves.
-    initScore = GameScore(0, 0)
-    cachedFunction = loadCachedFunction_Game(initScore, playerServing=1)
-    if cachedFunction is not None:
-        probWinGameFunction = cachedFunction
-    else:
-        probWinGameFunction = lambda p: probabilityServerWinsGame(initScore, 1, p)
-
-    probPath = 1.0
-    entries  = path.scoreHistory          # the entries that make up the path
-    for i in range(1, len(entries)):      # loop over score *changes*
-
-        gamesP1Curr = entries[i  ].score.games(pov=1)[0]   # Player1 # of games now
-        gamesP1Prev = entries[i-1].score.games(pov=1)[0]   # Player1 # of games previously
-        P1served    = entries[i-1].playerServing == 1      # did Player1 serve this game?
-        P1wonGame   = gamesP1Curr > gamesP1Prev            # did Player1 win the game?
-        P2wonGame   = not P1wonGame
-
-        # calculate the probability of this score change
-        if P1served:
-            probWinGameP1   = probWinGameFunction(probWinPointP1)
-            probScoreChange = probWinGameP1 if P1wonGame else (1 - probWinGameP1)
-        else:
-            probWinGameP2   = probWinGameFunction(probWinPointP2)
-            probScoreChange = probWinGameP2 if P2wonGame else (1 - probWinGameP2)
+    probWinGameP1 = float(_probabilityServerHoldsGame(probWinPointP1))
+    probWinGameP2 = float(_probabilityServerHoldsGame(probWinPointP2))
+
+    return _pathProbabilityFromGameProbs(path, probWinGameP1, probWinGameP2)
+
+def _pathProbabilityFromGameProbs(path         : SetPath,
+                                  probWinGameP1: float,
+                                  probWinGameP2: float) -> float:
+    """
+    Calculates the probability that a given score path occurs during a set, from each
+    player's probability of winning a game on their serve. The inputs are not validated:
+    this is the core of 'pathProbability()', for callers that already checked them.
+
+    Parameters:
+    -----------
+    path          - the set score path whose probability we calculate
+    probWinGameP1 - probability that Player1 wins a game when serving
+    probWinGameP2 - probability that Player2 wins a game when serving
+
+    Returns:
+    --------
+    The probability that the given score path occurs during a set.
+    """
+    # Read the path as arrays: for every score change, whether Player1 served and won the game.
+    scores    = path.scoreArray
+    P1served  = scores[:-1, 2] == 1
+    P1wonGame = scores[1:, 0] > scores[:-1, 0]
+
+    # The path probability is the product of the probabilities of the score changes,
+    # counting the games won and lost by each server.
+    P1holds, P1broken = np.count_nonzero(P1served & P1wonGame), np.count_nonzero(P1served & ~P1wonGame)
+    P2holds, P2broken = np.count_nonzero(~P1served & ~P1wonGame), np.count_nonzero(~P1served & P1wonGame)
+    return probWinGameP1**P1holds * (1 - probWinGameP1)**P1broken * \
+           probWinGameP2**P2holds * (1 - probWinGameP2)**P2broken
+
+def pathProbabilities(paths         : Iterable[SetPath],
+                      probWinPointP1: float,
+                      probWinPointP2: float) -> npt.NDArray[np.floating]:
+    """
+    Calculates the probability that each of the given score paths occurs during a set.
+    Takes as input the probability of each player winning the point when serving.
 
-        # multiply probs of score changes
-        probPath *= probScoreChange
+    This is the batched version of 'pathProbability()'. The score arrays of all the paths are
+    stacked into a single (number of paths, longest path, 3) array, shorter paths being padded
+    by repeating their last row (which adds no score change). The games held and broken by each
+    player along every path are then counted with array operations over all the paths at once.
 
-    return probPath
+    Parameters:
+    -----------
+    paths          - the set score paths whose probabilities we calculate
+    probWinPointP1 - probability that Player1 wins the point when serving
+    probWinPointP2 - probability that Player2 wins the point when serving
+
+    Returns:
+    --------
+    An array with the probability of each path occurring, in the order the paths were given.
+    """
+    paths = list(paths)
+    for path in paths:
+        if not isinstance(path, SetPath):
+            raise ValueError("all paths must be SetPath instances")
+    if not isinstance(probWinPointP1, (int, float)) or not (0 <= probWinPointP1 <= 1):
+        raise ValueError("probWinPointP1 must be a number between 0 and 1")
+    if not isinstance(probWinPointP2, (int, float)) or not (0 <= probWinPointP2 <= 1):
+        raise ValueError("probWinPointP2 must be a number between 0 and 1")
+
+    # there is no game to play if no path is given
+    if len(paths) == 0:
+        return np.empty(0)
+
+    probWinGameP1 = float(_probabilityServerHoldsGame(probWinPointP1))
+    probWinGameP2 = float(_probabilityServerHoldsGame(probWinPointP2))
+    return _pathProbabilitiesFromGameProbs(paths, probWinGameP1, probWinGameP2)
+
+def _pathProbabilitiesFromGameProbs(paths        : list[SetPath],
+                                    probWinGameP1: float,
+                                    probWinGameP2: float) -> npt.NDArray[np.floating]:
+    """
+    Batched version of '_pathProbabilityFromGameProbs()': calculates the probability that each of
+    the given (non-empty list of) score paths occurs, from each player's probability of winning
+    a game on their serve. The inputs are not validated.
+    """
+    arrays = [path.scoreArray for path in paths]
+    length = max(len(array) for array in arrays)
+    scores = np.stack([np.pad(array, ((0, length - len(array)), (0, 0)), mode='edge') for array in arrays])
+
+    # for every score change along every path, whether Player1 served and whether Player1 won the game
+    P1served  = scores[:, :-1, 2] == 1
+    P1wonGame = scores[:, 1:, 0] > scores[:, :-1, 0]
+    changed   = (scores[:, 1:, :2] != scores[:, :-1, :2]).any(axis=2)
+
+    P1holds  = np.count_nonzero(changed &  P1served &  P1wonGame, axis=1)
+    P1broken = np.count_nonzero(changed &  P1served & ~P1wonGame, axis=1)
+    P2holds  = np.count_nonzero(changed & ~P1served & ~P1wonGame, axis=1)
+    P2broken = np.count_nonzero(changed & ~P1served &  P1wonGame, axis=1)
+    probPaths: npt.NDArray[np.floating] = probWinGameP1**P1holds * (1 - probWinGameP1)**P1broken * \
+                                          probWinGameP2**P2holds * (1 - probWinGameP2)**P2broken
+    return probPaths
 
 def probabilityP1WinsSet(initScore      : SetScore,
                          playerServing  : Literal[1, 2],
@@ -120,12 +196,23 @@ def probabilityP1WinsSet(initScore      : SetScore,
     if not isinstance(probWinPointP2, (int, float)) or not (0 <= probWinPointP2 <= 1):
         raise ValueError("probWinPointP2 must be a number between 0 and 1")
 
-    # Convert iterator to list, since we need to iterate multiple times over it
-    probWinPointP1s = list(probWinPointP1s)
-    for p in probWinPointP1s:
-        if not isinstance(p, (int, float)) or not (0 <= p <= 1):
-            raise ValueError("all probWinPointP1s must be numbers between 0 and 1")
+    # Materialize the iterator, since we need to iterate multiple times over it
+    probsP1 = _asProbabilityArray(probWinPointP1s)
 
+    return _probabilityP1WinsSetFast(initScore, playerServing, probsP1, probWinPointP2)
+
+def _probabilityP1WinsSetFast(initScore      : SetScore,
+                              playerServing  : Literal[1, 2],
+                              probWinPointP1s: npt.NDArray[np.floating],
+                              probWinPointP2 : float,
+                              gameProbs      : Optional[_GameProbabilities] = None) -> npt.NDArray[np.floating]:
+    """
+    Same as 'probabilityP1WinsSet()', minus the input validation: the inputs are assumed to be
+    valid, and the probabilities that Player1 wins the point when serving must be given as an array.
+    Used by callers that already validated their inputs, to keep validation out of repeated calls.
+    Callers which already calculated the game-level probabilities for these inputs (with
+    '_gameProbabilities()') can pass them in via 'gameProbs', so they are not calculated again.
+    """
     # the number of games completed so far by the two players
     gamesP1, gamesP2 = initScore.games(pov=1)
 
@@ -133,6 +220,7 @@ def probabilityP1WinsSet(initScore      : SetScore,
     # Calculate probability using conditional probabilities on game outcome
     if initScore.gameInProgress:
         gameScore = initScore.currGameScore
+        assert gameScore is not None
 
         # calculate the probability that the player serving wins the game in progress
         cachedGameFunc = loadCachedFunction_Game(gameScore, playerServing)
@@ -141,29 +229,33 @@ def probabilityP1WinsSet(initScore      : SetScore,
             probServerWinsGame = np.array([cachedGameFunc(p) for p in probWinPoint])
         else:
             probWinPoint = [p1 if playerServing == 1 else probWinPointP2 for p1 in probWinPointP1s]
-            probServerWinsGame = np.array([probabilityServerWinsGame(gameScore, playerServing, p) for p in probWinPoint])
+            probServerWinsGame = probabilityServerWinsGameArray(gameScore, playerServing, probWinPoint)
 
         # convert to probability that Player1 wins the game
         probP1WinsGame = probServerWinsGame if playerServing == 1 else (1 - probServerWinsGame)
 
         # after this game, the other player serves
-        nextServer = 3 - playerServing
+        nextServer: Literal[1, 2] = 2 if playerServing == 1 else 1
+
+        # both game boundaries reached below are built from the same game-level probabilities
+        if gameProbs is None:
+            gameProbs = _gameProbabilities(probWinPointP1s, probWinPointP2)
 
         # P(win set | won game)
         scoreIfWon = SetScore(gamesP1 + 1, gamesP2, initScore._isFinalSet, initScore._matchFormat)
         cachedSetFuncWon = _loadCachedFunction(scoreIfWon, nextServer)
         if cachedSetFuncWon is not None:
-            pP1WinsSetWon = np.array([cachedSetFuncWon(p1, probWinPointP2) for p1 in probWinPointP1s])
+            pP1WinsSetWon = cachedSetFuncWon(probWinPointP1s, probWinPointP2)
         else:
-            pP1WinsSetWon = np.array([_probabilityP1WinsSetFromGameBoundary(scoreIfWon, nextServer, p1, probWinPointP2) for p1 in probWinPointP1s])
+            pP1WinsSetWon = _probabilityP1WinsSetFromGameBoundaryArray(scoreIfWon, nextServer, probWinPointP1s, probWinPointP2, gameProbs)
 
         # P(win set | lost game)
         scoreIfLost = SetScore(gamesP1, gamesP2 + 1, initScore._isFinalSet, initScore._matchFormat)
         cachedSetFuncLost = _loadCachedFunction(scoreIfLost, nextServer)
         if cachedSetFuncLost is not None:
-            pP1WinsSetLost = np.array([cachedSetFuncLost(p1, probWinPointP2) for p1 in probWinPointP1s])
+            pP1WinsSetLost = cachedSetFuncLost(probWinPointP1s, probWinPointP2)
         else:
-            pP1WinsSetLost = np.array([_probabilityP1WinsSetFromGameBoundary(scoreIfLost, nextServer, p1, probWinPointP2) for p1 in probWinPointP1s])
+            pP1WinsSetLost = _probabilityP1WinsSetFromGameBoundaryArray(scoreIfLost, nextServer, probWinPointP1s, probWinPointP2, gameProbs)
 
         # total probability
         return probP1WinsGame * pP1WinsSetWon + (1 - probP1WinsGame) * pP1WinsSetLost
@@ -172,19 +264,36 @@ def probabilityP1WinsSet(initScore      : SetScore,
     # Probability of winning the set equals probability of winning the tiebreak
     elif initScore.tiebreakInProgress:
         tiebreakScore = initScore.tiebreakScore
+        assert tiebreakScore is not None
         cachedTiebreakFunc = loadCachedFunction_Tiebreak(tiebreakScore, playerServing)
         if cachedTiebreakFunc is not None:
             return np.array([cachedTiebreakFunc(p1, probWinPointP2) for p1 in probWinPointP1s])
         else:
-            return np.array([probabilityP1WinsTiebreak(tiebreakScore, playerServing, p1, probWinPointP2) for p1 in probWinPointP1s])
+            return _probabilityP1WinsTiebreakArray(tiebreakScore, playerServing, probWinPointP1s, probWinPointP2)
 
     # Case 3: we are at a game boundary (not in the middle of a game or tiebreak)
     else:
         cachedSetFunc = _loadCachedFunction(initScore, playerServing)
         if cachedSetFunc is not None:
-            return np.array([cachedSetFunc(p1, probWinPointP2) for p1 in probWinPointP1s])
+            return np.asarray(cachedSetFunc(probWinPointP1s, probWinPointP2))
         else:
-            return np.array([_probabilityP1WinsSetFromGameBoundary(initScore, playerServing, p1, probWinPointP2) for p1 in probWinPointP1s])
+            return _probabilityP1WinsSetFromGameBoundaryArray(initScore, playerServing, probWinPointP1s, probWinPointP2, gameProbs)
+
+def _asProbabilityArray(probWinPoints: Iterator[float],
+                        name         : str = "probWinPointP1s") -> npt.NDArray[np.floating]:
+    """
+    Helper function, materializes an iterable of probabilities that a player wins the point when
+    serving into a 1-D float array, checking all values at once with a single vectorized test.
+    'name' is the name of the argument being checked, as reported in the error message.
+
+    Raises:
+    -------
+    ValueError - if any value is not a number between 0 and 1
+    """
+    probs = np.asarray(list(probWinPoints))
+    if probs.ndim != 1 or probs.dtype.kind not in "biuf" or not np.all((probs >= 0) & (probs <= 1)):
+        raise ValueError(f"all {name} must be numbers between 0 and 1")
+    return probs.astype(float)
 
 def _probabilityP1WinsSetFromGameBoundary(initScore      : SetScore,
                                           playerServing  : Literal[1, 2],
@@ -197,15 +306,16 @@ def _probabilityP1WinsSetFromGameBoundary(initScore      : SetScore,
     The initial score being a "game boundary"  means that it cannot represent a moment
     in the middle of a game (e.g., 3-4, 15-30) or of a tiebreak (e.g., 6-6, 4-3).
     Valid examples (as number of games): 0-0, 3-4, 5-5, 6-6 (with no tiebreak points played yet).
-    This probability is calculated the following way:
-      + generate all possible score paths starting from the given initial score (at 'game' granularity)
-      + calculate the probability that Player1 wins the set along each path
-      + sum up all these probabilities
+    This probability is calculated by propagating the probability of reaching each score forward,
+    one game at a time, through the (gamesP1, gamesP2, playerServing) states that can follow the
+    initial score (see '_probabilityP1WinsSetFromGameProbs()'). There are only a few dozen such
+    states, while the number of score paths through them grows combinatorially.
     The calculation takes as input each player's probability of winning a point on their serve.
 
-    For efficiency, pre-generated score paths can be passed in via the 'paths' parameter, to avoid 
-    regenerating them on each call. If not provided, all possible score paths that start from the 
-    initial score are generated internally. 
+    Alternatively, score paths can be passed in via the 'paths' parameter, in which case the
+    probability is calculated the following way:
+      + calculate the probability that Player1 wins the set along each given path
+      + sum up all these probabilities
     
     Parameters:
     -----------
@@ -236,64 +346,163 @@ def _probabilityP1WinsSetFromGameBoundary(initScore      : SetScore,
             if path.scoreHistory[0].score != initScore:
                 raise ValueError("all paths must start with 'initScore'")
 
-    # Generate all possible paths starting from the initial score
-    # (unless we were given a pre-calculated list of paths)
+    # Without pre-calculated paths, propagate the score probabilities game by game
     # NOTE: if given a set of paths, we do not check whether they
     #       represent *all* the score paths that start with 'initScore'
-    allPaths = paths if paths else SetPath.generateAllPaths(initScore, playerServing)
-
-    # We need the probability of each player winning a tiebreak.
-    # We try to load this data from the cache first; if not available, 
-    # we fall back to calculating it directly.
-    tiebreakInitScore = TiebreakScore(0, 0, isSuper=False)
-    cachedTiebreakFunc_P1Serves = loadCachedFunction_Tiebreak(tiebreakInitScore, playerServing=1)
-    cachedTiebreakFunc_P2Serves = loadCachedFunction_Tiebreak(tiebreakInitScore, playerServing=2)
-    if cachedTiebreakFunc_P1Serves is not None and cachedTiebreakFunc_P2Serves is not None:
-        def probP1WinsTiebreakFunc(server, p1, p2):
-            return cachedTiebreakFunc_P1Serves(p1, p2) if server == 1 else cachedTiebreakFunc_P2Serves(p1, p2)
-    else:
-        def probP1WinsTiebreakFunc(server, p1, p2):
-            return probabilityP1WinsTiebreak(tiebreakInitScore, server, p1, p2)
+    if not paths:
+        return float(_probabilityP1WinsSetFromGameBoundaryArray(initScore, playerServing, [probWinPointP1], probWinPointP2)[0])
+
+    # We need the probability of Player1 winning a tiebreak, with either player serving first.
+    tiebreakInitScore  = TiebreakScore(0, 0, isSuper=False)
+    probP1WinsTiebreak = {server: float(_probabilityP1WinsTiebreakArray(tiebreakInitScore, server, probWinPointP1, probWinPointP2))
+                          for server in (1, 2)}
+
+    # The inputs were validated above, so the paths are priced without going through the
+    # checks of 'pathProbabilities()', from game-winning probabilities calculated only once.
+    probWinGameP1 = float(_probabilityServerHoldsGame(probWinPointP1))
+    probWinGameP2 = float(_probabilityServerHoldsGame(probWinPointP2))
+
+    # the probability of each path occurring
+    probPaths = _pathProbabilitiesFromGameProbs(paths, probWinGameP1, probWinGameP2)
+
+    # the probability that Player1 wins the set when it reaches the end of each path is:
+    #  1 if the path ends with P1 winning the set
+    #  0 if the path ends with P1 losing the set
+    #  the probability that Player1 wins a tiebreaker if the score is tied at 6-6
+    probWinAtEnd = np.empty(len(paths))
+    for i, path in enumerate(paths):
+        lastEntry = path.scoreHistory[-1]
+        lastScore = lastEntry.score
+        if lastScore.isTied:
+            probWinAtEnd[i] = probP1WinsTiebreak[lastEntry.playerServing]
+        else:
+            probWinAtEnd[i] = 1.0 if lastScore.winner == 1 else 0.0
 
     # add up the probability of winning the set along each path
-    probWinSet = 0.0
-    for path in allPaths:
+    return float(probPaths @ probWinAtEnd)
 
-        # the probability of this path occurring
-        probPath = pathProbability(path, probWinPointP1, probWinPointP2)
+def _probabilityP1WinsSetFromGameBoundaryArray(initScore      : SetScore,
+                                               playerServing  : Literal[1, 2],
+                                               probWinPointP1s: npt.ArrayLike,
+                                               probWinPointP2 : float,
+                                               gameProbs      : Optional[_GameProbabilities] = None) -> npt.NDArray[np.floating]:
+    """
+    Vectorized version of '_probabilityP1WinsSetFromGameBoundary()' (without pre-generated paths):
+    calculates the probability that Player1 wins the set from a given game boundary, for each given
+    probability that Player1 wins the point when serving. The inputs are assumed to be valid.
+
+    The game- and tiebreak-winning probabilities are calculated in closed form, once for all the
+    given values, then propagated through the set by '_probabilityP1WinsSetFromGameProbs()'.
+    No point-level recursion (nor cached interpolator) is needed. If these probabilities were
+    already calculated for the given values, they can be passed in via 'gameProbs'.
+    """
+    probWinPointP1s = np.asarray(probWinPointP1s, dtype=float)
 
-        # how did this path end?
-        lastEntry = path.scoreHistory[-1]
-        lastScore = lastEntry.score
-        P1won     = lastScore.winner == 1
-        isTied    = lastScore.isTied
-
-        # the probability that Player1 wins the set when it reaches the end of this path is:
-        #  1 if the path ends with P1 winning the set
-        #  0 if the path ends with P1 losing the set
-        #  the probability that Player1 wins a tiebreaker if the score is tied at 6-6
-        if isTied:
-            tiebreakServer = lastEntry.playerServing
-            probP1WinsTB   = probP1WinsTiebreakFunc(tiebreakServer, probWinPointP1, probWinPointP2)
-            probWinPath    = probPath * probP1WinsTB
-        else:
-            probWinPath = probPath * (1.0 if P1won else 0.0)
+    # a set that is already decided
+    if initScore.isFinal:
+        return np.full(probWinPointP1s.shape, 1.0 if initScore.winner == 1 else 0.0)
 
-        probWinSet += probWinPath
+    if gameProbs is None:
+        gameProbs = _gameProbabilities(probWinPointP1s, probWinPointP2)
+
+    gamesP1, gamesP2 = initScore.games(pov=1)
+    return _probabilityP1WinsSetFromGameProbs(gamesP1, gamesP2, playerServing, initScore._matchFormat.setLength, *gameProbs)
+
+def _gameProbabilities(probWinPointP1s: npt.ArrayLike,
+                       probWinPointP2 : float) -> _GameProbabilities:
+    """
+    Calculates the probability of each player holding serve (from 0-0, so it does not matter
+    which player serves), and of Player1 winning a tiebreak with either player serving first.
+    All of them are calculated in closed form, for all the given values at once.
+    """
+    probWinPointP1s   = np.asarray(probWinPointP1s, dtype=float)
+    tiebreakInitScore = TiebreakScore(0, 0, isSuper=False)
+    return _GameProbabilities(_probabilityServerHoldsGame(probWinPointP1s),
+                              _probabilityServerHoldsGame(probWinPointP2),
+                              _probabilityP1WinsTiebreakArray(tiebreakInitScore, 1, probWinPointP1s, probWinPointP2),
+                              _probabilityP1WinsTiebreakArray(tiebreakInitScore, 2, probWinPointP1s, probWinPointP2))
+
+def _probabilityServerHoldsGame(probWinPoint: npt.ArrayLike) -> npt.NDArray[np.floating]:
+    """
+    Closed-form probability that the player serving wins a game played from 0-0 (advantage
+    scoring), vectorized over the probability of winning a point on serve. With q = 1-p:
+        P(hold) = p^4 * (1 + 4q + 10q^2) + 20 p^3 q^3 * p^2 / (1 - 2pq)
+    The first term adds up the ways to win the game before deuce (to love, 15 or 30); the second
+    one is the probability of reaching deuce times the probability of winning from deuce.
+    """
+    p = np.asarray(probWinPoint, dtype=float)
+    q = 1 - p
+    probHold: npt.NDArray[np.floating] = p**4 * (1 + 4*q + 10*q**2) + 20 * p**3 * q**3 * p**2 / (1 - 2*p*q)
+    return probHold
+
+def _probabilityP1WinsSetFromGameProbs(gamesP1             : int,
+                                       gamesP2             : int,
+                                       playerServing       : Literal[1, 2],
+                                       setLength           : int,
+                                       probHoldP1          : npt.ArrayLike,
+                                       probHoldP2          : npt.ArrayLike,
+                                       probTiebreakP1Serves: npt.ArrayLike,
+                                       probTiebreakP2Serves: npt.ArrayLike) -> npt.NDArray[np.floating]:
+    """
+    Calculates the probability that Player1 wins the set from a game boundary which is not a final
+    score, given the game-level probabilities. The probabilities may be scalars or arrays (which
+    are broadcast against each other); all the arithmetic is element-wise.
+
+    We keep a table P[(gamesP1, gamesP2, server)] of the probability of reaching each score, with
+    'server' the player serving the next game. Every game adds one to the total number of games,
+    so the table is built one game at a time: each score that is not terminal passes its probability
+    on to the two scores that follow it. A score is terminal when
+      + one player won the set (Player1 wins with the probability of reaching it), or
+      + the set is tied (e.g., 6-6), where Player1 wins with the probability of winning the tiebreak
+        with 'server' serving first.
+
+    Parameters:
+    -----------
+    gamesP1, gamesP2     - the initial number of games won by each player
+    playerServing        - which player is serving the next game (1 or 2)
+    setLength            - number of games needed to win the set
+    probHoldP1           - probability that Player1 wins a game when serving
+    probHoldP2           - probability that Player2 wins a game when serving
+    probTiebreakP1Serves - probability that Player1 wins a tiebreak in which Player1 serves first
+    probTiebreakP2Serves - probability that Player1 wins a tiebreak in which Player2 serves first
+
+    Returns:
+    --------
+    An array of probabilities that Player1 wins the set.
+    """
+    probP1WinsGame = {1: np.asarray(probHoldP1, dtype=float), 2: 1 - np.asarray(probHoldP2, dtype=float)}
+    probTiebreak   = {1: np.asarray(probTiebreakP1Serves, dtype=float), 2: np.asarray(probTiebreakP2Serves, dtype=float)}
+
+    probWinSet: npt.NDArray[np.floating] = np.zeros(np.broadcast(probP1WinsGame[1], probP1WinsGame[2],
+                                                                 probTiebreak[1], probTiebreak[2]).shape)
+    reach: dict[tuple[int, int, int], float | npt.NDArray[np.floating]] = {(gamesP1, gamesP2, playerServing): 1.0}
+    while reach:
+        reachNext: dict[tuple[int, int, int], float | npt.NDArray[np.floating]] = {}
+        for (g1, g2, server), probReach in reach.items():
+            if g1 >= setLength and g1 - g2 >= 2:       # Player1 won the set
+                probWinSet = probWinSet + probReach
+            elif g2 >= setLength and g2 - g1 >= 2:     # Player2 won the set
+                continue
+            elif g1 == g2 >= setLength:                # tied, decided by a tiebreak
+                probWinSet = probWinSet + probReach * probTiebreak[server]
+            else:
+                p = probP1WinsGame[server]
+                reachNext[g1 + 1, g2, 3 - server] = reachNext.get((g1 + 1, g2, 3 - server), 0.0) + probReach * p
+                reachNext[g1, g2 + 1, 3 - server] = reachNext.get((g1, g2 + 1, 3 - server), 0.0) + probReach * (1 - p)
+        reach = reachNext
 
     return probWinSet
 
 def _loadCachedFunction(initScore    : SetScore,
-                       playerServing: Literal[1, 2]) -> Optional[Callable[[float, float], float]]:
+                       playerServing: Literal[1, 2]) -> Optional[Callable[[npt.ArrayLike, float], float | npt.NDArray[np.floating]]]:
     """
     Loads a cached version of '_probabilityP1WinsSetFromGameBoundary()'.
 
-    Evaluating '_probabilityP1WinsSetFromGameBoundary(...)' can be expensive, especially when called
-    repeatedly, because it iterates over all possible score progressions. To avoid repeating this
-    computation, the script 'scripts/cache-prob-win-set.py' pre-computes and caches the Player1's
-    set-winning probability for every possible starting score and across a grid of point-winning
-    probabilities. A 2-D interpolator is constructed from this grid and saved as a callable, which
-    is loaded and returned by this function.
+    Evaluating '_probabilityP1WinsSetFromGameBoundary(...)' repeatedly can add up. To avoid repeating
+    this computation, the script 'scripts/cache-prob-win-set.py' pre-computes Player1's set-winning
+    probability for every possible starting score and across a 2-D grid of point-winning probabilities,
+    and saves them as a single table in a '.npy' file. The table is memory-mapped once, and the returned
+    callable interpolates the table of the given score bilinearly between the four nearest grid points.
 
     The initial score must represent a "game boundary", meaning that it cannot represent a moment in 
     the middle of a game (e.g., 3-4, 15-30) or of a tiebreak (e.g., 6-6, 4-3).
@@ -306,9 +515,10 @@ def _loadCachedFunction(initScore    : SetScore,
 
     Returns:
     --------
-    A callable that takes two float arguments (the probability that P1 wins a point when serving,
+    A callable that takes two arguments (the probability that P1 wins a point when serving,
     and the probability that P2 wins a point when serving) and returns the probability that P1
-    wins the set from the given initial score.
+    wins the set from the given initial score. The first argument can also be an array, in which
+    case an array with one probability per value is returned.
     Returns None if the cached function is not available.
 
     Example:
@@ -325,18 +535,40 @@ def _loadCachedFunction(initScore    : SetScore,
 
     gamesP1, gamesP2 = initScore.games(pov=1)
 
-    # Build the filename based on the score
-    fileName = f"prob_win_set_P{playerServing}_{gamesP1}{gamesP2}.pkl"
-
-    # Build the filepath
-    DIRPATH = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'data-cache')
-    filePath = os.path.join(DIRPATH, fileName)
+    # Look up the table for this score and player serving (scores the table does not cover are NaN)
+    table = _loadCachedTable()
+    if table is None or gamesP1 >= table.shape[1] or gamesP2 >= table.shape[2]:
+        return None
+    probWinSet = table[playerServing - 1, gamesP1, gamesP2]
+    if np.isnan(probWinSet[0, 0]):
+        return None
+    lastIndex = probWinSet.shape[0] - 1
+
+    def wrapper(p1: npt.ArrayLike, p2: float) -> float | npt.NDArray[np.floating]:
+        # position on the (evenly spaced) grid: the cell's lower corner, and the offset within the cell
+        x, y = np.asarray(p1, dtype=float) * lastIndex, float(p2) * lastIndex
+        i, j = np.clip(np.floor(x).astype(int), 0, lastIndex - 1), min(max(int(y), 0), lastIndex - 1)
+        tx, ty = x - i, y - j
+        result = (1 - tx) * ((1 - ty) * probWinSet[i, j]     + ty * probWinSet[i, j + 1]) + \
+                      tx  * ((1 - ty) * probWinSet[i + 1, j] + ty * probWinSet[i + 1, j + 1])
+        return float(result) if np.ndim(result) == 0 else result.astype(float)
+    return wrapper
+
+@lru_cache(maxsize=1)
+def _loadCachedTable() -> Optional[npt.NDArray[np.floating]]:
+    """
+    Memory-maps the table of set-winning probabilities saved by 'scripts/cache-prob-win-set.py'.
+    The table is indexed by [player serving - 1, Player1 games, Player2 games, P1 probability, P2 probability],
+    the last two axes being the same evenly spaced grid over [0, 1].
 
+    Returns:
+    --------
+    The table, or None if it is not available.
+    """
+    DIRPATH  = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'data-cache')
+    filePath = os.path.join(DIRPATH, "prob_win_set.npy")
     try:
-        with open(filePath, "rb") as fh:
-            probP1WinSetInterpFunction = pickle.load(fh)
-            def wrapper(p1: float, p2: float) -> float:
-                return probP1WinSetInterpFunction(p1, p2).item()
-            return wrapper
+        table: npt.NDArray[np.floating] = np.load(filePath, mmap_mode='r')
     except Exception:
         return None
+    return table
@@ -8,9 +8,12 @@ probabilityP1WinsTiebreak - probability that P1 wins the tiebreak from a given s
 loadCachedFunction        - loads a cached version of probabilityP1WinsTiebreak
 """
 
+import numpy as np
+import numpy.typing as npt
 import os, pickle
 from copy import deepcopy
-from typing import Callable, Literal, Optional
+from functools import lru_cache
+from typing import Callable, Literal, Optional, Union
 from tennis_lab.paths.tiebreak_path import TiebreakPath
 from tennis_lab.core.tiebreak_score import TiebreakScore
 
@@ -131,6 +134,73 @@ def probabilityP1WinsTiebreak(initScore      : TiebreakScore,
 
     return probWinTiebreak
 
+def _probabilityP1WinsTiebreakArray(initScore      : TiebreakScore,
+                                    playerServing  : Literal[1, 2],
+                                    probWinPointP1s: npt.ArrayLike,
+                                    probWinPointP2 : float) -> npt.NDArray[np.floating]:
+    """
+    Vectorized version of 'probabilityP1WinsTiebreak()': calculates the probability that Player1
+    wins the tiebreak from a given score, for an array of probabilities that Player1 wins the point
+    when serving. The inputs are assumed to be valid.
+
+    Instead of enumerating the score paths, this uses backward induction on the score lattice,
+    each score being evaluated once for the whole array: the probability of winning from a score
+    is the probability that Player1 wins the next point times the probability of winning from the
+    score reached if Player1 wins it, plus the complementary term. At deuce (6-6 or 9-9) we use the same
+    closed-form formula as '_probabilityP1WinsTie()'.
+
+    Parameters:
+    -----------
+    initScore       - the initial score in the tiebreak
+    playerServing   - which player is serving the next point (1 or 2)
+    probWinPointP1s - array of probabilities that Player1 wins the point when serving
+    probWinPointP2  - probability that Player2 wins the point when serving
+
+    Returns:
+    --------
+    An array of probabilities that Player1 wins the tiebreak, one for each value in probWinPointP1s.
+    """
+    p1 = np.asarray(probWinPointP1s, dtype=float)
+    p2 = float(probWinPointP2)
+
+    # a tiebreak that is already decided
+    if initScore.isFinal:
+        return np.full(p1.shape, 1.0 if initScore.winner == 1 else 0.0)
+
+    pointsToWin                = initScore.pointsToWin
+    pointsP1Init, pointsP2Init = initScore.asPoints(pov=1)
+
+    # The first server serves one point, then serve alternates every two points. Relative
+    # to the server of the first point, the server switches on points 1-2, 5-6, 9-10, ...
+    playerReceiving: Literal[1, 2] = 2 if playerServing == 1 else 1
+    def server(pointsPlayed: int) -> Literal[1, 2]:
+        switched = ((pointsPlayed + 1) // 2) % 2 != ((pointsP1Init + pointsP2Init + 1) // 2) % 2
+        return playerReceiving if switched else playerServing
+
+    # probability that Player1 wins the next point, by who serves it
+    probP1WinsPoint: dict[int, Union[float, npt.NDArray[np.floating]]] = {1: p1, 2: 1 - p2}
+
+    # closed-form probability of winning from deuce (see '_probabilityP1WinsTie()')
+    num   = p1 * (1 - p2)
+    den   = 1 - p1 * p2 - (1 - p1) * (1 - p2)
+    deuce = np.divide(num, den, out=np.full(p1.shape, 0.5), where=den > 1e-10)
+
+    values = {}
+    def value(i: int, j: int) -> npt.NDArray[np.floating]:
+        if (i, j) not in values:
+            if i >= pointsToWin and i - j >= 2:
+                values[i, j] = np.ones_like(p1)
+            elif j >= pointsToWin and j - i >= 2:
+                values[i, j] = np.zeros_like(p1)
+            elif i == j >= pointsToWin - 1:
+                values[i, j] = deuce
+            else:
+                p = probP1WinsPoint[server(i + j)]
+                values[i, j] = p * value(i+1, j) + (1 - p) * value(i, j+1)
+        return values[i, j]
+
+    return value(pointsP1Init, pointsP2Init)
+
 def _probabilityP1WinsTie(probWinPointP1: float,
                           probWinPointP2: float) -> float:
     """
@@ -215,15 +285,29 @@ def loadCachedFunction(initScore    : TiebreakScore,
     # Build the filename based on the score
     fileName = f"prob_win_tbreak{pointsToWin}_P{playerServing}_{pointsP1}{pointsP2}.pkl"
 
-    # Build the filepath
-    DIRPATH = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'data-cache')
-    filePath = os.path.join(DIRPATH, fileName)
+    # Load the interpolator (once per file, see '_loadInterpolator()')
+    probP1WinTBreakInterpFunction = _loadInterpolator(fileName)
+    if probP1WinTBreakInterpFunction is None:
+        return None
+    def wrapper(p1: float, p2: float) -> float:
+        return probP1WinTBreakInterpFunction(p1, p2).item()
+    return wrapper
+
+@lru_cache(maxsize=None)
+def _loadInterpolator(fileName: str) -> Optional[Callable]:
+    """
+    Unpickles an interpolator of tiebreak-winning probabilities saved by 'scripts/cache-prob-win-tiebreak.py'.
+    The result (including a missing file) is cached, so each file is read at most once per process.
 
+    Returns:
+    --------
+    The interpolator, or None if it is not available.
+    """
+    DIRPATH  = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'data-cache')
+    filePath = os.path.join(DIRPATH, fileName)
     try:
         with open(filePath, "rb") as fh:
-            probP1WinTBreakInterpFunction = pickle.load(fh)
-            def wrapper(p1: float, p2: float) -> float:
-                return probP1WinTBreakInterpFunction(p1, p2).item()
-            return wrapper
+            interpolator: Callable = pickle.load(fh)
     except Exception:
         return None
+    return interpolator
@@ -0,0 +1,66 @@
+"""Shared fixtures for the core tests."""
+
+import pytest
+from functools import lru_cache
+from tennis_lab.core.set          import Set
+from tennis_lab.core.set_score    import SetScore
+from tennis_lab.core.match_format import MatchFormat, SetEnding
+
+
+# Match formats shared by the whole test session (MatchFormat instances are never mutated)
+@pytest.fixture(scope="session")
+def default_format():
+    return MatchFormat(bestOfSets=3)
+
+@pytest.fixture(scope="session")
+def no_ad_format():
+    return MatchFormat(bestOfSets=3, noAdRule=True)
+
+@pytest.fixture(scope="session")
+def cap_format():
+    return MatchFormat(bestOfSets=3, capPoints=True)
+
+@pytest.fixture(scope="session")
+def no_tiebreak_format():
+    return MatchFormat(bestOfSets=3, setEnding=SetEnding.ADVANTAGE)
+
+@pytest.fixture(scope="session")
+def short_set_format():
+    return MatchFormat(bestOfSets=3, setLength=4)
+
+@pytest.fixture(scope="session")
+def final_set_advantage_format():
+    return MatchFormat(bestOfSets=3, setEnding=SetEnding.TIEBREAK, finalSetEnding=SetEnding.ADVANTAGE)
+
+@pytest.fixture(scope="session")
+def final_set_supertiebreak_format():
+    return MatchFormat(bestOfSets=3, setEnding=SetEnding.TIEBREAK, finalSetEnding=SetEnding.SUPERTIEBREAK)
+
+
+@pytest.fixture(scope="session")
+def readonly_set_score():
+    """
+    Builder of SetScore instances shared across tests: SetScore(gamesP1, gamesP2, isFinalSet, matchFormat).
+    Read-only: tests using it must not record points on (or otherwise modify) the returned score.
+    """
+    @lru_cache(maxsize=256)
+    def _readonly_set_score(gamesP1, gamesP2, isFinalSet, matchFormat):
+        return SetScore(gamesP1, gamesP2, isFinalSet, matchFormat)
+    return _readonly_set_score
+
+
+@pytest.fixture
+def make_tiebreak_set():
+    """Factory building a fresh Set which was played up to 6-6 (tiebreak next; default format: best of 3)."""
+    def _make_tiebreak_set(playerServing=1, isFinalSet=False, matchFormat=None):
+        if matchFormat is None:
+            matchFormat = MatchFormat(bestOfSets=3)
+        s = Set(playerServing=playerServing, isFinalSet=isFinalSet, matchFormat=matchFormat)
+        # each player holds serve for 12 games
+        server = playerServing
+        for _ in range(12):
+            s.recordPoints([server] * 4)
+            server = 3 - server
+        assert s.score.games(1) == (6, 6)
+        return s
+    return _make_tiebreak_set
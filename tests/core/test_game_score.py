@@ -172,6 +172,15 @@ class TestRecordPoint:
         score.recordPoint(2)  # Back to deuce, but NOT capped
         assert score.asPoints(1) == (4, 4)
 
+    def test_record_point_updates_winner(self):
+        # the stored winner follows the score through deuce, advantage and the final point
+        score = GameScore(3, 3, NO_CAP_FORMAT)
+        for pointWinner, expectedWinner in [(1, None), (2, None), (2, None), (2, 2)]:
+            assert not score.isFinal
+            score.recordPoint(pointWinner)
+            assert score.winner == expectedWinner
+        assert score.isFinal
+
 
 class TestAsPoints:
     """Tests for asPoints method."""
@@ -1,5 +1,6 @@
 """Tests for the Match class."""
 
+import numpy as np
 import pytest
 from tennis_lab.core.match         import Match
 from tennis_lab.core.match_score   import MatchScore
@@ -144,6 +145,11 @@ class TestMatchRecordPoints:
         m.recordPoints([1, 2, 1, 2])
         assert m.pointHistory == [1, 2, 1, 2]
 
+    def test_record_points_numpy_array(self):
+        m = Match(playerServing=1, matchFormat=DEFAULT_FORMAT)
+        m.recordPoints(np.array([1, 2, 1, 2], dtype=np.int8))
+        assert m.pointHistory == [1, 2, 1, 2]
+
     def test_record_points_win_game(self):
         m = Match(playerServing=1, matchFormat=DEFAULT_FORMAT)
         m.recordPoints([1, 1, 1, 1])
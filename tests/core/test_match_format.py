@@ -0,0 +1,58 @@
+"""Tests for the MatchFormat class."""
+
+import pickle
+import pytest
+from copy import copy, deepcopy
+from tennis_lab.core.match_format import MatchFormat, SetEnding
+
+
+class TestMatchFormatInterning:
+    """Tests for the interning of MatchFormat instances."""
+
+    def test_same_parameters_same_instance(self):
+        assert MatchFormat(bestOfSets=3) is MatchFormat(bestOfSets=3)
+        assert MatchFormat(3) is MatchFormat(bestOfSets=3, setEnding=SetEnding.TIEBREAK)
+
+    def test_different_parameters_different_instances(self):
+        assert MatchFormat(bestOfSets=3) is not MatchFormat(bestOfSets=5)
+        assert MatchFormat(bestOfSets=3) is not MatchFormat(bestOfSets=3, noAdRule=True)
+        assert MatchFormat(bestOfSets=3) != MatchFormat(bestOfSets=3, noAdRule=True)
+
+    def test_equal_and_same_hash(self):
+        assert MatchFormat(bestOfSets=5) == MatchFormat(bestOfSets=5)
+        assert hash(MatchFormat(bestOfSets=5)) == hash(MatchFormat(bestOfSets=5))
+
+    def test_copies_are_shared(self):
+        matchFormat = MatchFormat(bestOfSets=3, setLength=4)
+        assert copy(matchFormat) is matchFormat
+        assert deepcopy(matchFormat) is matchFormat
+        assert pickle.loads(pickle.dumps(matchFormat)) is matchFormat
+
+    def test_instances_are_immutable(self):
+        matchFormat = MatchFormat(bestOfSets=3)
+        with pytest.raises(AttributeError):
+            matchFormat.noAdRule = True
+        with pytest.raises(AttributeError):
+            del matchFormat.setLength
+        assert MatchFormat(bestOfSets=3).noAdRule is False
+        assert hash(matchFormat) == hash(MatchFormat(bestOfSets=3, noAdRule=False))
+
+    def test_invalid_inputs_still_rejected(self):
+        MatchFormat(noAdRule=True)
+        with pytest.raises(ValueError):
+            MatchFormat(noAdRule=1)     # 1 == True, but is not a boolean
+        with pytest.raises(ValueError):
+            MatchFormat(bestOfSets=[3]) # unhashable
+
+
+class TestMatchFormatAsDict:
+    """Tests for asDict/fromDict."""
+
+    def test_round_trip(self):
+        matchFormat = MatchFormat(bestOfSets=5, finalSetEnding=SetEnding.SUPERTIEBREAK, noAdRule=True)
+        assert matchFormat.asDict()["finalSetEnding"] == "supertiebreak"
+        assert MatchFormat.fromDict(matchFormat.asDict()) is matchFormat
+
+    def test_from_dict_invalid(self):
+        with pytest.raises(ValueError):
+            MatchFormat.fromDict({"bestOfSets": 3})
@@ -1,6 +1,8 @@
 """Tests for the Set class."""
 
+import numpy as np
 import pytest
+from array import array
 from tennis_lab.core.set           import Set
 from tennis_lab.core.set_score     import SetScore
 from tennis_lab.core.game_score    import GameScore
@@ -11,24 +13,17 @@ from tennis_lab.core.match_format  import MatchFormat, SetEnding
 DEFAULT_FORMAT = MatchFormat(bestOfSets=3)
 NO_AD_FORMAT   = MatchFormat(bestOfSets=3, noAdRule=True)
 
+# Point sequences: a love game / a 7-0 tiebreak won by either player
+WIN_P1 = (1,) * 4
+WIN_P2 = (2,) * 4
+TB_P1  = (1,) * 7
+TB_P2  = (2,) * 7
+
 
 # Helper function: points needed to win a game (server wins all points)
 def win_game(s: Set, player: int):
     """Record 4 points for the given player to win a game."""
-    s.recordPoints([player] * 4)
-
-
-# Helper function: points to get to 6-6 (tiebreak)
-def get_to_tiebreak(s: Set):
-    """Play games until the set reaches 6-6."""
-    # P1 wins games 1, 3, 5, 7, 9, 11 (when serving)
-    # P2 wins games 2, 4, 6, 8, 10, 12 (when serving)
-    for game_num in range(12):
-        if game_num % 2 == 0:
-            win_game(s, 1)
-        else:
-            win_game(s, 2)
-    assert s.score.games(1) == (6, 6)
+    s.recordPoints(WIN_P1 if player == 1 else WIN_P2)
 
 
 class TestSetInit:
@@ -38,11 +33,12 @@ class TestSetInit:
         s = Set(playerServing=1, isFinalSet=False, matchFormat=DEFAULT_FORMAT)
         assert s.servesNext == 1
         assert s.score.games(1) == (0, 0)
-        assert s.gameHistory == []
+        assert not s.gameHistory
         assert not s.isOver
         assert s.winner is None
         assert s.currentGame is not None
         assert s.tiebreaker is None
+        assert not s._atTiebreak
 
     def test_init_player2_serves(self):
         s = Set(playerServing=2, isFinalSet=False, matchFormat=DEFAULT_FORMAT)
@@ -75,6 +71,21 @@ class TestSetInit:
         with pytest.raises(ValueError):
             Set(playerServing=1, isFinalSet=False, initScore="invalid", matchFormat=DEFAULT_FORMAT)
 
+    def test_init_invalid_matchFormat_type(self):
+        with pytest.raises(ValueError):
+            Set(playerServing=1, isFinalSet=False, matchFormat="best of 3")
+
+    def test_init_matchFormat_lookalike_rejected(self):
+        class FakeFormat:
+            _validated = True
+        with pytest.raises(ValueError):
+            Set(playerServing=1, isFinalSet=False, matchFormat=FakeFormat())
+
+    def test_init_equal_matchFormat_instance(self):
+        init_score = SetScore(3, 2, isFinalSet=False, matchFormat=DEFAULT_FORMAT)
+        s = Set(playerServing=1, isFinalSet=False, initScore=init_score, matchFormat=MatchFormat(bestOfSets=3))
+        assert s.score.games(1) == (3, 2)
+
     def test_init_missing_matchFormat(self):
         with pytest.raises(ValueError):
             Set(playerServing=1, isFinalSet=False)
@@ -126,11 +137,27 @@ class TestSetRecordPoint:
         for _ in range(6):
             win_game(s, 1)
         assert s.isOver
-        initial_history = s.pointHistory.copy()
+        len_before = len(s.pointHistory)
 
         # Additional points should be ignored
         s.recordPoint(2)
-        assert s.pointHistory == initial_history
+        assert len(s.pointHistory) == len_before
+
+    def test_record_point_through_tiebreak(self, make_tiebreak_set):
+        s = make_tiebreak_set(playerServing=1, matchFormat=DEFAULT_FORMAT)
+        for point in TB_P2:
+            s.recordPoint(point)
+        assert s.isOver
+        assert s.score.games(1) == (6, 7)
+        assert s.pointHistory[-7:] == list(TB_P2)
+
+    def test_record_point_invalid_state(self):
+        s = Set(playerServing=1, isFinalSet=False, matchFormat=DEFAULT_FORMAT)
+        s.currentGame = None
+        with pytest.raises(RuntimeError):
+            s.recordPoint(1)
+        with pytest.raises(RuntimeError):
+            s.recordPoints([1])
 
 
 class TestSetRecordPoints:
@@ -141,6 +168,22 @@ class TestSetRecordPoints:
         s.recordPoints([1, 2, 1, 2])
         assert s.pointHistory == [1, 2, 1, 2]
 
+    @pytest.mark.parametrize("buffer", [
+        array('B', [1, 2, 1, 2]),
+        np.array([1, 2, 1, 2], dtype=np.int8),
+        memoryview(np.array([1, 2, 1, 2], dtype=np.int8)),
+    ])
+    def test_record_points_buffer(self, buffer):
+        s = Set(playerServing=1, isFinalSet=False, matchFormat=DEFAULT_FORMAT)
+        s.recordPoints(buffer)
+        assert s.pointHistory == [1, 2, 1, 2]
+        assert s.currentGame.pointHistory == [1, 2, 1, 2]
+
+    def test_record_points_buffer_invalid(self):
+        s = Set(playerServing=1, isFinalSet=False, matchFormat=DEFAULT_FORMAT)
+        with pytest.raises(ValueError):
+            s.recordPoints(np.array([1, 0], dtype=np.int8))
+
     def test_record_points_win_game(self):
         s = Set(playerServing=1, isFinalSet=False, matchFormat=DEFAULT_FORMAT)
         s.recordPoints([1, 1, 1, 1])
@@ -151,10 +194,30 @@ class TestSetRecordPoints:
         s = Set(playerServing=1, isFinalSet=False, matchFormat=DEFAULT_FORMAT)
         # P1 wins 6 games straight (24 points total)
         for _ in range(6):
-            s.recordPoints([1, 1, 1, 1])
+            s.recordPoints(WIN_P1)
         assert s.isOver
         assert s.winner == 1
 
+    def test_record_points_past_set_end_ignored(self):
+        s = Set(playerServing=1, isFinalSet=False, matchFormat=DEFAULT_FORMAT)
+        s.recordPoints(WIN_P1 * 6 + WIN_P2)
+        assert s.isOver
+        assert s.score.games(1) == (6, 0)
+        assert len(s.pointHistory) == 24
+
+    def test_record_points_invalid(self):
+        s = Set(playerServing=1, isFinalSet=False, matchFormat=DEFAULT_FORMAT)
+        with pytest.raises(ValueError):
+            s.recordPoints([1, 2, 3])
+        assert s.pointHistory == [1, 2]
+
+    def test_record_points_through_tiebreak(self):
+        s = Set(playerServing=1, isFinalSet=False, matchFormat=DEFAULT_FORMAT)
+        s.recordPoints((WIN_P1 + WIN_P2) * 6 + TB_P2)
+        assert s.isOver
+        assert s.winner == 2
+        assert s.score.games(1) == (6, 7)
+
 
 class TestSetProperties:
     """Tests for Set properties."""
@@ -190,9 +253,8 @@ class TestSetProperties:
             win_game(s, 2)
         assert s.winner == 2
 
-    def test_is_tied_at_6_6(self):
-        s = Set(playerServing=1, isFinalSet=False, matchFormat=DEFAULT_FORMAT)
-        get_to_tiebreak(s)
+    def test_is_tied_at_6_6(self, make_tiebreak_set):
+        s = make_tiebreak_set(playerServing=1, matchFormat=DEFAULT_FORMAT)
         assert s.isTied
 
     def test_is_not_tied_at_5_5(self):
@@ -244,13 +306,14 @@ class TestSetGameHistory:
 
     def test_game_history_empty_initially(self):
         s = Set(playerServing=1, isFinalSet=False, matchFormat=DEFAULT_FORMAT)
-        assert s.gameHistory == []
+        assert not s.gameHistory
+        assert s.gameWinners == array('B')
 
     def test_game_history_after_one_game(self):
         s = Set(playerServing=1, isFinalSet=False, matchFormat=DEFAULT_FORMAT)
         win_game(s, 1)
         assert len(s.gameHistory) == 1
-        assert s.gameHistory[0].winner == 1
+        assert s.gameWinners[0] == 1
 
     def test_game_history_after_multiple_games(self):
         s = Set(playerServing=1, isFinalSet=False, matchFormat=DEFAULT_FORMAT)
@@ -258,9 +321,8 @@ class TestSetGameHistory:
         win_game(s, 2)
         win_game(s, 1)
         assert len(s.gameHistory) == 3
-        assert s.gameHistory[0].winner == 1
-        assert s.gameHistory[1].winner == 2
-        assert s.gameHistory[2].winner == 1
+        assert s.gameWinners == array('B', [1, 2, 1])
+        assert [game.winner for game in s.gameHistory] == s.gameWinners.tolist()
 
 
 class TestSetPointHistory:
@@ -269,6 +331,7 @@ class TestSetPointHistory:
     def test_point_history_empty_initially(self):
         s = Set(playerServing=1, isFinalSet=False, matchFormat=DEFAULT_FORMAT)
         assert s.pointHistory == []
+        assert isinstance(s.pointHistory, list)
 
     def test_point_history_within_game(self):
         s = Set(playerServing=1, isFinalSet=False, matchFormat=DEFAULT_FORMAT)
@@ -305,33 +368,32 @@ class TestSetTotalPoints:
 class TestSetTiebreak:
     """Tests for tiebreak scenarios."""
 
-    def test_tiebreak_starts_at_6_6(self):
-        s = Set(playerServing=1, isFinalSet=False, matchFormat=DEFAULT_FORMAT)
-        get_to_tiebreak(s)
+    def test_tiebreak_starts_at_6_6(self, make_tiebreak_set):
+        s = make_tiebreak_set(playerServing=1, matchFormat=DEFAULT_FORMAT)
         assert s.tiebreaker is not None
         assert s.currentGame is None
+        assert s._atTiebreak
 
-    def test_tiebreak_p1_wins(self):
-        s = Set(playerServing=1, isFinalSet=False, matchFormat=DEFAULT_FORMAT)
-        get_to_tiebreak(s)
+    def test_tiebreak_p1_wins(self, make_tiebreak_set):
+        s = make_tiebreak_set(playerServing=1, matchFormat=DEFAULT_FORMAT)
         # P1 wins tiebreak 7-0
-        s.recordPoints([1] * 7)
+        s.recordPoints(TB_P1)
         assert s.isOver
+        assert s.tiebreaker is None
+        assert not s._atTiebreak
         assert s.winner == 1
         assert s.score.games(1) == (7, 6)
 
-    def test_tiebreak_p2_wins(self):
-        s = Set(playerServing=1, isFinalSet=False, matchFormat=DEFAULT_FORMAT)
-        get_to_tiebreak(s)
+    def test_tiebreak_p2_wins(self, make_tiebreak_set):
+        s = make_tiebreak_set(playerServing=1, matchFormat=DEFAULT_FORMAT)
         # P2 wins tiebreak 7-0
-        s.recordPoints([2] * 7)
+        s.recordPoints(TB_P2)
         assert s.isOver
         assert s.winner == 2
         assert s.score.games(1) == (6, 7)
 
-    def test_tiebreak_extended(self):
-        s = Set(playerServing=1, isFinalSet=False, matchFormat=DEFAULT_FORMAT)
-        get_to_tiebreak(s)
+    def test_tiebreak_extended(self, make_tiebreak_set):
+        s = make_tiebreak_set(playerServing=1, matchFormat=DEFAULT_FORMAT)
         # Get to 6-6 in tiebreak
         s.recordPoints([1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2])
         assert not s.isOver
@@ -340,12 +402,12 @@ class TestSetTiebreak:
         assert s.isOver
         assert s.winner == 1
 
-    def test_tiebreak_in_game_history(self):
-        s = Set(playerServing=1, isFinalSet=False, matchFormat=DEFAULT_FORMAT)
-        get_to_tiebreak(s)
-        s.recordPoints([1] * 7)
+    def test_tiebreak_in_game_history(self, make_tiebreak_set):
+        s = make_tiebreak_set(playerServing=1, matchFormat=DEFAULT_FORMAT)
+        s.recordPoints(TB_P1)
         # Tiebreak should be last item in game history
         assert len(s.gameHistory) == 13  # 12 games + 1 tiebreak
+        assert s.gameWinners[-1] == 1
         from tennis_lab.core.tiebreak import Tiebreak
         assert isinstance(s.gameHistory[-1], Tiebreak)
 
@@ -384,10 +446,9 @@ class TestSetWinConditions:
         assert s.isOver
         assert s.score.games(1) == (7, 5)
 
-    def test_win_7_6_tiebreak(self):
-        s = Set(playerServing=1, isFinalSet=False, matchFormat=DEFAULT_FORMAT)
-        get_to_tiebreak(s)
-        s.recordPoints([1] * 7)
+    def test_win_7_6_tiebreak(self, make_tiebreak_set):
+        s = make_tiebreak_set(playerServing=1, matchFormat=DEFAULT_FORMAT)
+        s.recordPoints(TB_P1)
         assert s.isOver
         assert s.score.games(1) == (7, 6)
 
@@ -415,10 +476,9 @@ class TestSetStr:
             win_game(s, 1)
         assert "Player1 wins set: 6-0" == str(s)
 
-    def test_str_tiebreak_win(self):
-        s = Set(playerServing=1, isFinalSet=False, matchFormat=DEFAULT_FORMAT)
-        get_to_tiebreak(s)
-        s.recordPoints([1] * 7)
+    def test_str_tiebreak_win(self, make_tiebreak_set):
+        s = make_tiebreak_set(playerServing=1, matchFormat=DEFAULT_FORMAT)
+        s.recordPoints(TB_P1)
         result = str(s)
         assert "Player1 wins set: 7-6" in result
         assert "(7-0)" in result
@@ -476,10 +536,9 @@ class TestSetScoreHistory:
         history = s.scoreHistory()
         assert "P1 wins set" in history
 
-    def test_score_history_tiebreak(self):
-        s = Set(playerServing=1, isFinalSet=False, matchFormat=DEFAULT_FORMAT)
-        get_to_tiebreak(s)
-        s.recordPoints([1] * 7)
+    def test_score_history_tiebreak(self, make_tiebreak_set):
+        s = make_tiebreak_set(playerServing=1, matchFormat=DEFAULT_FORMAT)
+        s.recordPoints(TB_P1)
         history = s.scoreHistory()
         assert "Tiebreak" in history
 
@@ -487,29 +546,24 @@ class TestSetScoreHistory:
 class TestSetWithInitialScore:
     """Tests for sets starting at non-zero scores."""
 
-    def test_start_at_3_2(self):
-        init_score = SetScore(3, 2, isFinalSet=False, matchFormat=DEFAULT_FORMAT)
+    @pytest.mark.parametrize("a,b,expected_games_to_win,expected_final", [
+        (3, 2, 3, (6, 2)),
+        (5, 5, 2, (7, 5)),
+    ])
+    def test_start_at_score(self, a, b, expected_games_to_win, expected_final):
+        init_score = SetScore(a, b, isFinalSet=False, matchFormat=DEFAULT_FORMAT)
         s = Set(playerServing=1, isFinalSet=False, initScore=init_score)
 
-        assert s.score.games(1) == (3, 2)
-        assert s.gameHistory == []
+        assert s.score.games(1) == (a, b)
+        assert not s.gameHistory
 
-        # P1 wins 3 more games
-        for _ in range(3):
+        # P1 wins the games needed to close out the set
+        for _ in range(expected_games_to_win):
+            assert not s.isOver
             win_game(s, 1)
         assert s.isOver
         assert s.winner == 1
-        assert s.score.games(1) == (6, 2)
-
-    def test_start_at_5_5(self):
-        init_score = SetScore(5, 5, isFinalSet=False, matchFormat=DEFAULT_FORMAT)
-        s = Set(playerServing=1, isFinalSet=False, initScore=init_score)
-
-        # P1 wins 2 games
-        win_game(s, 1)
-        win_game(s, 1)
-        assert s.isOver
-        assert s.score.games(1) == (7, 5)
+        assert s.score.games(1) == expected_final
 
     def test_start_at_6_6_tiebreak(self):
         init_score = SetScore(6, 6, isFinalSet=False, matchFormat=DEFAULT_FORMAT)
@@ -517,9 +571,10 @@ class TestSetWithInitialScore:
 
         assert s.tiebreaker is not None
         assert s.currentGame is None
+        assert s._atTiebreak
 
         # P2 wins tiebreak
-        s.recordPoints([2] * 7)
+        s.recordPoints(TB_P2)
         assert s.isOver
         assert s.winner == 2
 
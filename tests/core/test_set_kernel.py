@@ -0,0 +1,79 @@
+"""Tests for the simulateSet kernel, checked against the Set class."""
+
+import random
+import numpy as np
+import pytest
+from array import array
+from tennis_lab.core.set          import Set
+from tennis_lab.core.set_kernel   import simulateSet
+from tennis_lab.core.match_format import MatchFormat, SetEnding
+
+DEFAULT_FORMAT   = MatchFormat(bestOfSets=3)
+NO_AD_FORMAT     = MatchFormat(bestOfSets=3, noAdRule=True)
+ADVANTAGE_FORMAT = MatchFormat(bestOfSets=3, finalSetEnding=SetEnding.ADVANTAGE)
+SUPER_TB_FORMAT  = MatchFormat(bestOfSets=3, finalSetEnding=SetEnding.SUPERTIEBREAK)
+SHORT_FORMAT     = MatchFormat(bestOfSets=3, setLength=4)
+
+WIN_P1 = [1] * 4
+WIN_P2 = [2] * 4
+
+
+def play_set(points, matchFormat, isFinalSet):
+    """Outcome of the same points played through the Set class."""
+    s = Set(playerServing=1, isFinalSet=isFinalSet, matchFormat=matchFormat)
+    s.recordPoints(points)
+    return (s.winner, *s.score.games(1))
+
+
+class TestSimulateSet:
+    """Tests for simple scenarios."""
+
+    def test_no_points(self):
+        assert simulateSet([], DEFAULT_FORMAT) == (None, 0, 0)
+
+    def test_p1_wins_6_0(self):
+        assert simulateSet(WIN_P1 * 6, DEFAULT_FORMAT) == (1, 6, 0)
+
+    def test_tiebreak_7_6(self):
+        points = (WIN_P1 + WIN_P2) * 6 + [2] * 7
+        assert simulateSet(points, DEFAULT_FORMAT) == (2, 6, 7)
+
+    def test_advantage_final_set(self):
+        points = (WIN_P1 + WIN_P2) * 6 + WIN_P1 * 2
+        assert simulateSet(points, ADVANTAGE_FORMAT, isFinalSet=True) == (1, 8, 6)
+
+    def test_no_ad_game(self):
+        assert simulateSet([1, 1, 1, 2, 2, 2, 2], NO_AD_FORMAT) == (None, 0, 1)
+
+    def test_points_after_set_over_ignored(self):
+        assert simulateSet(WIN_P1 * 6 + WIN_P2, DEFAULT_FORMAT) == (1, 6, 0)
+
+    def test_accepts_arrays(self):
+        points = WIN_P1 * 6
+        assert simulateSet(array('B', points), DEFAULT_FORMAT) == (1, 6, 0)
+        assert simulateSet(np.array(points, dtype=np.int8), DEFAULT_FORMAT) == (1, 6, 0)
+
+    def test_invalid_point_winner(self):
+        with pytest.raises(ValueError):
+            simulateSet([1, 2, 0], DEFAULT_FORMAT)
+
+    def test_invalid_match_format(self):
+        with pytest.raises(ValueError):
+            simulateSet(WIN_P1, "best of 3")
+
+
+class TestSimulateSetMatchesSet:
+    """The kernel and the Set class agree on random point sequences."""
+
+    @pytest.mark.parametrize("matchFormat, isFinalSet", [
+        (DEFAULT_FORMAT,   False),
+        (NO_AD_FORMAT,     False),
+        (ADVANTAGE_FORMAT, True),
+        (SUPER_TB_FORMAT,  True),
+        (SHORT_FORMAT,     False),
+    ])
+    def test_random_sets(self, matchFormat, isFinalSet):
+        rng = random.Random(1234)
+        for _ in range(50):
+            points = [rng.choice((1, 2)) for _ in range(rng.randint(0, 200))]
+            assert simulateSet(points, matchFormat, isFinalSet) == play_set(points, matchFormat, isFinalSet)
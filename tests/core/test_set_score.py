@@ -1,135 +1,162 @@
 """Tests for the SetScore class."""
 
+import numpy as np
 import pytest
+from copy import deepcopy
 from tennis_lab.core.set_score import SetScore
+from tennis_lab.core.set_kernel import simulateSet
 from tennis_lab.core.game_score import GameScore
 from tennis_lab.core.tiebreak_score import TiebreakScore
-from tennis_lab.core.match_format import MatchFormat, SetEnding
-
-# Default match formats for tests
-DEFAULT_FORMAT     = MatchFormat(bestOfSets=3)
-NO_AD_FORMAT       = MatchFormat(bestOfSets=3, noAdRule=True)
-CAP_FORMAT         = MatchFormat(bestOfSets=3, capPoints=True)
-NO_TIEBREAK_FORMAT = MatchFormat(bestOfSets=3, setEnding=SetEnding.ADVANTAGE)
-SHORT_SET_FORMAT   = MatchFormat(bestOfSets=3, setLength=4)
-
-# Formats with different final set rules
-FINAL_SET_ADVANTAGE = MatchFormat(bestOfSets=3, setEnding=SetEnding.TIEBREAK, finalSetEnding=SetEnding.ADVANTAGE)
-FINAL_SET_SUPERTIEBREAK = MatchFormat(bestOfSets=3, setEnding=SetEnding.TIEBREAK, finalSetEnding=SetEnding.SUPERTIEBREAK)
+from tennis_lab.core.match_format import MatchFormat, SetEnding  # noqa: F401 (SetEnding is needed by eval(repr(...)))
+
+# Point sequences: a love game / a 7-0 tiebreak won by either player
+GAME_P1     = (1,) * 4
+GAME_P2     = (2,) * 4
+TIEBREAK_P1 = (1,) * 7
+
+# Each player holds serve (P1 first) for 6 games each, reaching 6-6
+GAMES_TO_6_6 = (GAME_P1 + GAME_P2) * 6
+
+# Full sets played from 0-0, as contiguous int8 point streams
+P1_WINS_6_0      = np.array(GAME_P1 * 6, dtype=np.int8)
+P2_WINS_6_4      = np.array(GAME_P1 * 4 + GAME_P2 * 6, dtype=np.int8)
+P1_WINS_TIEBREAK = np.array(GAMES_TO_6_6 + TIEBREAK_P1, dtype=np.int8)
+
+
+# Helper function: split a 'Name(key=value, ...)' repr into its top-level fields
+def repr_fields(repr_str: str) -> tuple[str, dict[str, str]]:
+    """Return the name and the keyword arguments (as source strings) of a repr, in one pass."""
+    name, body = repr_str[:repr_str.index("(")], repr_str[repr_str.index("(")+1:repr_str.rindex(")")]
+    fields, depth, start = {}, 0, 0
+    for i, c in enumerate(body + ","):
+        if c == "(":   depth += 1
+        elif c == ")": depth -= 1
+        elif c == "," and depth == 0:
+            key, value = body[start:i].split("=", 1)
+            fields[key.strip()] = value
+            start = i + 1
+    return name, fields
+
+
+# Helper function: check several invalid calls at once
+def assert_all_raise(exc, callables):
+    """Assert that calling each of 'callables' (taking no arguments) raises 'exc'."""
+    for i, call in enumerate(callables):
+        try:
+            call()
+        except exc:
+            continue
+        pytest.fail(f"case {i} did not raise {exc.__name__}")
 
 
 class TestSetScoreInit:
     """Tests for SetScore initialization."""
 
-    def test_init_blank_score(self):
-        score = SetScore(0, 0, False, DEFAULT_FORMAT)
+    def test_init_blank_score(self, default_format):
+        score = SetScore(0, 0, False, default_format)
         assert score.gamesPlayer1 == 0
         assert score.gamesPlayer2 == 0
         assert score.isBlank
 
-    def test_init_with_games(self):
-        score = SetScore(3, 2, False, DEFAULT_FORMAT)
+    def test_init_with_games(self, default_format):
+        score = SetScore(3, 2, False, default_format)
         assert score.gamesPlayer1 == 3
         assert score.gamesPlayer2 == 2
         assert score.currGameScore is not None
         assert score.currGameScore.isBlank
 
-    def test_init_with_game_score(self):
-        game_score = GameScore(2, 1, DEFAULT_FORMAT)
-        score = SetScore(3, 2, False, DEFAULT_FORMAT, gameScore=game_score)
+    def test_init_with_game_score(self, default_format):
+        game_score = GameScore(2, 1, default_format)
+        score = SetScore(3, 2, False, default_format, gameScore=game_score)
         assert score.gamesPlayer1 == 3
         assert score.gamesPlayer2 == 2
         assert score.currGameScore.asPoints(1) == (2, 1)
 
-    def test_init_at_tiebreak(self):
-        score = SetScore(6, 6, False, DEFAULT_FORMAT)
+    def test_init_at_tiebreak(self, default_format):
+        score = SetScore(6, 6, False, default_format)
         assert score.isTied
         assert score.currGameScore is None
         assert score.tiebreakScore is not None
         assert score.tiebreakScore.isBlank
 
-    def test_init_with_tiebreak_score(self):
-        tb_score = TiebreakScore(3, 2, isSuper=False, matchFormat=DEFAULT_FORMAT)
-        score = SetScore(6, 6, False, DEFAULT_FORMAT, tiebreakScore=tb_score)
+    def test_init_with_tiebreak_score(self, default_format):
+        tb_score = TiebreakScore(3, 2, isSuper=False, matchFormat=default_format)
+        score = SetScore(6, 6, False, default_format, tiebreakScore=tb_score)
         assert score.tiebreakScore.asPoints(1) == (3, 2)
 
-    def test_init_invalid_non_integer_games(self):
-        with pytest.raises(ValueError):
-            SetScore(3.5, 2, False, DEFAULT_FORMAT)
-        with pytest.raises(ValueError):
-            SetScore(3, "2", False, DEFAULT_FORMAT)
+    def test_init_invalid_non_integer_games(self, default_format):
+        assert_all_raise(ValueError, [lambda: SetScore(3.5, 2, False, default_format),
+                                      lambda: SetScore(3, "2", False, default_format)])
 
-    def test_init_invalid_negative_games(self):
-        with pytest.raises(ValueError):
-            SetScore(-1, 0, False, DEFAULT_FORMAT)
-        with pytest.raises(ValueError):
-            SetScore(0, -1, False, DEFAULT_FORMAT)
+    def test_init_invalid_negative_games(self, default_format):
+        assert_all_raise(ValueError, [lambda: SetScore(-1, 0, False, default_format),
+                                      lambda: SetScore(0, -1, False, default_format)])
 
-    def test_init_invalid_isFinalSet_type(self):
+    def test_init_invalid_isFinalSet_type(self, default_format):
         with pytest.raises(ValueError):
-            SetScore(0, 0, "not a bool", DEFAULT_FORMAT)
+            SetScore(0, 0, "not a bool", default_format)
 
     def test_init_invalid_matchFormat_type(self):
         with pytest.raises(ValueError):
             SetScore(0, 0, False, "not a MatchFormat")
 
-    def test_init_invalid_game_score_type(self):
+    def test_init_invalid_game_score_type(self, default_format):
         with pytest.raises(ValueError):
-            SetScore(3, 2, False, DEFAULT_FORMAT, gameScore="not a GameScore")
+            SetScore(3, 2, False, default_format, gameScore="not a GameScore")
 
-    def test_init_invalid_final_game_score(self):
-        final_game = GameScore(4, 0, DEFAULT_FORMAT)  # This is a final score
+    def test_init_invalid_final_game_score(self, default_format):
+        final_game = GameScore(4, 0, default_format)  # This is a final score
         with pytest.raises(ValueError):
-            SetScore(3, 2, False, DEFAULT_FORMAT, gameScore=final_game)
+            SetScore(3, 2, False, default_format, gameScore=final_game)
 
-    def test_init_invalid_tiebreak_score_type(self):
+    def test_init_invalid_tiebreak_score_type(self, default_format):
         with pytest.raises(ValueError):
-            SetScore(6, 6, False, DEFAULT_FORMAT, tiebreakScore="not a TiebreakScore")
+            SetScore(6, 6, False, default_format, tiebreakScore="not a TiebreakScore")
 
-    def test_init_invalid_final_tiebreak_score(self):
-        final_tb = TiebreakScore(7, 3, isSuper=False, matchFormat=DEFAULT_FORMAT)  # This is a final score
+    def test_init_invalid_final_tiebreak_score(self, default_format):
+        final_tb = TiebreakScore(7, 3, isSuper=False, matchFormat=default_format)  # This is a final score
         with pytest.raises(ValueError):
-            SetScore(6, 6, False, DEFAULT_FORMAT, tiebreakScore=final_tb)
+            SetScore(6, 6, False, default_format, tiebreakScore=final_tb)
 
-    def test_init_tiebreak_score_without_tiebreak_set(self):
-        tb_score = TiebreakScore(1, 0, isSuper=False, matchFormat=NO_TIEBREAK_FORMAT)
+    def test_init_tiebreak_score_without_tiebreak_set(self, no_tiebreak_format):
+        tb_score = TiebreakScore(1, 0, isSuper=False, matchFormat=no_tiebreak_format)
         with pytest.raises(ValueError):
-            SetScore(6, 6, False, NO_TIEBREAK_FORMAT, tiebreakScore=tb_score)
+            SetScore(6, 6, False, no_tiebreak_format, tiebreakScore=tb_score)
 
-    def test_init_game_score_matchFormat_mismatch(self):
-        game_score = GameScore(2, 1, NO_AD_FORMAT)
+    def test_init_game_score_matchFormat_mismatch(self, no_ad_format, default_format):
+        game_score = GameScore(2, 1, no_ad_format)
         with pytest.raises(ValueError):
-            SetScore(3, 2, False, DEFAULT_FORMAT, gameScore=game_score)
+            SetScore(3, 2, False, default_format, gameScore=game_score)
 
-    def test_init_tiebreak_score_matchFormat_mismatch(self):
-        tb_score = TiebreakScore(2, 1, isSuper=False, matchFormat=NO_AD_FORMAT)
+    def test_init_tiebreak_score_matchFormat_mismatch(self, no_ad_format, default_format):
+        tb_score = TiebreakScore(2, 1, isSuper=False, matchFormat=no_ad_format)
         with pytest.raises(ValueError):
-            SetScore(6, 6, False, DEFAULT_FORMAT, tiebreakScore=tb_score)
+            SetScore(6, 6, False, default_format, tiebreakScore=tb_score)
 
-    def test_init_custom_set_length(self):
+    def test_init_custom_set_length(self, short_set_format):
         # 4-game set (like some junior formats)
-        score = SetScore(4, 2, False, SHORT_SET_FORMAT)
+        score = SetScore(4, 2, False, short_set_format)
         assert score.isFinal
         assert score.winner == 1
 
-    def test_init_no_tiebreak_set(self):
+    def test_init_no_tiebreak_set(self, no_tiebreak_format):
         # At 6-6 without tiebreak, game continues
-        score = SetScore(6, 6, False, NO_TIEBREAK_FORMAT)
+        score = SetScore(6, 6, False, no_tiebreak_format)
         assert not score.isFinal
         assert score.currGameScore is not None
         assert score.tiebreakScore is None
 
-    def test_init_matchFormat_from_gameScore(self):
+    def test_init_matchFormat_from_gameScore(self, no_ad_format):
         # matchFormat is derived from gameScore when not provided
-        game_score = GameScore(2, 1, NO_AD_FORMAT)
+        game_score = GameScore(2, 1, no_ad_format)
         score = SetScore(3, 2, False, gameScore=game_score)
-        assert score._matchFormat == NO_AD_FORMAT
+        assert score._matchFormat == no_ad_format
 
-    def test_init_matchFormat_from_tiebreakScore(self):
+    def test_init_matchFormat_from_tiebreakScore(self, no_ad_format):
         # matchFormat is derived from tiebreakScore when not provided
-        tb_score = TiebreakScore(2, 1, isSuper=False, matchFormat=NO_AD_FORMAT)
+        tb_score = TiebreakScore(2, 1, isSuper=False, matchFormat=no_ad_format)
         score = SetScore(6, 6, False, tiebreakScore=tb_score)
-        assert score._matchFormat == NO_AD_FORMAT
+        assert score._matchFormat == no_ad_format
 
     def test_init_default_matchFormat(self):
         # default MatchFormat is used when no score objects provided
@@ -140,73 +167,71 @@ class TestSetScoreInit:
 class TestSetScoreProperties:
     """Tests for SetScore properties."""
 
-    def test_is_blank(self):
-        assert SetScore(0, 0, False, DEFAULT_FORMAT).isBlank
+    def test_is_blank(self, default_format):
+        assert SetScore(0, 0, False, default_format).isBlank
         # Not blank if games have been played
-        assert not SetScore(1, 0, False, DEFAULT_FORMAT).isBlank
+        assert not SetScore(1, 0, False, default_format).isBlank
         # Not blank if current game has points
-        score = SetScore(0, 0, False, DEFAULT_FORMAT)
+        score = SetScore(0, 0, False, default_format)
         score.recordPoint(1)
         assert not score.isBlank
 
-    def test_is_tied(self):
-        assert not SetScore(5, 5, False, DEFAULT_FORMAT).isTied
-        assert SetScore(6, 6, False, DEFAULT_FORMAT).isTied
-        assert not SetScore(6, 5, False, DEFAULT_FORMAT).isTied
+    def test_is_tied(self, readonly_set_score, default_format, short_set_format):
+        assert not readonly_set_score(5, 5, False, default_format).isTied
+        assert readonly_set_score(6, 6, False, default_format).isTied
+        assert not readonly_set_score(6, 5, False, default_format).isTied
         # Custom set length
-        assert SetScore(4, 4, False, SHORT_SET_FORMAT).isTied
-
-    def test_is_final_win_by_two(self):
-        assert SetScore(6, 0, False, DEFAULT_FORMAT).isFinal
-        assert SetScore(6, 4, False, DEFAULT_FORMAT).isFinal
-        assert SetScore(0, 6, False, DEFAULT_FORMAT).isFinal
-        assert SetScore(4, 6, False, DEFAULT_FORMAT).isFinal
-        assert not SetScore(6, 5, False, DEFAULT_FORMAT).isFinal
-        assert not SetScore(5, 6, False, DEFAULT_FORMAT).isFinal
-
-    def test_is_final_tiebreak_win(self):
-        assert SetScore(7, 6, False, DEFAULT_FORMAT).isFinal
-        assert SetScore(6, 7, False, DEFAULT_FORMAT).isFinal
-
-    def test_winner(self):
-        assert SetScore(6, 4, False, DEFAULT_FORMAT).winner == 1
-        assert SetScore(4, 6, False, DEFAULT_FORMAT).winner == 2
-        assert SetScore(7, 6, False, DEFAULT_FORMAT).winner == 1
-        assert SetScore(6, 7, False, DEFAULT_FORMAT).winner == 2
-        assert SetScore(5, 5, False, DEFAULT_FORMAT).winner is None
-        assert SetScore(6, 6, False, DEFAULT_FORMAT).winner is None
-
-    def test_next_point_is_game(self):
-        # Regular game in progress
-        assert SetScore(3, 2, False, DEFAULT_FORMAT).nextPointIsGame
-        # At tiebreak, not a regular game
-        assert not SetScore(6, 6, False, DEFAULT_FORMAT).nextPointIsGame
-        # Set is over
-        assert not SetScore(6, 4, False, DEFAULT_FORMAT).nextPointIsGame
-        # No tiebreak set at 6-6: still playing games
-        assert SetScore(6, 6, False, NO_TIEBREAK_FORMAT).nextPointIsGame
-
-    def test_next_point_is_tiebreak(self):
-        assert not SetScore(5, 5, False, DEFAULT_FORMAT).nextPointIsTiebreak
-        assert SetScore(6, 6, False, DEFAULT_FORMAT).nextPointIsTiebreak
-        # Set is over
-        assert not SetScore(7, 6, False, DEFAULT_FORMAT).nextPointIsTiebreak
-        # No tiebreak set
-        assert not SetScore(6, 6, False, NO_TIEBREAK_FORMAT).nextPointIsTiebreak
-
-    def test_game_in_progress(self):
+        assert readonly_set_score(4, 4, False, short_set_format).isTied
+
+    @pytest.mark.parametrize("g1, g2, expected", [
+        (6, 0, True), (6, 4, True), (0, 6, True), (4, 6, True), (6, 5, False), (5, 6, False),
+    ])
+    def test_is_final_win_by_two(self, readonly_set_score, default_format, g1, g2, expected):
+        assert readonly_set_score(g1, g2, False, default_format).isFinal is expected
+
+    def test_is_final_tiebreak_win(self, readonly_set_score, default_format):
+        assert readonly_set_score(7, 6, False, default_format).isFinal
+        assert readonly_set_score(6, 7, False, default_format).isFinal
+
+    @pytest.mark.parametrize("g1, g2, expected", [
+        (6, 4, 1), (4, 6, 2), (7, 6, 1), (6, 7, 2), (5, 5, None), (6, 6, None),
+    ])
+    def test_winner(self, readonly_set_score, default_format, g1, g2, expected):
+        assert readonly_set_score(g1, g2, False, default_format).winner == expected
+
+    @pytest.mark.parametrize("format_name, g1, g2, expected", [
+        ("default_format",     3, 2, True),    # regular game in progress
+        ("default_format",     6, 6, False),   # at tiebreak, not a regular game
+        ("default_format",     6, 4, False),   # set is over
+        ("no_tiebreak_format", 6, 6, True),    # no tiebreak set at 6-6: still playing games
+    ])
+    def test_next_point_is_game(self, readonly_set_score, request, format_name, g1, g2, expected):
+        matchFormat = request.getfixturevalue(format_name)
+        assert readonly_set_score(g1, g2, False, matchFormat).nextPointIsGame is expected
+
+    @pytest.mark.parametrize("format_name, g1, g2, expected", [
+        ("default_format",     5, 5, False),
+        ("default_format",     6, 6, True),
+        ("default_format",     7, 6, False),   # set is over
+        ("no_tiebreak_format", 6, 6, False),   # no tiebreak set
+    ])
+    def test_next_point_is_tiebreak(self, readonly_set_score, request, format_name, g1, g2, expected):
+        matchFormat = request.getfixturevalue(format_name)
+        assert readonly_set_score(g1, g2, False, matchFormat).nextPointIsTiebreak is expected
+
+    def test_game_in_progress(self, default_format):
         # At start of game, not in progress
-        assert not SetScore(3, 2, False, DEFAULT_FORMAT).gameInProgress
+        assert not SetScore(3, 2, False, default_format).gameInProgress
         # After a point, game is in progress
-        score = SetScore(3, 2, False, DEFAULT_FORMAT)
+        score = SetScore(3, 2, False, default_format)
         score.recordPoint(1)
         assert score.gameInProgress
 
-    def test_tiebreak_in_progress(self):
+    def test_tiebreak_in_progress(self, default_format):
         # At start of tiebreak, not in progress
-        assert not SetScore(6, 6, False, DEFAULT_FORMAT).tiebreakInProgress
+        assert not SetScore(6, 6, False, default_format).tiebreakInProgress
         # After a point, tiebreak is in progress
-        score = SetScore(6, 6, False, DEFAULT_FORMAT)
+        score = SetScore(6, 6, False, default_format)
         score.recordPoint(1)
         assert score.tiebreakInProgress
 
@@ -214,71 +239,58 @@ class TestSetScoreProperties:
 class TestEndsInTiebreak:
     """Tests for endsInTiebreak property."""
 
-    def test_ends_in_tiebreak_default(self):
-        score = SetScore(0, 0, False, DEFAULT_FORMAT)
-        assert score.endsInTiebreak
-
-    def test_ends_in_tiebreak_advantage_set(self):
-        score = SetScore(0, 0, False, NO_TIEBREAK_FORMAT)
-        assert not score.endsInTiebreak
-
-    def test_ends_in_tiebreak_non_final_set(self):
-        # Non-final set uses setEnding
-        score = SetScore(0, 0, False, FINAL_SET_ADVANTAGE)
-        assert score.endsInTiebreak  # setEnding is TIEBREAK
-
-    def test_ends_in_tiebreak_final_set_advantage(self):
-        # Final set uses finalSetEnding
-        score = SetScore(0, 0, True, FINAL_SET_ADVANTAGE)
-        assert not score.endsInTiebreak  # finalSetEnding is ADVANTAGE
-
-    def test_ends_in_tiebreak_final_set_supertiebreak(self):
-        score = SetScore(0, 0, True, FINAL_SET_SUPERTIEBREAK)
-        assert score.endsInTiebreak  # SUPERTIEBREAK still ends in tiebreak
+    @pytest.mark.parametrize("format_name, isFinalSet, expected", [
+        ("default_format",                 False, True),
+        ("no_tiebreak_format",             False, False),
+        ("final_set_advantage_format",     False, True),    # non-final set uses setEnding (TIEBREAK)
+        ("final_set_advantage_format",     True,  False),   # final set uses finalSetEnding (ADVANTAGE)
+        ("final_set_supertiebreak_format", True,  True),    # SUPERTIEBREAK still ends in tiebreak
+    ], ids=["default", "advantage_set", "non_final_set", "final_set_advantage", "final_set_supertiebreak"])
+    def test_ends_in_tiebreak(self, readonly_set_score, request, format_name, isFinalSet, expected):
+        matchFormat = request.getfixturevalue(format_name)
+        assert readonly_set_score(0, 0, isFinalSet, matchFormat).endsInTiebreak is expected
 
 
 class TestFinalSetBehavior:
     """Tests for final set specific behavior."""
 
-    def test_final_set_advantage_no_tiebreak(self):
+    def test_final_set_advantage_no_tiebreak(self, final_set_advantage_format):
         # Final set with advantage rule - no tiebreak at 6-6
-        score = SetScore(6, 6, True, FINAL_SET_ADVANTAGE)
+        score = SetScore(6, 6, True, final_set_advantage_format)
         assert not score.isFinal
         assert score.nextPointIsGame
         assert not score.nextPointIsTiebreak
         assert score.currGameScore is not None
         assert score.tiebreakScore is None
 
-    def test_final_set_advantage_win_by_two(self):
-        score = SetScore(8, 6, True, FINAL_SET_ADVANTAGE)
+    def test_final_set_advantage_win_by_two(self, final_set_advantage_format):
+        score = SetScore(8, 6, True, final_set_advantage_format)
         assert score.isFinal
         assert score.winner == 1
 
-    def test_non_final_set_same_format_has_tiebreak(self):
+    def test_non_final_set_same_format_has_tiebreak(self, final_set_advantage_format):
         # Non-final set with same format still has tiebreak at 6-6
-        score = SetScore(6, 6, False, FINAL_SET_ADVANTAGE)
+        score = SetScore(6, 6, False, final_set_advantage_format)
         assert not score.isFinal
         assert score.nextPointIsTiebreak
         assert score.tiebreakScore is not None
 
-    def test_final_set_supertiebreak(self):
+    def test_final_set_supertiebreak(self, final_set_supertiebreak_format):
         # Final set with super tiebreak
-        score = SetScore(6, 6, True, FINAL_SET_SUPERTIEBREAK)
+        score = SetScore(6, 6, True, final_set_supertiebreak_format)
         assert score.nextPointIsTiebreak
         assert score.tiebreakScore is not None
         # Super tiebreak requires 10 points to win
-        for _ in range(9):
-            score.recordPoint(1)
+        score.recordPoints([1] * 9)
         assert not score.isFinal
         score.recordPoint(1)  # 10th point
         assert score.isFinal
         assert score.winner == 1
 
-    def test_non_final_set_regular_tiebreak(self):
+    def test_non_final_set_regular_tiebreak(self, final_set_supertiebreak_format):
         # Non-final set uses regular tiebreak (7 points)
-        score = SetScore(6, 6, False, FINAL_SET_SUPERTIEBREAK)
-        for _ in range(7):
-            score.recordPoint(1)
+        score = SetScore(6, 6, False, final_set_supertiebreak_format)
+        score.recordPoints(TIEBREAK_P1)
         assert score.isFinal
         assert score.winner == 1
 
@@ -286,129 +298,157 @@ class TestFinalSetBehavior:
 class TestGamesMethod:
     """Tests for games() method."""
 
-    def test_games_pov1(self):
-        score = SetScore(4, 2, False, DEFAULT_FORMAT)
+    def test_games_pov1(self, readonly_set_score, default_format):
+        score = readonly_set_score(4, 2, False, default_format)
         assert score.games(1) == (4, 2)
 
-    def test_games_pov2(self):
-        score = SetScore(4, 2, False, DEFAULT_FORMAT)
+    def test_games_pov2(self, readonly_set_score, default_format):
+        score = readonly_set_score(4, 2, False, default_format)
         assert score.games(2) == (2, 4)
 
-    def test_games_invalid_pov(self):
-        score = SetScore(3, 2, False, DEFAULT_FORMAT)
-        with pytest.raises(ValueError):
-            score.games(0)
-        with pytest.raises(ValueError):
-            score.games(3)
+    def test_games_invalid_pov(self, readonly_set_score, default_format):
+        score = readonly_set_score(3, 2, False, default_format)
+        assert_all_raise(ValueError, [lambda: score.games(0), lambda: score.games(3)])
 
 
 class TestRecordPoint:
     """Tests for recordPoint method."""
 
-    def test_record_point_basic(self):
-        score = SetScore(0, 0, False, DEFAULT_FORMAT)
+    def test_record_point_basic(self, default_format):
+        score = SetScore(0, 0, False, default_format)
         score.recordPoint(1)
         assert score.currGameScore.asPoints(1) == (1, 0)
 
-    def test_record_point_invalid(self):
-        score = SetScore(0, 0, False, DEFAULT_FORMAT)
-        with pytest.raises(ValueError):
-            score.recordPoint(0)
-        with pytest.raises(ValueError):
-            score.recordPoint(3)
+    def test_record_point_invalid(self, default_format):
+        score = SetScore(0, 0, False, default_format)
+        assert_all_raise(ValueError, [lambda: score.recordPoint(0), lambda: score.recordPoint(3)])
 
-    def test_record_point_set_over(self):
-        score = SetScore(6, 4, False, DEFAULT_FORMAT)
+    def test_record_point_set_over(self, default_format):
+        score = SetScore(6, 4, False, default_format)
         with pytest.raises(ValueError):
             score.recordPoint(1)
 
-    def test_record_point_completes_game(self):
-        score = SetScore(0, 0, False, DEFAULT_FORMAT)
+    def test_record_point_completes_game(self, default_format):
+        score = SetScore(0, 0, False, default_format)
         # P1 wins 4 points (game)
-        for _ in range(4):
-            score.recordPoint(1)
+        score.recordPoints(GAME_P1)
         assert score.gamesPlayer1 == 1
         assert score.gamesPlayer2 == 0
         assert score.currGameScore.isBlank
 
-    def test_record_point_completes_set(self):
-        score = SetScore(5, 0, False, DEFAULT_FORMAT)
+    def test_record_point_completes_set(self, default_format):
+        score = SetScore(5, 0, False, default_format)
         # P1 wins 4 points (game) to win set 6-0
-        for _ in range(4):
-            score.recordPoint(1)
+        score.recordPoints(GAME_P1)
         assert score.gamesPlayer1 == 6
         assert score.gamesPlayer2 == 0
         assert score.isFinal
         assert score.winner == 1
 
-    def test_record_point_tiebreak(self):
-        score = SetScore(6, 6, False, DEFAULT_FORMAT)
+    def test_record_point_tiebreak(self, default_format):
+        score = SetScore(6, 6, False, default_format)
         score.recordPoint(1)
         assert score.tiebreakScore.asPoints(1) == (1, 0)
 
-    def test_record_point_completes_tiebreak(self):
-        score = SetScore(6, 6, False, DEFAULT_FORMAT)
+    def test_record_point_completes_tiebreak(self, default_format):
+        score = SetScore(6, 6, False, default_format)
         # P1 wins 7 points (tiebreak)
-        for _ in range(7):
-            score.recordPoint(1)
+        score.recordPoints(TIEBREAK_P1)
         assert score.gamesPlayer1 == 7
         assert score.gamesPlayer2 == 6
         assert score.isFinal
         assert score.winner == 1
 
-    def test_record_point_game_transitions_to_tiebreak(self):
-        score = SetScore(5, 5, False, DEFAULT_FORMAT)
+    def test_record_point_game_transitions_to_tiebreak(self, default_format):
+        score = SetScore(5, 5, False, default_format)
         # P1 wins a game to make it 6-5
-        for _ in range(4):
-            score.recordPoint(1)
+        score.recordPoints(GAME_P1)
         assert score.gamesPlayer1 == 6
         assert score.gamesPlayer2 == 5
         assert score.currGameScore is not None
         # P2 wins a game to make it 6-6
-        for _ in range(4):
-            score.recordPoint(2)
+        score.recordPoints(GAME_P2)
         assert score.gamesPlayer1 == 6
         assert score.gamesPlayer2 == 6
         assert score.tiebreakScore is not None
         assert score.currGameScore is None
 
 
+class TestRecordPoints:
+    """Tests for recordPoints method."""
+
+    def test_record_points_matches_record_point(self, default_format):
+        points = (1, 2, 1, 1, 2, 2, 2, 1, 1, 1) * 5
+        score1 = SetScore(0, 0, False, default_format)
+        score1.recordPoints(points)
+        score2 = SetScore(0, 0, False, default_format)
+        for point in points:
+            score2.recordPoint(point)
+        assert score1 == score2
+
+    def test_record_points_buffers(self, default_format):
+        for points in (b"\x01\x01\x02", np.array([1, 1, 2], dtype=np.int8)):
+            score = SetScore(0, 0, False, default_format)
+            score.recordPoints(points)
+            assert score.currGameScore.asPoints(1) == (2, 1)
+
+    def test_record_points_generator(self, default_format):
+        score = SetScore(0, 0, False, default_format)
+        score.recordPoints(x for x in GAME_P1 + (2,))
+        assert score.games(1) == (1, 0)
+        assert score.currGameScore.asPoints(1) == (0, 1)
+
+    def test_record_points_invalid_leaves_score_unchanged(self, default_format):
+        score = SetScore(0, 0, False, default_format)
+        with pytest.raises(ValueError):
+            score.recordPoints([1, 1, 3])
+        assert score.isBlank
+
+    def test_record_points_past_set_over(self, default_format):
+        score = SetScore(5, 0, False, default_format)
+        with pytest.raises(ValueError):
+            score.recordPoints(GAME_P1 + (1,))
+        assert score.isFinal
+        with pytest.raises(ValueError):
+            score.recordPoints([1])
+
+
 class TestNextGameScores:
     """Tests for nextGameScores method."""
 
-    def test_next_game_scores_basic(self):
-        score = SetScore(3, 2, False, DEFAULT_FORMAT)
+    def test_next_game_scores_basic(self, default_format):
+        score = SetScore(3, 2, False, default_format)
         next_p1, next_p2 = score.nextGameScores()
         assert next_p1.gamesPlayer1 == 4
         assert next_p1.gamesPlayer2 == 2
         assert next_p2.gamesPlayer1 == 3
         assert next_p2.gamesPlayer2 == 3
 
-    def test_next_game_scores_final(self):
-        score = SetScore(6, 4, False, DEFAULT_FORMAT)
+    def test_next_game_scores_final(self, default_format):
+        score = SetScore(6, 4, False, default_format)
         assert score.nextGameScores() is None
 
-    def test_next_game_scores_game_in_progress(self):
-        score = SetScore(3, 2, False, DEFAULT_FORMAT)
+    def test_next_game_scores_game_in_progress(self, default_format):
+        score = SetScore(3, 2, False, default_format)
         score.recordPoint(1)  # Now game is in progress
         with pytest.raises(ValueError):
             score.nextGameScores()
 
-    def test_next_game_scores_tiebreak_in_progress(self):
-        score = SetScore(6, 6, False, DEFAULT_FORMAT)
+    def test_next_game_scores_tiebreak_in_progress(self, default_format):
+        score = SetScore(6, 6, False, default_format)
         score.recordPoint(1)  # Now tiebreak is in progress
         with pytest.raises(ValueError):
             score.nextGameScores()
 
-    def test_next_game_scores_propagates_matchFormat(self):
-        score = SetScore(3, 2, False, NO_AD_FORMAT)
+    def test_next_game_scores_propagates_matchFormat(self, no_ad_format):
+        score = SetScore(3, 2, False, no_ad_format)
         next_p1, next_p2 = score.nextGameScores()
         # Verify matchFormat is propagated
-        assert next_p1._matchFormat == NO_AD_FORMAT
-        assert next_p2._matchFormat == NO_AD_FORMAT
+        assert next_p1._matchFormat == no_ad_format
+        assert next_p2._matchFormat == no_ad_format
 
-    def test_next_game_scores_propagates_isFinalSet(self):
-        score = SetScore(3, 2, True, DEFAULT_FORMAT)
+    def test_next_game_scores_propagates_isFinalSet(self, default_format):
+        score = SetScore(3, 2, True, default_format)
         next_p1, next_p2 = score.nextGameScores()
         assert next_p1._isFinalSet == True
         assert next_p2._isFinalSet == True
@@ -417,32 +457,30 @@ class TestNextGameScores:
 class TestNoTiebreakSet:
     """Tests for sets without tiebreak."""
 
-    def test_no_tiebreak_at_6_6(self):
-        score = SetScore(6, 6, False, NO_TIEBREAK_FORMAT)
+    def test_no_tiebreak_at_6_6(self, no_tiebreak_format):
+        score = SetScore(6, 6, False, no_tiebreak_format)
         assert not score.isFinal
         assert score.currGameScore is not None
         assert score.tiebreakScore is None
 
-    def test_no_tiebreak_win_by_two(self):
-        score = SetScore(8, 6, False, NO_TIEBREAK_FORMAT)
+    def test_no_tiebreak_win_by_two(self, no_tiebreak_format):
+        score = SetScore(8, 6, False, no_tiebreak_format)
         assert score.isFinal
         assert score.winner == 1
 
-    def test_no_tiebreak_not_final_at_7_6(self):
-        score = SetScore(7, 6, False, NO_TIEBREAK_FORMAT)
+    def test_no_tiebreak_not_final_at_7_6(self, no_tiebreak_format):
+        score = SetScore(7, 6, False, no_tiebreak_format)
         assert not score.isFinal
 
-    def test_no_tiebreak_continues_past_6_6(self):
-        score = SetScore(6, 6, False, NO_TIEBREAK_FORMAT)
+    def test_no_tiebreak_continues_past_6_6(self, no_tiebreak_format):
+        score = SetScore(6, 6, False, no_tiebreak_format)
         # P1 wins a game
-        for _ in range(4):
-            score.recordPoint(1)
+        score.recordPoints(GAME_P1)
         assert score.gamesPlayer1 == 7
         assert score.gamesPlayer2 == 6
         assert not score.isFinal
         # P2 wins a game
-        for _ in range(4):
-            score.recordPoint(2)
+        score.recordPoints(GAME_P2)
         assert score.gamesPlayer1 == 7
         assert score.gamesPlayer2 == 7
         assert not score.isFinal
@@ -451,25 +489,25 @@ class TestNoTiebreakSet:
 class TestEquality:
     """Tests for __eq__ and __hash__."""
 
-    def test_equal_scores(self):
-        assert SetScore(3, 2, False, DEFAULT_FORMAT) == SetScore(3, 2, False, DEFAULT_FORMAT)
+    def test_equal_scores(self, default_format):
+        assert SetScore(3, 2, False, default_format) == SetScore(3, 2, False, default_format)
 
-    def test_unequal_games(self):
-        assert SetScore(3, 2, False, DEFAULT_FORMAT) != SetScore(2, 3, False, DEFAULT_FORMAT)
+    def test_unequal_games(self, default_format):
+        assert SetScore(3, 2, False, default_format) != SetScore(2, 3, False, default_format)
 
-    def test_equal_with_game_score(self):
-        gs1 = GameScore(2, 1, DEFAULT_FORMAT)
-        gs2 = GameScore(2, 1, DEFAULT_FORMAT)
-        assert SetScore(3, 2, False, DEFAULT_FORMAT, gameScore=gs1) == SetScore(3, 2, False, DEFAULT_FORMAT, gameScore=gs2)
+    def test_equal_with_game_score(self, default_format):
+        gs1 = GameScore(2, 1, default_format)
+        gs2 = GameScore(2, 1, default_format)
+        assert SetScore(3, 2, False, default_format, gameScore=gs1) == SetScore(3, 2, False, default_format, gameScore=gs2)
 
-    def test_unequal_game_score(self):
-        gs1 = GameScore(2, 1, DEFAULT_FORMAT)
-        gs2 = GameScore(1, 2, DEFAULT_FORMAT)
-        assert SetScore(3, 2, False, DEFAULT_FORMAT, gameScore=gs1) != SetScore(3, 2, False, DEFAULT_FORMAT, gameScore=gs2)
+    def test_unequal_game_score(self, default_format):
+        gs1 = GameScore(2, 1, default_format)
+        gs2 = GameScore(1, 2, default_format)
+        assert SetScore(3, 2, False, default_format, gameScore=gs1) != SetScore(3, 2, False, default_format, gameScore=gs2)
 
-    def test_hash_consistency(self):
-        s1 = SetScore(3, 2, False, DEFAULT_FORMAT)
-        s2 = SetScore(3, 2, False, DEFAULT_FORMAT)
+    def test_hash_consistency(self, default_format):
+        s1 = SetScore(3, 2, False, default_format)
+        s2 = SetScore(3, 2, False, default_format)
         assert hash(s1) == hash(s2)
 
         # Can use in sets/dicts
@@ -480,138 +518,137 @@ class TestEquality:
 class TestReprAndStr:
     """Tests for __repr__ and __str__."""
 
-    def test_repr(self):
-        score = SetScore(3, 2, False, NO_AD_FORMAT)
-        repr_str = repr(score)
-        assert "SetScore" in repr_str
-        assert "gamesP1=3" in repr_str
-        assert "gamesP2=2" in repr_str
-        assert "isFinalSet=False" in repr_str
-        assert "matchFormat=" in repr_str
-
-    def test_repr_eval(self):
+    def test_repr(self, no_ad_format):
+        score = SetScore(3, 2, False, no_ad_format)
+        name, fields = repr_fields(repr(score))
+        assert name == "SetScore"
+        assert fields["gamesP1"] == "3"
+        assert fields["gamesP2"] == "2"
+        assert fields["isFinalSet"] == "False"
+        assert fields["matchFormat"].startswith("MatchFormat(")
+
+    @pytest.mark.slow
+    def test_repr_eval(self, default_format):
         # repr should produce valid Python
-        score = SetScore(3, 2, False, DEFAULT_FORMAT)
+        score = SetScore(3, 2, False, default_format)
         recreated = eval(repr(score))
         assert recreated.gamesPlayer1 == 3
         assert recreated.gamesPlayer2 == 2
 
-    def test_str_basic(self):
-        assert str(SetScore(3, 2, False, DEFAULT_FORMAT)) == "3-2, 0-0"
-        assert str(SetScore(6, 4, False, DEFAULT_FORMAT)) == "6-4"
+    def test_as_dict_round_trip(self, default_format):
+        score = SetScore(3, 2, False, default_format)
+        recreated = SetScore.fromDict(score.asDict())
+        assert recreated.gamesPlayer1 == 3
+        assert recreated.gamesPlayer2 == 2
+        assert recreated == score
+
+    def test_as_dict_round_trip_in_progress(self, default_format, final_set_supertiebreak_format):
+        score = SetScore(3, 2, False, default_format, gameScore=GameScore(2, 1, default_format))
+        assert SetScore.fromDict(score.asDict()) == score
+        score = SetScore(6, 6, True, final_set_supertiebreak_format)
+        score.recordPoint(1)
+        recreated = SetScore.fromDict(score.asDict())
+        assert recreated == score
+        assert recreated.tiebreakScore._isSuper
+
+    def test_from_dict_invalid(self, default_format):
+        d = SetScore(3, 2, False, default_format).asDict()
+        del d["gamesP1"]
+        with pytest.raises(ValueError):
+            SetScore.fromDict(d)
+
+    def test_str_basic(self, default_format):
+        assert str(SetScore(3, 2, False, default_format)) == "3-2, 0-0"
+        assert str(SetScore(6, 4, False, default_format)) == "6-4"
 
-    def test_str_with_game_score(self):
-        score = SetScore(3, 2, False, DEFAULT_FORMAT)
+    def test_str_with_game_score(self, default_format):
+        score = SetScore(3, 2, False, default_format)
         score.recordPoint(1)
         score.recordPoint(1)
         assert str(score) == "3-2, 30-0"
 
-    def test_str_with_tiebreak_score(self):
-        score = SetScore(6, 6, False, DEFAULT_FORMAT)
+    def test_str_with_tiebreak_score(self, default_format):
+        score = SetScore(6, 6, False, default_format)
         score.recordPoint(1)
         score.recordPoint(2)
         assert str(score) == "6-6, 1-1"
 
 
+# Shared set prefix, played once per module; tests mutate deep copies of it
+@pytest.fixture(scope="module")
+def set_at_6_6_tiebreak(default_format):
+    """SetScore after each player won 6 games alternately (tiebreak next)."""
+    score = SetScore(0, 0, False, default_format)
+    score.recordPoints(GAMES_TO_6_6)
+    return score
+
+
 class TestPlayFullSet:
     """Integration tests for playing a full set."""
 
-    def test_p1_wins_set_6_0(self):
-        score = SetScore(0, 0, False, DEFAULT_FORMAT)
-        for game in range(6):
-            for point in range(4):
-                score.recordPoint(1)
-        assert score.isFinal
-        assert score.winner == 1
-        assert score.gamesPlayer1 == 6
-        assert score.gamesPlayer2 == 0
-
-    def test_p2_wins_set_6_4(self):
-        score = SetScore(0, 0, False, DEFAULT_FORMAT)
-        # P1 wins 4 games
-        for game in range(4):
-            for point in range(4):
-                score.recordPoint(1)
-        # P2 wins 6 games
-        for game in range(6):
-            for point in range(4):
-                score.recordPoint(2)
+    @pytest.mark.parametrize("points, winner, gamesP1, gamesP2", [
+        (P1_WINS_6_0,      1, 6, 0),
+        (P2_WINS_6_4,      2, 4, 6),    # P1 wins 4 games, then P2 wins 6 games
+        (P1_WINS_TIEBREAK, 1, 7, 6),    # games traded up to 6-6, P1 wins tiebreak 7-0
+    ], ids=["6-0", "4-6", "7-6"])
+    def test_full_set_outcomes(self, default_format, points, winner, gamesP1, gamesP2):
+        score = SetScore(0, 0, False, default_format)
+        score.recordPoints(points)
         assert score.isFinal
-        assert score.winner == 2
-        assert score.gamesPlayer1 == 4
-        assert score.gamesPlayer2 == 6
+        assert score.winner == winner
+        assert score.games(1) == (gamesP1, gamesP2)
+        assert simulateSet(points, default_format) == (winner, gamesP1, gamesP2)
 
-    def test_tiebreak_7_6(self):
-        score = SetScore(0, 0, False, DEFAULT_FORMAT)
-        # Each player wins 6 games alternately
-        for game in range(6):
-            for point in range(4):
-                score.recordPoint(1)
-            for point in range(4):
-                score.recordPoint(2)
+    def test_tiebreak_7_6(self, default_format, set_at_6_6_tiebreak):
+        # Each player won 6 games alternately
+        score = deepcopy(set_at_6_6_tiebreak)
         assert score.gamesPlayer1 == 6
         assert score.gamesPlayer2 == 6
         assert score.tiebreakScore is not None
         # P1 wins tiebreak 7-0
-        for point in range(7):
-            score.recordPoint(1)
+        score.recordPoints(TIEBREAK_P1)
         assert score.isFinal
         assert score.winner == 1
         assert score.gamesPlayer1 == 7
         assert score.gamesPlayer2 == 6
 
-    def test_tiebreak_extended(self):
-        score = SetScore(6, 6, False, DEFAULT_FORMAT)
-        # Each player wins 6 points
-        for _ in range(6):
-            score.recordPoint(1)
-            score.recordPoint(2)
+    @pytest.mark.parametrize("format_name, isFinalSet, tiedAt", [
+        ("default_format",                 False, 6),    # tiebreak: P1 wins 8-6
+        ("final_set_supertiebreak_format", True,  9),    # super tiebreak: P1 wins 11-9
+    ], ids=["tiebreak", "supertiebreak"])
+    def test_tiebreak_extended(self, request, format_name, isFinalSet, tiedAt):
+        score = SetScore(6, 6, isFinalSet, request.getfixturevalue(format_name))
+        # P1 and P2 trade points until tied one point short of winning
+        score.recordPoints((1, 2) * tiedAt)
+        assert score.tiebreakScore.asPoints(1) == (tiedAt, tiedAt)
         assert not score.isFinal
-        assert score.tiebreakScore.asPoints(1) == (6, 6)
-        # P1 wins 2 more to win 8-6
-        score.recordPoint(1)
-        score.recordPoint(1)
+        # P1 wins 2 more to win the tiebreak by two
+        score.recordPoints((1, 1))
         assert score.isFinal
         assert score.winner == 1
+        assert score.gamesPlayer1 == 7
+        assert score.gamesPlayer2 == 6
 
-    def test_final_set_with_advantage_rule(self):
+    def test_final_set_advantage_reachable_by_play(self, final_set_advantage_format):
         # Play a final set that goes beyond 6-6 with advantage rule
-        score = SetScore(6, 6, True, FINAL_SET_ADVANTAGE)
+        score = SetScore(6, 6, True, final_set_advantage_format)
         # P1 and P2 trade games until 10-10
-        for _ in range(4):
-            for _ in range(4):
-                score.recordPoint(1)
-            for _ in range(4):
-                score.recordPoint(2)
+        score.recordPoints((GAME_P1 + GAME_P2) * 4)
         assert score.gamesPlayer1 == 10
         assert score.gamesPlayer2 == 10
         assert not score.isFinal
+        assert score == SetScore(10, 10, True, final_set_advantage_format)
+
+    def test_final_set_with_advantage_rule(self, final_set_advantage_format):
+        # Start directly at 10-10 in a final set with advantage rule
+        score = SetScore(10, 10, True, final_set_advantage_format)
+        assert not score.isFinal
         # P1 wins two games to win 12-10
-        for _ in range(4):
-            score.recordPoint(1)
+        score.recordPoints(GAME_P1)
         assert score.gamesPlayer1 == 11
         assert not score.isFinal
-        for _ in range(4):
-            score.recordPoint(1)
+        score.recordPoints(GAME_P1)
         assert score.gamesPlayer1 == 12
         assert score.gamesPlayer2 == 10
         assert score.isFinal
         assert score.winner == 1
-
-    def test_final_set_supertiebreak_full(self):
-        # Play a final set with super tiebreak
-        score = SetScore(6, 6, True, FINAL_SET_SUPERTIEBREAK)
-        # Super tiebreak: first to 10 with 2 point lead
-        # P1 and P2 trade points to 9-9
-        for _ in range(9):
-            score.recordPoint(1)
-            score.recordPoint(2)
-        assert score.tiebreakScore.asPoints(1) == (9, 9)
-        assert not score.isFinal
-        # P1 wins 2 more to win 11-9
-        score.recordPoint(1)
-        score.recordPoint(1)
-        assert score.isFinal
-        assert score.winner == 1
-        assert score.gamesPlayer1 == 7
-        assert score.gamesPlayer2 == 6
@@ -5,7 +5,8 @@ import pytest
 import numpy as np
 
 from tennis_lab.core.match_format import MatchFormat
-from tennis_lab.montecarlo.match_simulation import simulateMatchWinProbabilityEvolution
+from tennis_lab.montecarlo import match_simulation
+from tennis_lab.montecarlo.match_simulation import simulateMatchWinProbabilityEvolution, simulateMatchWinners
 
 
 class TestSimulateMatchWinProbabilityEvolution:
@@ -143,20 +144,25 @@ class TestSimulateMatchWinProbabilityEvolution:
         np.testing.assert_array_equal(result1[2], result2[2])
         np.testing.assert_array_equal(result1[3], result2[3])
 
+    def test_deterministic_with_rng(self):
+        """Same NumPy generator seed produces same results."""
+        matchFormat = MatchFormat(bestOfSets=3)
+        results = [simulateMatchWinProbabilityEvolution(
+                       matchFormat, P1actual=0.65, P2actual=0.62,
+                       P1prior=0.63, alpha1=50, P2prior=0.60, alpha2=50,
+                       rng=np.random.default_rng(123))
+                   for _ in range(2)]
+        for arr1, arr2 in zip(*results):
+            np.testing.assert_array_equal(arr1, arr2)
+
     def test_dominant_player_usually_wins(self):
         """Player with much higher serve probability usually wins over many trials."""
         matchFormat = MatchFormat(bestOfSets=3)
-        wins = 0
         num_trials = 50
 
-        for i in range(num_trials):
-            random.seed(i)
-            static, _, _, _ = simulateMatchWinProbabilityEvolution(
-                matchFormat, P1actual=0.80, P2actual=0.50,
-                P1prior=0.65, alpha1=50, P2prior=0.65, alpha2=50
-            )
-            if static[-1] == 1:
-                wins += 1
+        # only the winners are needed: use the batched simulator
+        winners = simulateMatchWinners(matchFormat, P1actual=0.80, P2actual=0.50, numSims=num_trials, seed=0)
+        wins = np.count_nonzero(winners == 1)
 
         # With such a dominant advantage, P1 should win most matches
         assert wins > num_trials * 0.7
@@ -204,17 +210,11 @@ class TestSimulateMatchWinProbabilityEvolution:
     def test_equal_players_win_roughly_half(self):
         """When players are equal, each wins roughly half the matches."""
         matchFormat = MatchFormat(bestOfSets=3)
-        wins = 0
         num_trials = 100
 
-        for i in range(num_trials):
-            random.seed(i)
-            static, _, _, _ = simulateMatchWinProbabilityEvolution(
-                matchFormat, P1actual=0.65, P2actual=0.65,
-                P1prior=0.65, alpha1=50, P2prior=0.65, alpha2=50
-            )
-            if static[-1] == 1:
-                wins += 1
+        # only the winners are needed: use the batched simulator
+        winners = simulateMatchWinners(matchFormat, P1actual=0.65, P2actual=0.65, numSims=num_trials, seed=0)
+        wins = np.count_nonzero(winners == 1)
 
         # Should be roughly 50% with some variance
         assert 30 < wins < 70
@@ -231,3 +231,56 @@ class TestSimulateMatchWinProbabilityEvolution:
         assert len(dynamic) >= 2
         assert len(p1_updated) >= 1
         assert len(p2_updated) >= 1
+
+
+class TestSimulateMatchWinners:
+    """Tests for simulateMatchWinners function."""
+
+    def test_returns_one_winner_per_match(self):
+        winners = simulateMatchWinners(MatchFormat(bestOfSets=3), P1actual=0.65, P2actual=0.62, numSims=20, seed=1)
+        assert winners.dtype == np.int8
+        assert winners.shape == (20,)
+        assert set(winners.tolist()) <= {1, 2}
+
+    def test_deterministic_with_seed(self):
+        matchFormat = MatchFormat(bestOfSets=5)
+        winners1 = simulateMatchWinners(matchFormat, P1actual=0.65, P2actual=0.62, numSims=20, seed=7)
+        winners2 = simulateMatchWinners(matchFormat, P1actual=0.65, P2actual=0.62, numSims=20, seed=7)
+        np.testing.assert_array_equal(winners1, winners2)
+
+    def test_match_outcome_independent_of_batch_size(self):
+        # each match plays on its own substream, so a smaller batch is a prefix of a larger one
+        matchFormat = MatchFormat(bestOfSets=3)
+        winners5  = simulateMatchWinners(matchFormat, P1actual=0.65, P2actual=0.65, numSims=5,  seed=11)
+        winners20 = simulateMatchWinners(matchFormat, P1actual=0.65, P2actual=0.65, numSims=20, seed=11)
+        np.testing.assert_array_equal(winners5, winners20[:5])
+
+    def test_matches_use_distinct_substreams(self):
+        winners = simulateMatchWinners(MatchFormat(bestOfSets=3), P1actual=0.65, P2actual=0.65, numSims=40, seed=3)
+        assert 0 < np.count_nonzero(winners == 1) < 40
+
+    def test_parallel_matches_serial(self, monkeypatch):
+        # each match plays on its own substream, so splitting the batch across processes changes nothing
+        monkeypatch.setattr(match_simulation, "_PARALLEL_MIN_SIMS", 1)
+        matchFormat = MatchFormat(bestOfSets=3)
+        serial   = simulateMatchWinners(matchFormat, P1actual=0.65, P2actual=0.62, numSims=30, seed=5)
+        parallel = simulateMatchWinners(matchFormat, P1actual=0.65, P2actual=0.62, numSims=30, seed=5, numWorkers=3)
+        np.testing.assert_array_equal(serial, parallel)
+
+    def test_certain_outcomes(self):
+        # a player who always wins on serve and always breaks serve wins every match
+        winners = simulateMatchWinners(MatchFormat(bestOfSets=3), P1actual=1.0, P2actual=0.0, numSims=5, seed=0)
+        assert (winners == 1).all()
+
+    def test_invalid_inputs(self):
+        matchFormat = MatchFormat(bestOfSets=3)
+        with pytest.raises(ValueError):
+            simulateMatchWinners("best of 3", P1actual=0.65, P2actual=0.62, numSims=10)
+        with pytest.raises(ValueError):
+            simulateMatchWinners(matchFormat, P1actual=1.5, P2actual=0.62, numSims=10)
+        with pytest.raises(ValueError):
+            simulateMatchWinners(matchFormat, P1actual=0.65, P2actual=-0.1, numSims=10)
+        with pytest.raises(ValueError):
+            simulateMatchWinners(matchFormat, P1actual=0.65, P2actual=0.62, numSims=0)
+        with pytest.raises(ValueError):
+            simulateMatchWinners(matchFormat, P1actual=0.65, P2actual=0.62, numSims=10, numWorkers=0)
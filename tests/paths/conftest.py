@@ -0,0 +1,95 @@
+"""Shared fixtures for the paths tests."""
+
+import pytest
+import numpy as np
+from collections import namedtuple
+from functools   import lru_cache
+from tennis_lab.paths.match_path  import MatchPath
+from tennis_lab.paths.set_path    import SetPath
+from tennis_lab.core.match_score  import MatchScore
+from tennis_lab.core.set_score    import SetScore
+from tennis_lab.core.match_format import MatchFormat
+
+# Match formats shared by the paths tests (import them from this module)
+BEST_OF_3 = MatchFormat(bestOfSets=3)
+BEST_OF_5 = MatchFormat(bestOfSets=5)
+FORMATS   = {3: BEST_OF_3, 5: BEST_OF_5}
+
+
+@pytest.fixture(scope="session")
+def readonly_match_score():
+    """
+    Builder of MatchScore instances shared across tests: MatchScore(setsP1, setsP2, FORMATS[bestOf]).
+    Read-only: tests using it must not modify the returned score.
+    """
+    @lru_cache(maxsize=None)
+    def _readonly_match_score(setsP1, setsP2, bestOf=3):
+        return MatchScore(setsP1, setsP2, FORMATS[bestOf])
+    return _readonly_match_score
+
+
+# All the match paths starting from a given score, enumerated once per test session.
+# Read-only: tests using them must not modify the returned paths.
+@pytest.fixture(scope="session")
+def paths_bo3_from_00():
+    return tuple(MatchPath.generateAllPaths(MatchScore(0, 0, BEST_OF_3)))
+
+@pytest.fixture(scope="session")
+def paths_bo3_from_10():
+    return tuple(MatchPath.generateAllPaths(MatchScore(1, 0, BEST_OF_3)))
+
+@pytest.fixture(scope="session")
+def paths_bo3_from_01():
+    return tuple(MatchPath.generateAllPaths(MatchScore(0, 1, BEST_OF_3)))
+
+@pytest.fixture(scope="session")
+def paths_bo3_from_11():
+    return tuple(MatchPath.generateAllPaths(MatchScore(1, 1, BEST_OF_3)))
+
+@pytest.fixture(scope="session")
+def paths_bo5_from_00():
+    return tuple(MatchPath.generateAllPaths(MatchScore(0, 0, BEST_OF_5)))
+
+@pytest.fixture(scope="session")
+def paths_bo5_from_22():
+    return tuple(MatchPath.generateAllPaths(MatchScore(2, 2, BEST_OF_5)))
+
+
+@pytest.fixture(scope="session")
+def readonly_set_paths():
+    """
+    Builder of all the set paths starting from a given score, with a given player serving next game:
+    SetPath.generateAllPaths(SetScore(gamesP1, gamesP2, False, BEST_OF_3), playerServing).
+    Each enumeration is built once per test session.
+    Read-only: tests using it must not modify the returned paths.
+    """
+    @lru_cache(maxsize=None)
+    def _readonly_set_paths(gamesP1, gamesP2, playerServing):
+        return tuple(SetPath.generateAllPaths(SetScore(gamesP1, gamesP2, False, BEST_OF_3), playerServing))
+    return _readonly_set_paths
+
+
+# Per-path facts gathered in a single pass over an enumeration, one array entry per path:
+# the match winner, the final set score from Player1's POV and the length of the score history.
+PathSummary = namedtuple('PathSummary', ('paths', 'winners', 'p1_final', 'p2_final', 'lengths'))
+
+@pytest.fixture(scope="session")
+def path_summary():
+    """
+    Builder of the PathSummary of an enumeration of match paths (as returned by the path fixtures).
+    Each enumeration is summarized once per test session.
+    """
+    @lru_cache(maxsize=None)
+    def _path_summary(paths):
+        n        = len(paths)
+        winners  = np.empty(n, dtype=np.int8)
+        p1_final = np.empty(n, dtype=np.int8)
+        p2_final = np.empty(n, dtype=np.int8)
+        lengths  = np.empty(n, dtype=np.int16)
+        for i, path in enumerate(paths):
+            last = path.scoreHistory[-1]
+            winners[i]                = last.winner
+            p1_final[i], p2_final[i]  = last.sets(pov=1)
+            lengths[i]                = len(path.scoreHistory)
+        return PathSummary(paths, winners, p1_final, p2_final, lengths)
+    return _path_summary
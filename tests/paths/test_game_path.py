@@ -1,5 +1,6 @@
 """Tests for the GamePath class."""
 
+import numpy as np
 import pytest
 from tennis_lab.paths.game_path import GamePath
 from tennis_lab.core.game_score     import GameScore
@@ -10,6 +11,16 @@ DEFAULT_FORMAT = MatchFormat(bestOfSets=3)
 NO_AD_FORMAT   = MatchFormat(bestOfSets=3, noAdRule=True)
 
 
+# All paths from 0-0, generated once per module (tests only read them)
+@pytest.fixture(scope="module")
+def blank_paths():
+    return GamePath.generateAllPaths(GameScore(0, 0, DEFAULT_FORMAT))
+
+@pytest.fixture(scope="module")
+def blank_no_ad_paths():
+    return GamePath.generateAllPaths(GameScore(0, 0, NO_AD_FORMAT))
+
+
 class TestGamePathInit:
     """Tests for GamePath initialization."""
 
@@ -54,6 +65,30 @@ class TestGamePathScoreHistory:
         assert len(path.scoreHistory) == 1
 
 
+class TestGamePathFinalWinner:
+    """Tests for finalWinner property."""
+
+    def test_final_winner_of_final_score(self):
+        assert GamePath(GameScore(4, 1, DEFAULT_FORMAT)).finalWinner == 1
+        assert GamePath(GameScore(2, 4, DEFAULT_FORMAT)).finalWinner == 2
+
+    def test_final_winner_none_before_game_over(self):
+        assert GamePath(GameScore(3, 3, DEFAULT_FORMAT)).finalWinner is None
+        path1, path2 = GamePath(GameScore(3, 2, DEFAULT_FORMAT)).increment()
+        assert path1.finalWinner == 1
+        assert path2.finalWinner is None
+
+
+class TestGamePathFinalPoints:
+    """Tests for finalPoints property."""
+
+    def test_final_points(self):
+        assert GamePath(GameScore(2, 1, DEFAULT_FORMAT)).finalPoints == (2, 1)
+        path1, path2 = GamePath(GameScore(3, 2, DEFAULT_FORMAT)).increment()
+        assert path1.finalPoints == (4, 2)
+        assert path2.finalPoints == (3, 3)
+
+
 class TestGamePathIncrement:
     """Tests for increment method."""
 
@@ -88,7 +123,8 @@ class TestGamePathIncrement:
 
         # Should return a copy of self, not a tuple
         assert isinstance(result, GamePath)
-        assert result is not path  # deepcopy
+        assert result is not path
+        assert result.scoreHistory is path.scoreHistory  # shares the (immutable) score tuple
         assert len(result.scoreHistory) == 1
         assert result.scoreHistory[0].asPoints(1) == (4, 0)
 
@@ -107,25 +143,33 @@ class TestGamePathIncrement:
         path = GamePath(gs)
         path1, path2 = path.increment()
 
-        # Modifying one shouldn't affect the other
-        path1._scores.append(GameScore(2, 0, DEFAULT_FORMAT))
+        # Extending one shouldn't affect the other, nor the path they came from
+        path1.increment()
+        assert len(path1.scoreHistory) == 2
         assert len(path2.scoreHistory) == 2
+        assert len(path.scoreHistory) == 1
+
+    def test_increment_shares_prefix(self):
+        gs = GameScore(0, 0, DEFAULT_FORMAT)
+        path = GamePath(gs)
+        path1, path2 = path.increment()
+        assert isinstance(path1.scoreHistory, tuple)
+        assert path1.scoreHistory[0] is gs
+        assert path2.scoreHistory[0] is gs
 
 
 class TestGamePathGenerateAllPaths:
     """Tests for generateAllPaths static method."""
 
-    def test_generate_from_blank_standard_scoring(self):
-        gs = GameScore(0, 0, DEFAULT_FORMAT)
-        paths = GamePath.generateAllPaths(gs)
+    def test_generate_from_blank_standard_scoring(self, blank_paths):
+        paths = blank_paths
 
         # From 0-0, there are 50 possible paths (to win or deuce)
         # This includes paths ending in deuce (3-3)
         assert len(paths) == 50
 
-    def test_generate_from_blank_no_ad(self):
-        gs = GameScore(0, 0, NO_AD_FORMAT)
-        paths = GamePath.generateAllPaths(gs)
+    def test_generate_from_blank_no_ad(self, blank_no_ad_paths):
+        paths = blank_no_ad_paths
 
         # With no-ad rule, deuce (3-3) decides on next point
         # So we get more complete paths
@@ -176,6 +220,53 @@ class TestGamePathGenerateAllPaths:
             # Either game is over or it's deuce (with standard scoring)
             assert last_score.isFinal or last_score.isDeuce
 
+    def test_generate_is_cached_per_score_and_format(self):
+        paths1 = GamePath.generateAllPaths(GameScore(1, 2, DEFAULT_FORMAT))
+        paths2 = GamePath.generateAllPaths(GameScore(1, 2, DEFAULT_FORMAT))
+        # same paths, but each caller gets its own GamePath instances
+        assert [str(path) for path in paths1] == [str(path) for path in paths2]
+        assert all(path1 is not path2 for path1, path2 in zip(paths1, paths2))
+        # a different format yields different paths
+        paths3 = GamePath.generateAllPaths(GameScore(1, 2, NO_AD_FORMAT))
+        assert len(paths3) != len(paths1)
+
+    def test_generate_cache_shared_by_equal_formats(self):
+        GamePath.generateAllPaths(GameScore(0, 1, DEFAULT_FORMAT))
+        hits = GamePath._generateAllPointPaths.cache_info().hits
+        # an equal format, constructed separately, hits the same cache entry
+        GamePath.generateAllPaths(GameScore(0, 1, MatchFormat(bestOfSets=3, capPoints=True)))
+        assert GamePath._generateAllPointPaths.cache_info().hits == hits + 1
+
+    def test_generate_starts_with_initial_score_object(self):
+        gs = GameScore(1, 1, DEFAULT_FORMAT)
+        paths = GamePath.generateAllPaths(gs)
+        assert all(path.scoreHistory[0] is gs for path in paths)
+
+    def test_generate_one_score_object_per_distinct_score(self):
+        paths1 = GamePath.generateAllPaths(GameScore(0, 0, DEFAULT_FORMAT))
+        paths2 = GamePath.generateAllPaths(GameScore(0, 0, DEFAULT_FORMAT))
+        # within a call, paths through 1-0 share its GameScore; across calls nothing is shared
+        scores1 = {id(path.scoreHistory[1]) for path in paths1 if path.scoreHistory[1].asPoints(1) == (1, 0)}
+        scores2 = {id(path.scoreHistory[1]) for path in paths2 if path.scoreHistory[1].asPoints(1) == (1, 0)}
+        assert len(scores1) == len(scores2) == 1
+        assert scores1 != scores2
+
+    def test_mutating_returned_paths_does_not_affect_cache(self):
+        gs = GameScore(2, 1, DEFAULT_FORMAT)
+        paths1 = GamePath.generateAllPaths(gs)
+        expected = [str(path) for path in paths1]
+
+        # mutate a score held by a returned path, and the path itself
+        paths1[0].scoreHistory[1].recordPoint(2)
+        paths1[1]._scores += (GameScore(0, 0, DEFAULT_FORMAT),)
+
+        paths2 = GamePath.generateAllPaths(GameScore(2, 1, DEFAULT_FORMAT))
+        assert [str(path) for path in paths2] == expected
+
+    def test_generate_invalid_score_type(self):
+        with pytest.raises(ValueError):
+            GamePath.generateAllPaths((0, 0))
+
 
 class TestGamePathStr:
     """Tests for __str__ method."""
@@ -208,9 +299,8 @@ class TestGamePathStr:
 class TestGamePathDeuceBehavior:
     """Tests for deuce handling in path generation."""
 
-    def test_paths_stop_at_deuce_standard_scoring(self):
-        gs = GameScore(0, 0, DEFAULT_FORMAT)
-        paths = GamePath.generateAllPaths(gs)
+    def test_paths_stop_at_deuce_standard_scoring(self, blank_paths):
+        paths = blank_paths
 
         # Find paths that end in deuce
         deuce_paths = [p for p in paths if p.scoreHistory[-1].isDeuce]
@@ -220,11 +310,10 @@ class TestGamePathDeuceBehavior:
 
         # These paths should not continue beyond deuce
         for path in deuce_paths:
-            assert path.scoreHistory[-1].asPoints(1) == (3, 3)
+            assert path.finalPoints == (3, 3)
 
-    def test_paths_continue_past_deuce_no_ad(self):
-        gs = GameScore(0, 0, NO_AD_FORMAT)
-        paths = GamePath.generateAllPaths(gs)
+    def test_paths_continue_past_deuce_no_ad(self, blank_no_ad_paths):
+        paths = blank_no_ad_paths
 
         # No paths should end in deuce with no-ad rule
         deuce_paths = [p for p in paths if p.scoreHistory[-1].isDeuce]
@@ -238,27 +327,22 @@ class TestGamePathDeuceBehavior:
 class TestGamePathWinnerDistribution:
     """Tests verifying correct distribution of winning paths."""
 
-    def test_p1_and_p2_win_paths_exist(self):
-        gs = GameScore(0, 0, DEFAULT_FORMAT)
-        paths = GamePath.generateAllPaths(gs)
-
-        # Filter for complete paths (not ending in deuce)
-        complete_paths = [p for p in paths if p.scoreHistory[-1].isFinal]
+    def test_p1_and_p2_win_paths_exist(self, blank_paths):
+        paths = blank_paths
 
-        p1_wins = [p for p in complete_paths if p.scoreHistory[-1].winner == 1]
-        p2_wins = [p for p in complete_paths if p.scoreHistory[-1].winner == 2]
+        # Winner of each complete path (0 for paths ending in deuce)
+        winners = np.fromiter((p.finalWinner or 0 for p in paths), dtype=np.int8)
 
-        assert len(p1_wins) > 0
-        assert len(p2_wins) > 0
+        assert (winners == 1).any()
+        assert (winners == 2).any()
 
-    def test_symmetric_paths_from_blank(self):
-        gs = GameScore(0, 0, DEFAULT_FORMAT)
-        paths = GamePath.generateAllPaths(gs)
+    def test_symmetric_paths_from_blank(self, blank_paths):
+        paths = blank_paths
 
-        complete_paths = [p for p in paths if p.scoreHistory[-1].isFinal]
+        winners = np.fromiter((p.finalWinner or 0 for p in paths), dtype=np.int8)
 
-        p1_wins = len([p for p in complete_paths if p.scoreHistory[-1].winner == 1])
-        p2_wins = len([p for p in complete_paths if p.scoreHistory[-1].winner == 2])
+        p1_wins = int((winners == 1).sum())
+        p2_wins = int((winners == 2).sum())
 
         # From 0-0, the number of P1 and P2 winning paths should be equal
         assert p1_wins == p2_wins
@@ -267,10 +351,10 @@ class TestGamePathWinnerDistribution:
         gs = GameScore(2, 0, DEFAULT_FORMAT)
         paths = GamePath.generateAllPaths(gs)
 
-        complete_paths = [p for p in paths if p.scoreHistory[-1].isFinal]
+        winners = np.fromiter((p.finalWinner or 0 for p in paths), dtype=np.int8)
 
-        p1_wins = len([p for p in complete_paths if p.scoreHistory[-1].winner == 1])
-        p2_wins = len([p for p in complete_paths if p.scoreHistory[-1].winner == 2])
+        p1_wins = int((winners == 1).sum())
+        p2_wins = int((winners == 2).sum())
 
         # From 30-0 (2-0), P1 should have more winning paths
         assert p1_wins > p2_wins
@@ -279,14 +363,12 @@ class TestGamePathWinnerDistribution:
 class TestGamePathSpecificScenarios:
     """Tests for specific game scenarios."""
 
-    def test_love_game_path(self):
+    def test_love_game_path(self, blank_paths):
         """Test the path where server wins 4-0."""
-        gs = GameScore(0, 0, DEFAULT_FORMAT)
-        paths = GamePath.generateAllPaths(gs)
+        paths = blank_paths
 
         # Find the love game path (all P1 wins)
-        love_paths = [p for p in paths
-                      if p.scoreHistory[-1].asPoints(1) == (4, 0)]
+        love_paths = [p for p in paths if p.finalPoints == (4, 0)]
 
         assert len(love_paths) == 1
         love_path = love_paths[0]
@@ -298,10 +380,9 @@ class TestGamePathSpecificScenarios:
         for i, score in enumerate(love_path.scoreHistory):
             assert score.asPoints(1) == expected[i]
 
-    def test_deuce_path(self):
+    def test_deuce_path(self, blank_paths):
         """Test a path that reaches deuce."""
-        gs = GameScore(0, 0, DEFAULT_FORMAT)
-        paths = GamePath.generateAllPaths(gs)
+        paths = blank_paths
 
         # Find a path ending in deuce
         deuce_paths = [p for p in paths if p.scoreHistory[-1].isDeuce]
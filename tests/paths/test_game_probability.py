@@ -2,8 +2,9 @@
 
 import pytest
 import math
+import numpy as np
 from tennis_lab.paths.game_path import GamePath
-from tennis_lab.paths.game_probability import pathProbability, probabilityServerWinsGame, loadCachedFunction
+from tennis_lab.paths.game_probability import pathProbability, probabilityServerWinsGame, probabilityServerWinsGameArray, loadCachedFunction
 from tennis_lab.core.game_score import GameScore
 from tennis_lab.core.match_format import MatchFormat
 
@@ -12,6 +13,23 @@ DEFAULT_FORMAT = MatchFormat(bestOfSets=3)
 NO_AD_FORMAT = MatchFormat(bestOfSets=3, noAdRule=True)
 NO_CAP_FORMAT = MatchFormat(bestOfSets=3, capPoints=False)
 
+# Expected path probabilities used by the pathProbability tests
+LOVE_GAME_PROB_06    = 0.6**4                 # server wins 4 points in a row, p=0.6
+LOVE_GAME_PROB_07    = 0.7**4                 # server wins 4 points in a row, p=0.7
+ALTERNATING_DEUCE_06 = (0.6**3) * (0.4**3)    # points alternate until deuce, p=0.6
+
+
+@pytest.fixture(scope="module")
+def all_paths_by_history():
+    """All game paths from 0-0, keyed on their score history (as points, from P1's POV)."""
+    paths = GamePath.generateAllPaths(GameScore(0, 0, DEFAULT_FORMAT))
+    return {tuple(s.asPoints(1) for s in p.scoreHistory): p for p in paths}
+
+@pytest.fixture(scope="module")
+def blank_path():
+    """A path made of the single score 0-0."""
+    return GamePath(GameScore(0, 0, DEFAULT_FORMAT))
+
 
 # =============================================================================
 # Tests for pathProbability
@@ -28,50 +46,30 @@ class TestPathProbabilityValidation:
         with pytest.raises(ValueError, match="path must be a GamePath"):
             pathProbability(None, 1, 0.6)
 
-    def test_invalid_player_to_serve_zero(self):
-        gs = GameScore(0, 0, DEFAULT_FORMAT)
-        path = GamePath(gs)
-        with pytest.raises(ValueError, match="playerServing must be 1 or 2"):
-            pathProbability(path, 0, 0.6)
-
-    def test_invalid_player_to_serve_three(self):
-        gs = GameScore(0, 0, DEFAULT_FORMAT)
-        path = GamePath(gs)
-        with pytest.raises(ValueError, match="playerServing must be 1 or 2"):
-            pathProbability(path, 3, 0.6)
-
-    def test_invalid_prob_negative(self):
-        gs = GameScore(0, 0, DEFAULT_FORMAT)
-        path = GamePath(gs)
-        with pytest.raises(ValueError, match="probWinPoint must be a number"):
-            pathProbability(path, 1, -0.1)
-
-    def test_invalid_prob_greater_than_one(self):
-        gs = GameScore(0, 0, DEFAULT_FORMAT)
-        path = GamePath(gs)
-        with pytest.raises(ValueError, match="probWinPoint must be a number"):
-            pathProbability(path, 1, 1.1)
-
-    def test_valid_prob_zero(self):
-        gs = GameScore(0, 0, DEFAULT_FORMAT)
-        path = GamePath(gs)
+    @pytest.mark.parametrize("playerServing, probWinPoint, message", [
+        (0, 0.6,  "playerServing must be 1 or 2"),
+        (3, 0.6,  "playerServing must be 1 or 2"),
+        (1, -0.1, "probWinPoint must be a number"),
+        (1, 1.1,  "probWinPoint must be a number"),
+    ])
+    def test_invalid_inputs(self, blank_path, playerServing, probWinPoint, message):
+        with pytest.raises(ValueError, match=message):
+            pathProbability(blank_path, playerServing, probWinPoint)
+
+    def test_valid_prob_zero(self, blank_path):
         # Should not raise
-        result = pathProbability(path, 1, 0.0)
+        result = pathProbability(blank_path, 1, 0.0)
         assert result == 1.0  # Single score, no transitions
 
-    def test_valid_prob_one(self):
-        gs = GameScore(0, 0, DEFAULT_FORMAT)
-        path = GamePath(gs)
-        result = pathProbability(path, 1, 1.0)
+    def test_valid_prob_one(self, blank_path):
+        result = pathProbability(blank_path, 1, 1.0)
         assert result == 1.0
 
-    def test_valid_prob_integer(self):
-        gs = GameScore(0, 0, DEFAULT_FORMAT)
-        path = GamePath(gs)
+    def test_valid_prob_integer(self, blank_path):
         # Integer 0 and 1 should be accepted
-        result = pathProbability(path, 1, 0)
+        result = pathProbability(blank_path, 1, 0)
         assert result == 1.0
-        result = pathProbability(path, 1, 1)
+        result = pathProbability(blank_path, 1, 1)
         assert result == 1.0
 
 
@@ -93,113 +91,69 @@ class TestPathProbabilitySingleScore:
 class TestPathProbabilityLoveGame:
     """Tests for love game paths (server wins 4-0)."""
 
-    def test_love_game_p1_serves(self):
+    def test_love_game_p1_serves(self, all_paths_by_history):
         """Path: 0-0 -> 1-0 -> 2-0 -> 3-0 -> 4-0"""
-        gs = GameScore(0, 0, DEFAULT_FORMAT)
-        paths = GamePath.generateAllPaths(gs)
-
-        # Find the love game path
-        love_path = None
-        for p in paths:
-            if p.scoreHistory[-1].asPoints(1) == (4, 0):
-                love_path = p
-                break
-
-        assert love_path is not None
+        love_path = all_paths_by_history[((0, 0), (1, 0), (2, 0), (3, 0), (4, 0))]
 
         # With p=0.6, probability is 0.6^4 = 0.1296
         prob = pathProbability(love_path, 1, 0.6)
-        assert math.isclose(prob, 0.6**4, rel_tol=1e-9)
+        assert math.isclose(prob, LOVE_GAME_PROB_06, rel_tol=1e-9)
 
-    def test_love_game_p2_serves(self):
+    def test_love_game_p2_serves(self, all_paths_by_history):
         """When P2 serves, the love game means P2 wins all points."""
-        gs = GameScore(0, 0, DEFAULT_FORMAT)
-        paths = GamePath.generateAllPaths(gs)
-
-        # Find path where receiver wins 0-4 (from P1's POV)
-        receiver_love_path = None
-        for p in paths:
-            if p.scoreHistory[-1].asPoints(1) == (0, 4):
-                receiver_love_path = p
-                break
-
-        assert receiver_love_path is not None
+        # Path where receiver wins 0-4 (from P1's POV)
+        receiver_love_path = all_paths_by_history[((0, 0), (0, 1), (0, 2), (0, 3), (0, 4))]
 
         # P2 serves, wins all points with prob 0.7
         # Path from P2's POV: 0-0 -> 1-0 -> 2-0 -> 3-0 -> 4-0
         prob = pathProbability(receiver_love_path, 2, 0.7)
-        assert math.isclose(prob, 0.7**4, rel_tol=1e-9)
+        assert math.isclose(prob, LOVE_GAME_PROB_07, rel_tol=1e-9)
 
 
 class TestPathProbabilityMixedPaths:
     """Tests for paths with mixed point outcomes."""
 
-    def test_alternating_path_to_deuce(self):
+    def test_alternating_path_to_deuce(self, all_paths_by_history):
         """Path: 0-0 -> 1-0 -> 1-1 -> 2-1 -> 2-2 -> 3-2 -> 3-3"""
-        gs = GameScore(0, 0, DEFAULT_FORMAT)
-        paths = GamePath.generateAllPaths(gs)
-
-        # Find alternating path to deuce
-        target_scores = [(0, 0), (1, 0), (1, 1), (2, 1), (2, 2), (3, 2), (3, 3)]
-        alternating_path = None
-        for p in paths:
-            scores = [s.asPoints(1) for s in p.scoreHistory]
-            if scores == target_scores:
-                alternating_path = p
-                break
-
-        assert alternating_path is not None
+        alternating_path = all_paths_by_history[((0, 0), (1, 0), (1, 1), (2, 1), (2, 2), (3, 2), (3, 3))]
 
         # P1 serves with prob 0.6
         # Points: P1 wins, P2 wins, P1 wins, P2 wins, P1 wins, P2 wins
         # Prob = 0.6 * 0.4 * 0.6 * 0.4 * 0.6 * 0.4
-        expected = (0.6 ** 3) * (0.4 ** 3)
         prob = pathProbability(alternating_path, 1, 0.6)
-        assert math.isclose(prob, expected, rel_tol=1e-9)
+        assert math.isclose(prob, ALTERNATING_DEUCE_06, rel_tol=1e-9)
 
-    def test_path_15_40_then_win(self):
+    def test_path_15_40_then_win(self, all_paths_by_history):
         """Test a specific path where server falls behind then wins."""
-        gs = GameScore(0, 0, DEFAULT_FORMAT)
-        paths = GamePath.generateAllPaths(gs)
-
-        # Find path: 0-0 -> 1-0 -> 1-1 -> 1-2 -> 1-3 -> 2-3 -> 3-3 (deuce)
-        target = [(0, 0), (1, 0), (1, 1), (1, 2), (1, 3), (2, 3), (3, 3)]
-        target_path = None
-        for p in paths:
-            scores = [s.asPoints(1) for s in p.scoreHistory]
-            if scores == target:
-                target_path = p
-                break
-
-        if target_path is not None:
-            # P1 serves: wins 1, loses 3, wins 2
-            # Prob = p * (1-p)^3 * p^2 = p^3 * (1-p)^3
-            p = 0.5
-            expected = (p ** 3) * ((1 - p) ** 3)
-            prob = pathProbability(target_path, 1, p)
-            assert math.isclose(prob, expected, rel_tol=1e-9)
+        # Path: 0-0 -> 1-0 -> 1-1 -> 1-2 -> 1-3 -> 2-3 -> 3-3 (deuce)
+        target_path = all_paths_by_history[((0, 0), (1, 0), (1, 1), (1, 2), (1, 3), (2, 3), (3, 3))]
+
+        # P1 serves: wins 1, loses 3, wins 2
+        # Prob = p * (1-p)^3 * p^2 = p^3 * (1-p)^3
+        p = 0.5
+        expected = (p ** 3) * ((1 - p) ** 3)
+        prob = pathProbability(target_path, 1, p)
+        assert math.isclose(prob, expected, rel_tol=1e-9)
+
+    def test_capped_path_back_to_deuce(self):
+        """Path: 3-3 -> 3-4 -> 3-3, with capped scores the server wins the 2nd point."""
+        path = GamePath(GameScore(3, 3, DEFAULT_FORMAT))
+        _, adOut = path.increment()
+        deuce, _ = adOut.increment()
+        assert [s.asPoints(1) for s in deuce.scoreHistory] == [(3, 3), (3, 4), (3, 3)]
+
+        prob = pathProbability(deuce, 1, 0.6)
+        assert math.isclose(prob, 0.6 * 0.4, rel_tol=1e-9)
 
 
 class TestPathProbabilitySymmetry:
     """Tests for symmetry properties."""
 
-    def test_player_symmetry(self):
+    def test_player_symmetry(self, all_paths_by_history):
         """Swapping server should give complementary probabilities for mirrored paths."""
-        gs = GameScore(0, 0, DEFAULT_FORMAT)
-        paths = GamePath.generateAllPaths(gs)
-
-        # Find love game for P1 (4-0) and love game for P2 (0-4)
-        p1_love = None
-        p2_love = None
-        for p in paths:
-            final = p.scoreHistory[-1].asPoints(1)
-            if final == (4, 0):
-                p1_love = p
-            elif final == (0, 4):
-                p2_love = p
-
-        assert p1_love is not None
-        assert p2_love is not None
+        # Love game for P1 (4-0) and love game for P2 (0-4)
+        p1_love = all_paths_by_history[((0, 0), (1, 0), (2, 0), (3, 0), (4, 0))]
+        p2_love = all_paths_by_history[((0, 0), (0, 1), (0, 2), (0, 3), (0, 4))]
 
         prob = 0.6
         # P1 serves, wins love game
@@ -208,8 +162,8 @@ class TestPathProbabilitySymmetry:
         p2_wins = pathProbability(p2_love, 2, prob)
 
         # Both should equal prob^4
-        assert math.isclose(p1_wins, prob**4, rel_tol=1e-9)
-        assert math.isclose(p2_wins, prob**4, rel_tol=1e-9)
+        assert math.isclose(p1_wins, LOVE_GAME_PROB_06, rel_tol=1e-9)
+        assert math.isclose(p2_wins, LOVE_GAME_PROB_06, rel_tol=1e-9)
 
 
 # =============================================================================
@@ -227,15 +181,14 @@ class TestProbabilityServerWinsGameValidation:
         with pytest.raises(ValueError, match="initScore must be a GameScore"):
             probabilityServerWinsGame(None, 1, 0.6)
 
-    def test_invalid_player_to_serve(self):
+    @pytest.mark.parametrize("playerServing, probWinPoint, message", [
+        (0, 0.6, "playerServing must be 1 or 2"),
+        (1, 1.5, "probWinPoint must be a number"),
+    ])
+    def test_invalid_inputs(self, playerServing, probWinPoint, message):
         gs = GameScore(0, 0, DEFAULT_FORMAT)
-        with pytest.raises(ValueError, match="playerServing must be 1 or 2"):
-            probabilityServerWinsGame(gs, 0, 0.6)
-
-    def test_invalid_prob_win_point(self):
-        gs = GameScore(0, 0, DEFAULT_FORMAT)
-        with pytest.raises(ValueError, match="probWinPoint must be a number"):
-            probabilityServerWinsGame(gs, 1, 1.5)
+        with pytest.raises(ValueError, match=message):
+            probabilityServerWinsGame(gs, playerServing, probWinPoint)
 
 
 class TestProbabilityServerWinsGameFromBlank:
@@ -296,10 +249,10 @@ class TestProbabilityServerWinsGameFromDeuce:
     def test_from_deuce_various_probs(self):
         """Test deuce formula with various probabilities."""
         gs = GameScore(3, 3, DEFAULT_FORMAT)
-        for p in [0.3, 0.4, 0.5, 0.6, 0.7, 0.8]:
-            expected = p**2 / (1 - 2*p*(1 - p))
-            prob = probabilityServerWinsGame(gs, 1, p)
-            assert math.isclose(prob, expected, rel_tol=1e-9)
+        ps = np.array([0.3, 0.4, 0.5, 0.6, 0.7, 0.8])
+        expected = ps**2 / (1 - 2*ps*(1 - ps))
+        probs = probabilityServerWinsGameArray(gs, 1, ps)
+        np.testing.assert_allclose(probs, expected, rtol=1e-9)
 
 
 class TestProbabilityServerWinsGameFromAdvantage:
@@ -354,21 +307,19 @@ class TestProbabilityServerWinsGameMonotonicity:
     def test_monotonically_increasing(self):
         """Higher p should give higher game win probability."""
         gs = GameScore(0, 0, DEFAULT_FORMAT)
-        probs = [probabilityServerWinsGame(gs, 1, p/10) for p in range(1, 10)]
-
-        for i in range(len(probs) - 1):
-            assert probs[i] < probs[i + 1]
+        probs = probabilityServerWinsGameArray(gs, 1, np.arange(1, 10) / 10)
+        assert np.all(np.diff(probs) > 0)
 
     def test_monotonic_from_any_score(self):
         """Monotonicity holds from any starting score."""
+        ps = np.arange(1, 10) / 10
         for pts1 in range(4):
             for pts2 in range(4):
                 gs = GameScore(pts1, pts2, DEFAULT_FORMAT)
                 if gs.isFinal:
                     continue
-                probs = [probabilityServerWinsGame(gs, 1, p/10) for p in range(1, 10)]
-                for i in range(len(probs) - 1):
-                    assert probs[i] < probs[i + 1]
+                probs = probabilityServerWinsGameArray(gs, 1, ps)
+                assert np.all(np.diff(probs) > 0), (pts1, pts2)
 
 
 class TestProbabilityServerWinsGameFinalScores:
@@ -409,6 +360,13 @@ class TestProbabilityServerWinsGameFinalScores:
         expected = p * prob_deuce
         assert math.isclose(prob, expected, rel_tol=1e-9)
 
+    def test_advantage_receiver_capped(self):
+        """Receiver at advantage (3-4) with capped scoring: same as uncapped."""
+        p = 0.6
+        prob_capped   = probabilityServerWinsGame(GameScore(3, 4, DEFAULT_FORMAT), 1, p)
+        prob_uncapped = probabilityServerWinsGame(GameScore(3, 4, NO_CAP_FORMAT),  1, p)
+        assert math.isclose(prob_capped, prob_uncapped, rel_tol=1e-9)
+
 
 class TestProbabilityServerWinsGameNoAd:
     """Tests for no-ad scoring."""
@@ -446,36 +404,67 @@ class TestProbabilityServerWinsGameNoAd:
 class TestProbabilityServerWinsGameProbabilitySum:
     """Tests verifying probability properties."""
 
-    def test_all_path_probs_sum_to_one(self):
+    def test_all_path_probs_sum_to_one(self, all_paths_by_history):
         """Sum of all path probabilities should equal 1."""
-        gs = GameScore(0, 0, DEFAULT_FORMAT)
-        paths = GamePath.generateAllPaths(gs)
+        # paths from 0-0 end at a final score or at the first deuce (a deuce path stands
+        # for all its continuations), so the final score gives the points won by each player
+        finalPoints = np.array([history[-1] for history in all_paths_by_history])
+        wins, losses = finalPoints[:, 0], finalPoints[:, 1]
 
         p = 0.6
-        total = 0.0
-        for path in paths:
-            prob = pathProbability(path, 1, p)
-            last = path.scoreHistory[-1]
-            if last.isDeuce:
-                # Deuce path represents infinite paths, but probability is finite
-                total += prob
-            else:
-                total += prob
-
-        # Total should be 1 (accounting for deuce formula)
-        # Actually, paths to deuce + paths to final scores = 1
+        total = np.sum(p**wins * (1 - p)**losses)
         assert math.isclose(total, 1.0, rel_tol=1e-9)
 
     def test_win_plus_loss_equals_one(self):
-        """P(server wins) + P(server loses) = 1."""
-        gs = GameScore(0, 0, DEFAULT_FORMAT)
+        """P(server wins) + P(receiver wins) = 1."""
         p = 0.6
-        prob_win = probabilityServerWinsGame(gs, 1, p)
+        for fmt in [DEFAULT_FORMAT, NO_AD_FORMAT]:
+            for score in [(0, 0), (2, 1), (1, 3), (3, 3), (4, 3)]:
+                gs = GameScore(*score, fmt)
+                prob_win = probabilityServerWinsGame(gs, 1, p)
 
-        # Calculate prob of losing (swap perspective)
-        # Server loses = receiver wins
-        # This equals 1 - prob_win
-        assert math.isclose(prob_win + (1 - prob_win), 1.0, rel_tol=1e-9)
+                # The receiver wins the game with the same calculation, from their point
+                # of view: P2 'serving' and winning each point with probability 1-p
+                prob_lose = probabilityServerWinsGame(gs, 2, 1 - p)
+                assert math.isclose(prob_win + prob_lose, 1.0, rel_tol=1e-9), (fmt, score)
+
+
+# =============================================================================
+# Tests for probabilityServerWinsGameArray
+# =============================================================================
+
+class TestProbabilityServerWinsGameArray:
+    """Tests for the vectorized probabilityServerWinsGame."""
+
+    PROBS = np.linspace(0, 1, 11)
+
+    def test_matches_scalar_version(self):
+        for fmt in [DEFAULT_FORMAT, NO_AD_FORMAT, NO_CAP_FORMAT]:
+            for score in [(0, 0), (2, 1), (3, 3), (4, 3), (3, 4), (5, 5)]:
+                gs = GameScore(*score, fmt)
+                for playerServing in [1, 2]:
+                    probs    = probabilityServerWinsGameArray(gs, playerServing, self.PROBS)
+                    expected = [probabilityServerWinsGame(gs, playerServing, p) for p in self.PROBS]
+                    assert np.allclose(probs, expected, rtol=1e-12, atol=0)
+
+    def test_final_score(self):
+        gs = GameScore(4, 1, DEFAULT_FORMAT)
+        assert np.array_equal(probabilityServerWinsGameArray(gs, 1, self.PROBS), np.ones(11))
+        assert np.array_equal(probabilityServerWinsGameArray(gs, 2, self.PROBS), np.zeros(11))
+
+    def test_invalid_prob_win_point(self):
+        gs = GameScore(0, 0, DEFAULT_FORMAT)
+        with pytest.raises(ValueError, match="all probWinPoint must be numbers between 0 and 1"):
+            probabilityServerWinsGameArray(gs, 1, [0.5, 1.5])
+
+    def test_no_ad_deuce_does_not_alias_input(self):
+        # under 'no ad' scoring the probability from deuce is 'probWinPoint' itself
+        gs    = GameScore(3, 3, NO_AD_FORMAT)
+        probs = self.PROBS.copy()
+        result = probabilityServerWinsGameArray(gs, 1, probs)
+        assert result is not probs
+        result[0] = 9
+        assert np.array_equal(probs, self.PROBS)
 
 
 # =============================================================================
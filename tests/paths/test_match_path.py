@@ -1,50 +1,50 @@
 """Tests for the MatchPath class."""
 
 import pytest
+import numpy as np
 from tennis_lab.paths.match_path import MatchPath
 from tennis_lab.core.match_score import MatchScore
-from tennis_lab.core.match_format import MatchFormat
 from tennis_lab.core.set_score import SetScore
+from .conftest import BEST_OF_3
 
-# Default match formats for tests
-BEST_OF_3 = MatchFormat(bestOfSets=3)
-BEST_OF_5 = MatchFormat(bestOfSets=5)
+# Helper counting the paths of a PathSummary by final score, as a matrix indexed by [P1 sets, P2 sets]
+def final_score_counts(summary, setsToWin: int) -> np.ndarray:
+    n   = setsToWin + 1
+    key = summary.p1_final.astype(np.intp) * n + summary.p2_final
+    return np.bincount(key, minlength=n * n).reshape(n, n)
 
 
 class TestMatchPathInit:
     """Tests for MatchPath initialization."""
 
-    def test_init_with_blank_score(self):
-        ms = MatchScore(0, 0, BEST_OF_3)
+    def test_init_with_blank_score(self, readonly_match_score):
+        ms = readonly_match_score(0, 0, 3)
         path = MatchPath(ms)
         assert len(path.scoreHistory) == 1
         assert path.scoreHistory[0].sets(pov=1) == (0, 0)
 
-    def test_init_with_non_zero_score(self):
-        ms = MatchScore(1, 0, BEST_OF_3)
+    def test_init_with_non_zero_score(self, readonly_match_score):
+        ms = readonly_match_score(1, 0, 3)
         path = MatchPath(ms)
         assert len(path.scoreHistory) == 1
         assert path.scoreHistory[0].sets(pov=1) == (1, 0)
 
-    def test_init_with_final_score(self):
-        ms = MatchScore(2, 0, BEST_OF_3)
+    def test_init_with_final_score(self, readonly_match_score):
+        ms = readonly_match_score(2, 0, 3)
         path = MatchPath(ms)
         assert len(path.scoreHistory) == 1
         assert path.scoreHistory[0].isFinal
 
-    def test_init_best_of_5(self):
-        ms = MatchScore(1, 2, BEST_OF_5)
+    def test_init_best_of_5(self, readonly_match_score):
+        ms = readonly_match_score(1, 2, 5)
         path = MatchPath(ms)
         assert len(path.scoreHistory) == 1
         assert path.scoreHistory[0].sets(pov=1) == (1, 2)
 
-    def test_init_invalid_score_type(self):
+    @pytest.mark.parametrize("invalid_score", ["invalid", None, 42])
+    def test_init_invalid_score_type(self, invalid_score):
         with pytest.raises(ValueError, match="initialScore must be a MatchScore"):
-            MatchPath("invalid")
-        with pytest.raises(ValueError, match="initialScore must be a MatchScore"):
-            MatchPath(None)
-        with pytest.raises(ValueError, match="initialScore must be a MatchScore"):
-            MatchPath(42)
+            MatchPath(invalid_score)
 
     def test_init_with_set_in_progress_raises(self):
         """Cannot create MatchPath with a set in progress."""
@@ -57,18 +57,18 @@ class TestMatchPathInit:
 class TestMatchPathScoreHistory:
     """Tests for scoreHistory property."""
 
-    def test_score_history_returns_scores(self):
-        ms = MatchScore(0, 0, BEST_OF_3)
+    def test_score_history_returns_scores(self, readonly_match_score):
+        ms = readonly_match_score(0, 0, 3)
         path = MatchPath(ms)
         assert path.scoreHistory is path._scores
 
-    def test_score_history_initial_length(self):
-        ms = MatchScore(0, 0, BEST_OF_3)
+    def test_score_history_initial_length(self, readonly_match_score):
+        ms = readonly_match_score(0, 0, 3)
         path = MatchPath(ms)
         assert len(path.scoreHistory) == 1
 
-    def test_score_history_entry_is_match_score(self):
-        ms = MatchScore(0, 0, BEST_OF_3)
+    def test_score_history_entry_is_match_score(self, readonly_match_score):
+        ms = readonly_match_score(0, 0, 3)
         path = MatchPath(ms)
         assert isinstance(path.scoreHistory[0], MatchScore)
 
@@ -76,8 +76,8 @@ class TestMatchPathScoreHistory:
 class TestMatchPathIncrement:
     """Tests for increment method."""
 
-    def test_increment_from_blank(self):
-        ms = MatchScore(0, 0, BEST_OF_3)
+    def test_increment_from_blank(self, readonly_match_score):
+        ms = readonly_match_score(0, 0, 3)
         path = MatchPath(ms)
         result = path.increment()
 
@@ -90,8 +90,8 @@ class TestMatchPathIncrement:
         assert path1.scoreHistory[-1].sets(pov=1) == (1, 0)
         assert path2.scoreHistory[-1].sets(pov=1) == (0, 1)
 
-    def test_increment_from_mid_match(self):
-        ms = MatchScore(1, 0, BEST_OF_3)
+    def test_increment_from_mid_match(self, readonly_match_score):
+        ms = readonly_match_score(1, 0, 3)
         path = MatchPath(ms)
         result = path.increment()
 
@@ -100,32 +100,41 @@ class TestMatchPathIncrement:
         assert path1.scoreHistory[-1].sets(pov=1) == (2, 0)
         assert path2.scoreHistory[-1].sets(pov=1) == (1, 1)
 
-    def test_increment_from_final_score(self):
-        ms = MatchScore(2, 0, BEST_OF_3)
+    def test_increment_from_final_score(self, readonly_match_score):
+        ms = readonly_match_score(2, 0, 3)
         path = MatchPath(ms)
         result = path.increment()
 
         # Should return a copy of self, not a tuple
         assert isinstance(result, MatchPath)
-        assert result is not path  # deepcopy
+        assert result is not path  # copy
         assert len(result.scoreHistory) == 1
         assert result.scoreHistory[0].sets(pov=1) == (2, 0)
 
-    def test_increment_preserves_original(self):
-        ms = MatchScore(0, 0, BEST_OF_3)
+    def test_increment_preserves_original(self, readonly_match_score):
+        ms = readonly_match_score(0, 0, 3)
         path = MatchPath(ms)
+        original_scores = path._scores
         original_len = len(path.scoreHistory)
 
         path.increment()
 
-        # Original path should be unchanged
+        # Original path should be unchanged, still holding the same score list
+        assert path._scores is original_scores
         assert len(path.scoreHistory) == original_len
+        assert path.scoreHistory[0] is ms
 
-    def test_increment_creates_independent_copies(self):
-        ms = MatchScore(0, 0, BEST_OF_3)
+    def test_increment_creates_independent_copies(self, readonly_match_score):
+        ms = readonly_match_score(0, 0, 3)
         path = MatchPath(ms)
         path1, path2 = path.increment()
 
+        # Each path owns its score list, but the scores themselves are shared
+        assert path1._scores is not path2._scores
+        assert path1._scores is not path._scores
+        assert path1._scores[0] is path._scores[0]
+        assert path2._scores[0] is path._scores[0]
+
         # Modifying one shouldn't affect the other
         path1._scores.append(MatchScore(2, 0, BEST_OF_3))
         assert len(path2.scoreHistory) == 2
@@ -134,24 +143,20 @@ class TestMatchPathIncrement:
 class TestMatchPathGenerateAllPaths:
     """Tests for generateAllPaths static method."""
 
-    def test_generate_from_blank_best_of_3(self):
-        ms = MatchScore(0, 0, BEST_OF_3)
-        paths = MatchPath.generateAllPaths(ms)
+    def test_generate_from_blank_best_of_3(self, paths_bo3_from_00):
+        paths = paths_bo3_from_00
 
         # Should generate multiple paths
         assert len(paths) > 0
 
-    def test_generate_from_blank_best_of_5(self):
-        ms = MatchScore(0, 0, BEST_OF_5)
-        paths = MatchPath.generateAllPaths(ms)
+    def test_generate_from_blank_best_of_5(self, paths_bo5_from_00, paths_bo3_from_00):
+        paths = paths_bo5_from_00
 
         # Should generate more paths than best-of-3
-        paths_bo3 = MatchPath.generateAllPaths(MatchScore(0, 0, BEST_OF_3))
-        assert len(paths) > len(paths_bo3)
+        assert len(paths) > len(paths_bo3_from_00)
 
-    def test_generate_from_1_0(self):
-        ms = MatchScore(1, 0, BEST_OF_3)
-        paths = MatchPath.generateAllPaths(ms)
+    def test_generate_from_1_0(self, paths_bo3_from_10):
+        paths = paths_bo3_from_10
 
         # Fewer paths than from 0-0
         assert len(paths) > 0
@@ -159,87 +164,72 @@ class TestMatchPathGenerateAllPaths:
         first_path = paths[0]
         assert first_path.scoreHistory[-1].sets(pov=1) == (2, 0)
 
-    def test_generate_from_final_score(self):
-        ms = MatchScore(2, 0, BEST_OF_3)
+    def test_generate_from_final_score(self, readonly_match_score):
+        ms = readonly_match_score(2, 0, 3)
         paths = MatchPath.generateAllPaths(ms)
 
         # Only one path - the match is already over
         assert len(paths) == 1
         assert len(paths[0].scoreHistory) == 1
 
-    def test_all_paths_start_with_initial_score(self):
-        ms = MatchScore(1, 1, BEST_OF_3)
-        paths = MatchPath.generateAllPaths(ms)
+    def test_all_paths_start_with_initial_score(self, paths_bo3_from_11):
+        paths = paths_bo3_from_11
 
         for path in paths:
             assert path.scoreHistory[0].sets(pov=1) == (1, 1)
 
-    def test_all_paths_end_in_final(self):
-        ms = MatchScore(0, 0, BEST_OF_3)
-        paths = MatchPath.generateAllPaths(ms)
+    def test_all_paths_end_in_final(self, paths_bo3_from_00):
+        paths = paths_bo3_from_00
 
         for path in paths:
             last_score = path.scoreHistory[-1]
             assert last_score.isFinal
 
 
-class TestMatchPathStr:
-    """Tests for __str__ method."""
-
-    def test_str_single_score(self):
-        ms = MatchScore(0, 0, BEST_OF_3)
-        path = MatchPath(ms)
-        result = str(path)
+@pytest.fixture(scope="module")
+def str_paths(readonly_match_score):
+    """The paths whose string representation is checked, built once for the module."""
+    blank = MatchPath(readonly_match_score(0, 0, 3))
+    return {"single_score"   : blank,
+            "multiple_scores": blank.increment()[0],
+            "from_1_0"       : MatchPath(readonly_match_score(1, 0, 3))}
 
-        assert result == "[(0, 0)]"
-
-    def test_str_multiple_scores(self):
-        ms = MatchScore(0, 0, BEST_OF_3)
-        path = MatchPath(ms)
-        path1, _ = path.increment()
-        result = str(path1)
 
-        assert result == "[(0, 0), (1, 0)]"
-
-    def test_str_format(self):
-        ms = MatchScore(1, 0, BEST_OF_3)
-        path = MatchPath(ms)
-        result = str(path)
+class TestMatchPathStr:
+    """Tests for __str__ method."""
 
-        assert result.startswith("[")
-        assert result.endswith("]")
-        assert "(1, 0)" in result
+    @pytest.mark.parametrize("name, expected", [
+        ("single_score",    "[(0, 0)]"),
+        ("multiple_scores", "[(0, 0), (1, 0)]"),
+        ("from_1_0",        "[(1, 0)]"),
+    ])
+    def test_str(self, str_paths, name, expected):
+        assert str(str_paths[name]) == expected
 
 
 class TestMatchPathWinnerDistribution:
     """Tests verifying correct distribution of winning paths."""
 
-    def test_p1_and_p2_win_paths_exist(self):
-        ms = MatchScore(0, 0, BEST_OF_3)
-        paths = MatchPath.generateAllPaths(ms)
-
-        p1_wins = [p for p in paths if p.scoreHistory[-1].winner == 1]
-        p2_wins = [p for p in paths if p.scoreHistory[-1].winner == 2]
+    def test_p1_and_p2_win_paths_exist(self, paths_bo3_from_00, path_summary):
+        winners = path_summary(paths_bo3_from_00).winners
 
-        assert len(p1_wins) > 0
-        assert len(p2_wins) > 0
+        assert np.count_nonzero(winners == 1) > 0
+        assert np.count_nonzero(winners == 2) > 0
 
-    def test_symmetric_paths_from_blank(self):
-        ms = MatchScore(0, 0, BEST_OF_3)
-        paths = MatchPath.generateAllPaths(ms)
+    def test_symmetric_paths_from_blank(self, paths_bo3_from_00, path_summary):
+        winners = path_summary(paths_bo3_from_00).winners
 
-        p1_wins = len([p for p in paths if p.scoreHistory[-1].winner == 1])
-        p2_wins = len([p for p in paths if p.scoreHistory[-1].winner == 2])
+        p1_wins = np.count_nonzero(winners == 1)
+        p2_wins = np.count_nonzero(winners == 2)
 
         # From 0-0, the number of P1 and P2 winning paths should be equal
         assert p1_wins == p2_wins
 
-    def test_asymmetric_paths_from_lead(self):
-        ms = MatchScore(1, 0, BEST_OF_3)
-        paths = MatchPath.generateAllPaths(ms)
+    def test_asymmetric_paths_from_lead(self, paths_bo3_from_10, path_summary):
+        summary = path_summary(paths_bo3_from_10)
 
-        p1_wins = len([p for p in paths if p.scoreHistory[-1].winner == 1])
-        p2_wins = len([p for p in paths if p.scoreHistory[-1].winner == 2])
+        p1_wins = int((summary.winners == 1).sum())
+        p2_wins = int((summary.winners == 2).sum())
 
         # From 1-0, P1 should have more winning paths
         assert p1_wins > p2_wins
@@ -248,17 +238,15 @@ class TestMatchPathWinnerDistribution:
 class TestMatchPathSpecificScenarios:
     """Tests for specific match scenarios."""
 
-    def test_straight_sets_path_bo3(self):
+    def test_straight_sets_path_bo3(self, paths_bo3_from_00, path_summary):
         """Test the path where P1 wins 2-0."""
-        ms = MatchScore(0, 0, BEST_OF_3)
-        paths = MatchPath.generateAllPaths(ms)
+        summary = path_summary(paths_bo3_from_00)
 
         # Find the straight sets path (all P1 wins)
-        straight_paths = [p for p in paths
-                         if p.scoreHistory[-1].sets(pov=1) == (2, 0)]
+        straight_idx = np.flatnonzero((summary.p1_final == 2) & (summary.p2_final == 0))
 
-        assert len(straight_paths) == 1
-        straight_path = straight_paths[0]
+        assert straight_idx.size == 1
+        straight_path = summary.paths[int(straight_idx[0])]
 
         # Should be 3 scores: 0-0, 1-0, 2-0
         assert len(straight_path.scoreHistory) == 3
@@ -267,114 +255,102 @@ class TestMatchPathSpecificScenarios:
         for i, score in enumerate(straight_path.scoreHistory):
             assert score.sets(pov=1) == expected[i]
 
-    def test_straight_sets_path_bo5(self):
+    def test_straight_sets_path_bo5(self, paths_bo5_from_00, path_summary):
         """Test the path where P1 wins 3-0."""
-        ms = MatchScore(0, 0, BEST_OF_5)
-        paths = MatchPath.generateAllPaths(ms)
+        summary = path_summary(paths_bo5_from_00)
 
         # Find the straight sets path
-        straight_paths = [p for p in paths
-                         if p.scoreHistory[-1].sets(pov=1) == (3, 0)]
+        straight_idx = np.flatnonzero((summary.p1_final == 3) & (summary.p2_final == 0))
 
-        assert len(straight_paths) == 1
-        straight_path = straight_paths[0]
+        assert straight_idx.size == 1
 
         # Should be 4 scores: 0-0, 1-0, 2-0, 3-0
-        assert len(straight_path.scoreHistory) == 4
+        assert summary.lengths[straight_idx[0]] == 4
 
-    def test_full_distance_path_bo3(self):
+    def test_full_distance_path_bo3(self, paths_bo3_from_00, path_summary):
         """Test paths that go the full distance (2-1)."""
-        ms = MatchScore(0, 0, BEST_OF_3)
-        paths = MatchPath.generateAllPaths(ms)
+        summary = path_summary(paths_bo3_from_00)
 
         # Find paths ending in 2-1
-        full_paths = [p for p in paths
-                      if p.scoreHistory[-1].sets(pov=1) == (2, 1)]
+        full_idx = np.flatnonzero((summary.p1_final == 2) & (summary.p2_final == 1))
 
-        assert len(full_paths) > 0
+        assert full_idx.size > 0
 
         # Each full distance path should have 4 scores (0-0, then 3 more)
-        for path in full_paths:
-            assert len(path.scoreHistory) == 4
+        assert np.all(summary.lengths[full_idx] == 4)
 
-    def test_full_distance_path_bo5(self):
+    def test_full_distance_path_bo5(self, paths_bo5_from_00, path_summary):
         """Test paths that go the full distance (3-2)."""
-        ms = MatchScore(0, 0, BEST_OF_5)
-        paths = MatchPath.generateAllPaths(ms)
+        summary = path_summary(paths_bo5_from_00)
 
         # Find paths ending in 3-2
-        full_paths = [p for p in paths
-                      if p.scoreHistory[-1].sets(pov=1) == (3, 2)]
+        full_idx = np.flatnonzero((summary.p1_final == 3) & (summary.p2_final == 2))
 
-        assert len(full_paths) > 0
+        assert full_idx.size > 0
 
         # Each full distance path should have 6 scores (0-0, then 5 more)
-        for path in full_paths:
-            assert len(path.scoreHistory) == 6
+        assert np.all(summary.lengths[full_idx] == 6)
 
 
 class TestMatchPathEdgeCases:
     """Tests for edge cases."""
 
-    def test_generate_from_match_point_p1(self):
+    def test_generate_from_match_point_p1(self, paths_bo3_from_10):
         """P1 at 1-0 in best-of-3 (one set from winning)."""
-        ms = MatchScore(1, 0, BEST_OF_3)
-        paths = MatchPath.generateAllPaths(ms)
+        paths = paths_bo3_from_10
 
         # Multiple paths possible
         assert len(paths) > 1
 
         # Shortest path: P1 wins next set
-        shortest = min(paths, key=lambda p: len(p.scoreHistory))
+        lengths = np.fromiter((len(p.scoreHistory) for p in paths), dtype=np.int32, count=len(paths))
+        shortest = paths[int(lengths.argmin())]
         assert len(shortest.scoreHistory) == 2
         assert shortest.scoreHistory[-1].sets(pov=1) == (2, 0)
 
-    def test_generate_from_match_point_p2(self):
+    def test_generate_from_match_point_p2(self, paths_bo3_from_01, path_summary):
         """P2 at 0-1 in best-of-3 (one set from winning)."""
-        ms = MatchScore(0, 1, BEST_OF_3)
-        paths = MatchPath.generateAllPaths(ms)
+        paths = paths_bo3_from_01
 
         # Multiple paths possible
         assert len(paths) > 1
 
         # Check that both 0-2 (P2 wins) and 1-1 paths exist
-        end_scores = {p.scoreHistory[-1].sets(pov=1) for p in paths}
+        summary    = path_summary(paths)
+        end_scores = np.stack([summary.p1_final, summary.p2_final], axis=1)
         # 0-2 is a final score (P2 wins), 2-1 and 1-2 are also possible finals
-        assert (0, 2) in end_scores or (1, 2) in end_scores or (2, 1) in end_scores
+        assert np.any(np.all(end_scores[:, None, :] == [(0, 2), (1, 2), (2, 1)], axis=2))
 
-    def test_path_lengths_vary(self):
+    def test_path_lengths_vary(self, paths_bo3_from_00):
         """Paths from same start should have varying lengths."""
-        ms = MatchScore(0, 0, BEST_OF_3)
-        paths = MatchPath.generateAllPaths(ms)
+        paths = paths_bo3_from_00
 
-        lengths = set(len(p.scoreHistory) for p in paths)
+        lengths = np.fromiter((len(p.scoreHistory) for p in paths), dtype=np.int32, count=len(paths))
 
         # Should have multiple different lengths
-        assert len(lengths) > 1
+        assert len(np.unique(lengths)) > 1
 
         # Shortest possible: 2 sets to win (3 scores including start)
-        assert min(lengths) == 3
+        assert lengths.min() == 3
 
         # Longest: full 3 sets played (4 scores including start)
-        assert max(lengths) == 4
+        assert lengths.max() == 4
 
-    def test_path_lengths_best_of_5(self):
+    def test_path_lengths_best_of_5(self, paths_bo5_from_00):
         """Test path lengths for best-of-5."""
-        ms = MatchScore(0, 0, BEST_OF_5)
-        paths = MatchPath.generateAllPaths(ms)
+        paths = paths_bo5_from_00
 
-        lengths = set(len(p.scoreHistory) for p in paths)
+        lengths = np.fromiter((len(p.scoreHistory) for p in paths), dtype=np.int32, count=len(paths))
 
         # Shortest: 3 sets to win (4 scores)
-        assert min(lengths) == 4
+        assert lengths.min() == 4
 
         # Longest: full 5 sets (6 scores)
-        assert max(lengths) == 6
+        assert lengths.max() == 6
 
-    def test_path_count_best_of_3(self):
+    def test_path_count_best_of_3(self, paths_bo3_from_00, path_summary):
         """Verify total number of paths in best-of-3."""
-        ms = MatchScore(0, 0, BEST_OF_3)
-        paths = MatchPath.generateAllPaths(ms)
+        paths = paths_bo3_from_00
 
         # From 0-0 in best-of-3:
         # P1 wins 2-0: 1 path
@@ -384,10 +360,15 @@ class TestMatchPathEdgeCases:
         # Total: 6 paths
         assert len(paths) == 6
 
-    def test_path_count_best_of_5(self):
+        # number of paths per final score, indexed by [P1 sets, P2 sets]
+        counts = final_score_counts(path_summary(paths), 2)
+        assert counts.tolist() == [[0, 0, 1],
+                                   [0, 0, 2],
+                                   [1, 2, 0]]
+
+    def test_path_count_best_of_5(self, paths_bo5_from_00, path_summary):
         """Verify total number of paths in best-of-5."""
-        ms = MatchScore(0, 0, BEST_OF_5)
-        paths = MatchPath.generateAllPaths(ms)
+        paths = paths_bo5_from_00
 
         # From 0-0 in best-of-5:
         # P1 wins 3-0: 1 path
@@ -399,24 +380,29 @@ class TestMatchPathEdgeCases:
         # Total: 2 * (1 + 3 + 6) = 20 paths
         assert len(paths) == 20
 
-    def test_from_1_1_best_of_3(self):
+        # number of paths per final score, indexed by [P1 sets, P2 sets]
+        counts = final_score_counts(path_summary(paths), 3)
+        assert counts.tolist() == [[0, 0, 0, 1],
+                                   [0, 0, 0, 3],
+                                   [0, 0, 0, 6],
+                                   [1, 3, 6, 0]]
+
+    def test_from_1_1_best_of_3(self, paths_bo3_from_11, path_summary):
         """Test from 1-1 in best-of-3 (deciding set)."""
-        ms = MatchScore(1, 1, BEST_OF_3)
-        paths = MatchPath.generateAllPaths(ms)
+        paths = paths_bo3_from_11
 
         # Only 2 paths: P1 wins 2-1 or P2 wins 1-2
         assert len(paths) == 2
 
-        winners = {p.scoreHistory[-1].winner for p in paths}
-        assert winners == {1, 2}
+        winners = path_summary(paths).winners
+        assert sorted(winners.tolist()) == [1, 2]
 
-    def test_from_2_2_best_of_5(self):
+    def test_from_2_2_best_of_5(self, paths_bo5_from_22, path_summary):
         """Test from 2-2 in best-of-5 (deciding set)."""
-        ms = MatchScore(2, 2, BEST_OF_5)
-        paths = MatchPath.generateAllPaths(ms)
+        paths = paths_bo5_from_22
 
         # Only 2 paths: P1 wins 3-2 or P2 wins 2-3
         assert len(paths) == 2
 
-        winners = {p.scoreHistory[-1].winner for p in paths}
-        assert winners == {1, 2}
+        winners = path_summary(paths).winners
+        assert sorted(winners.tolist()) == [1, 2]
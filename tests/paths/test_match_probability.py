@@ -1,26 +1,59 @@
 """Tests for match probability functions."""
 
+import math
 import pytest
 import numpy as np
+from functools import lru_cache
 from tennis_lab.paths.match_path import MatchPath
 from tennis_lab.paths.match_probability import (
     pathProbability,
+    pathProbabilities,
     probabilityP1WinsMatch,
+    probabilityP1WinsMatchGrid,
+    _probabilityP1WinsMatchFast,
     _probabilityP1WinsMatchFromSetBoundary,
+    _probabilityP1WinsMatchFromSetScore,
+    _probabilityP1WinsSetArray,
+    _certainSetOutcomes,
     _loadCachedFunction
 )
+from tennis_lab.paths import match_probability
 from tennis_lab.core.match_score import MatchScore
 from tennis_lab.core.set_score import SetScore
-from tennis_lab.core.match_format import MatchFormat
-
-# Default match formats for tests
-BO3_FORMAT = MatchFormat(bestOfSets=3)
-BO5_FORMAT = MatchFormat(bestOfSets=5)
+from .conftest import BEST_OF_3, FORMATS
 
 # Helper to create MatchScore with default args
+# (cached: the returned scores are shared across tests, which must not modify them)
+@lru_cache(maxsize=None)
 def make_match_score(setsP1: int, setsP2: int, bestOf: int = 3):
-    mf = MatchFormat(bestOfSets=bestOf)
-    return MatchScore(setsP1, setsP2, mf)
+    return MatchScore(setsP1, setsP2, FORMATS[bestOf])
+
+# Helper computing _probabilityP1WinsMatchFromSetBoundary from a set boundary score
+# (cached: tests asking for the same score and probabilities share one computation)
+@lru_cache(maxsize=None)
+def p1_wins_from_boundary(setsP1: int, setsP2: int, bestOf: int, probWinPointP1: float, probWinPointP2: float):
+    ms = make_match_score(setsP1, setsP2, bestOf)
+    return _probabilityP1WinsMatchFromSetBoundary(ms, probWinPointP1, probWinPointP2)
+
+# Set boundary scores (best of 3) and P1 serve probabilities (against P2's 0.60) tabulated by 'boundary_table'
+BOUNDARY_SCORES   = [(0, 0), (1, 0), (0, 1)]
+BOUNDARY_P1_PROBS = [0.55, 0.65, 0.75]
+
+@pytest.fixture(scope="module")
+def boundary_table():
+    """P1's match win probability, from each of BOUNDARY_SCORES (rows) for each of BOUNDARY_P1_PROBS (columns)."""
+    return np.array([[p1_wins_from_boundary(setsP1, setsP2, 3, p1, 0.60) for p1 in BOUNDARY_P1_PROBS]
+                     for setsP1, setsP2 in BOUNDARY_SCORES])
+
+@pytest.fixture(scope="module")
+def probs_bo3_from_00(paths_bo3_from_00):
+    """The probabilities of all best-of-3 paths from 0-0, for serve probabilities 0.65 (P1) and 0.60 (P2)."""
+    return pathProbabilities(paths_bo3_from_00, 0.65, 0.60)
+
+@pytest.fixture(scope="module")
+def blank_path():
+    """A path made of the single score 0-0 (best of 3)."""
+    return MatchPath(make_match_score(0, 0))
 
 
 # =============================================================================
@@ -30,68 +63,35 @@ def make_match_score(setsP1: int, setsP2: int, bestOf: int = 3):
 class TestPathProbabilityValidation:
     """Tests for pathProbability input validation."""
 
-    def test_invalid_path_type_string(self):
+    @pytest.mark.parametrize("invalid_path", ["not a path", None])
+    def test_invalid_path_type(self, invalid_path):
         with pytest.raises(ValueError, match="path must be a MatchPath"):
-            pathProbability("not a path", 0.6, 0.6)
-
-    def test_invalid_path_type_none(self):
-        with pytest.raises(ValueError, match="path must be a MatchPath"):
-            pathProbability(None, 0.6, 0.6)
-
-    def test_invalid_prob_p1_negative(self):
-        ms = make_match_score(0, 0)
-        path = MatchPath(ms)
-        with pytest.raises(ValueError, match="probWinPointP1 must be a number"):
-            pathProbability(path, -0.1, 0.6)
-
-    def test_invalid_prob_p1_greater_than_one(self):
-        ms = make_match_score(0, 0)
-        path = MatchPath(ms)
-        with pytest.raises(ValueError, match="probWinPointP1 must be a number"):
-            pathProbability(path, 1.1, 0.6)
-
-    def test_invalid_prob_p2_negative(self):
-        ms = make_match_score(0, 0)
-        path = MatchPath(ms)
-        with pytest.raises(ValueError, match="probWinPointP2 must be a number"):
-            pathProbability(path, 0.6, -0.1)
-
-    def test_invalid_prob_p2_greater_than_one(self):
-        ms = make_match_score(0, 0)
-        path = MatchPath(ms)
-        with pytest.raises(ValueError, match="probWinPointP2 must be a number"):
-            pathProbability(path, 0.6, 1.1)
-
-    def test_invalid_prob_p1_string(self):
-        ms = make_match_score(0, 0)
-        path = MatchPath(ms)
-        with pytest.raises(ValueError, match="probWinPointP1 must be a number"):
-            pathProbability(path, "0.6", 0.6)
-
-    def test_invalid_prob_p2_string(self):
-        ms = make_match_score(0, 0)
-        path = MatchPath(ms)
-        with pytest.raises(ValueError, match="probWinPointP2 must be a number"):
-            pathProbability(path, 0.6, "0.6")
-
-    def test_valid_prob_zero(self):
-        ms = make_match_score(0, 0)
-        path = MatchPath(ms)
+            pathProbability(invalid_path, 0.6, 0.6)
+
+    @pytest.mark.parametrize("probWinPointP1, probWinPointP2, message", [
+        (-0.1,  0.6,   "probWinPointP1 must be a number"),
+        (1.1,   0.6,   "probWinPointP1 must be a number"),
+        ("0.6", 0.6,   "probWinPointP1 must be a number"),
+        (0.6,   -0.1,  "probWinPointP2 must be a number"),
+        (0.6,   1.1,   "probWinPointP2 must be a number"),
+        (0.6,   "0.6", "probWinPointP2 must be a number"),
+    ])
+    def test_invalid_probs(self, blank_path, probWinPointP1, probWinPointP2, message):
+        with pytest.raises(ValueError, match=message):
+            pathProbability(blank_path, probWinPointP1, probWinPointP2)
+
+    def test_valid_prob_zero(self, blank_path):
         # Should not raise - zero is a valid probability
-        result = pathProbability(path, 0.0, 0.6)
+        result = pathProbability(blank_path, 0.0, 0.6)
         assert result == 1.0  # Single score, no transitions
 
-    def test_valid_prob_one(self):
-        ms = make_match_score(0, 0)
-        path = MatchPath(ms)
-        result = pathProbability(path, 1.0, 1.0)
+    def test_valid_prob_one(self, blank_path):
+        result = pathProbability(blank_path, 1.0, 1.0)
         assert result == 1.0
 
-    def test_valid_prob_integer(self):
-        ms = make_match_score(0, 0)
-        path = MatchPath(ms)
+    def test_valid_prob_integer(self, blank_path):
         # Integer 0 and 1 should be accepted
-        result = pathProbability(path, 0, 1)
+        result = pathProbability(blank_path, 0, 1)
         assert result == 1.0
 
 
@@ -121,41 +121,62 @@ class TestPathProbabilitySingleScore:
 class TestPathProbabilityCalculations:
     """Tests for path probability calculations with multiple transitions."""
 
-    def test_all_paths_sum_to_one_bo3(self):
+    def test_all_paths_sum_to_one_bo3(self, probs_bo3_from_00):
         """All possible paths from 0-0 should sum to 1."""
-        ms = make_match_score(0, 0, bestOf=3)
-        paths = MatchPath.generateAllPaths(ms)
-        total = sum(pathProbability(p, 0.65, 0.60) for p in paths)
-        assert abs(total - 1.0) < 1e-10
+        total = math.fsum(probs_bo3_from_00)
+        assert total == pytest.approx(1.0, abs=1e-12)
 
-    def test_all_paths_sum_to_one_bo5(self):
+    def test_all_paths_sum_to_one_bo5(self, paths_bo5_from_00):
         """All possible paths from 0-0 in best-of-5 should sum to 1."""
-        ms = make_match_score(0, 0, bestOf=5)
-        paths = MatchPath.generateAllPaths(ms)
-        total = sum(pathProbability(p, 0.65, 0.60) for p in paths)
-        assert abs(total - 1.0) < 1e-10
+        paths = paths_bo5_from_00
+        total = math.fsum(pathProbabilities(paths, 0.65, 0.60))
+        assert total == pytest.approx(1.0, abs=1e-12)
 
-    def test_all_paths_sum_to_one_from_1_0(self):
+    def test_all_paths_sum_to_one_from_1_0(self, paths_bo3_from_10):
         """All possible paths from 1-0 should sum to 1."""
-        ms = make_match_score(1, 0, bestOf=3)
-        paths = MatchPath.generateAllPaths(ms)
-        total = sum(pathProbability(p, 0.65, 0.60) for p in paths)
-        assert abs(total - 1.0) < 1e-10
+        paths = paths_bo3_from_10
+        total = math.fsum(pathProbabilities(paths, 0.65, 0.60))
+        assert total == pytest.approx(1.0, abs=1e-12)
 
-    def test_all_paths_sum_to_one_equal_probs(self):
+    def test_all_paths_sum_to_one_equal_probs(self, paths_bo3_from_00):
         """All paths sum to 1 when both players have equal probabilities."""
-        ms = make_match_score(0, 0, bestOf=3)
-        paths = MatchPath.generateAllPaths(ms)
-        total = sum(pathProbability(p, 0.5, 0.5) for p in paths)
-        assert abs(total - 1.0) < 1e-10
+        paths = paths_bo3_from_00
+        total = math.fsum(pathProbabilities(paths, 0.5, 0.5))
+        assert total == pytest.approx(1.0, abs=1e-12)
 
-    def test_path_probability_positive(self):
+    def test_path_probability_positive(self, probs_bo3_from_00):
         """All path probabilities should be positive."""
-        ms = make_match_score(0, 0, bestOf=3)
-        paths = MatchPath.generateAllPaths(ms)
-        for path in paths:
-            prob = pathProbability(path, 0.65, 0.60)
-            assert prob > 0
+        assert np.all(probs_bo3_from_00 > 0)
+
+
+# =============================================================================
+# Tests for pathProbabilities (batched path probabilities)
+# =============================================================================
+
+class TestPathProbabilities:
+    """Tests for pathProbabilities."""
+
+    def test_invalid_path_type(self, blank_path):
+        with pytest.raises(ValueError, match="all paths must be MatchPath"):
+            pathProbabilities([blank_path, "not a path"], 0.6, 0.6)
+
+    @pytest.mark.parametrize("probWinPointP1, probWinPointP2, message", [
+        (1.1, 0.6, "probWinPointP1 must be a number"),
+        (0.6, 1.1, "probWinPointP2 must be a number"),
+    ])
+    def test_invalid_probs(self, blank_path, probWinPointP1, probWinPointP2, message):
+        with pytest.raises(ValueError, match=message):
+            pathProbabilities([blank_path], probWinPointP1, probWinPointP2)
+
+    def test_no_paths(self):
+        assert pathProbabilities([], 0.65, 0.60).shape == (0,)
+
+    @pytest.mark.parametrize("paths_fixture", ["paths_bo3_from_00", "paths_bo3_from_10", "paths_bo5_from_00"])
+    def test_matches_path_probability(self, request, paths_fixture):
+        """Each batched probability should equal the probability of the path computed on its own."""
+        paths = request.getfixturevalue(paths_fixture)
+        expected = [pathProbability(p, 0.65, 0.60) for p in paths]
+        np.testing.assert_allclose(pathProbabilities(paths, 0.65, 0.60), expected, rtol=1e-12)
 
 
 # =============================================================================
@@ -165,29 +186,25 @@ class TestPathProbabilityCalculations:
 class TestPathProbabilityMonotonicity:
     """Tests for monotonicity properties of path probabilities."""
 
-    def test_p1_winning_path_increases_with_p1_serve_prob(self):
+    def test_p1_winning_path_increases_with_p1_serve_prob(self, paths_bo3_from_00, path_summary):
         """P1 winning paths should be more likely as P1's serve probability increases."""
-        ms = make_match_score(0, 0, bestOf=3)
-        paths = MatchPath.generateAllPaths(ms)
-        # Find a path where P1 wins (2-0 or 2-1)
-        p1_win_paths = [p for p in paths if p.scoreHistory[-1].winner == 1]
+        paths = paths_bo3_from_00
+        # Select the paths where P1 wins (2-0 or 2-1)
+        p1_wins = path_summary(paths).winners == 1
 
-        for path in p1_win_paths:
-            prob_low = pathProbability(path, 0.55, 0.60)
-            prob_high = pathProbability(path, 0.75, 0.60)
-            assert prob_high > prob_low
+        prob_low  = pathProbabilities(paths, 0.55, 0.60)
+        prob_high = pathProbabilities(paths, 0.75, 0.60)
+        assert np.all(prob_high[p1_wins] > prob_low[p1_wins])
 
-    def test_p2_winning_path_decreases_with_p1_serve_prob(self):
+    def test_p2_winning_path_decreases_with_p1_serve_prob(self, paths_bo3_from_00, path_summary):
         """P2 winning paths should be less likely as P1's serve probability increases."""
-        ms = make_match_score(0, 0, bestOf=3)
-        paths = MatchPath.generateAllPaths(ms)
-        # Find a path where P2 wins (0-2 or 1-2)
-        p2_win_paths = [p for p in paths if p.scoreHistory[-1].winner == 2]
+        paths = paths_bo3_from_00
+        # Select the paths where P2 wins (0-2 or 1-2)
+        p2_wins = path_summary(paths).winners == 2
 
-        for path in p2_win_paths:
-            prob_low = pathProbability(path, 0.55, 0.60)
-            prob_high = pathProbability(path, 0.75, 0.60)
-            assert prob_high < prob_low
+        prob_low  = pathProbabilities(paths, 0.55, 0.60)
+        prob_high = pathProbabilities(paths, 0.75, 0.60)
+        assert np.all(prob_high[p2_wins] < prob_low[p2_wins])
 
 
 # =============================================================================
@@ -197,21 +214,14 @@ class TestPathProbabilityMonotonicity:
 class TestPathProbabilityBounds:
     """Tests for bounds on path probabilities."""
 
-    def test_probability_between_0_and_1(self):
+    def test_probability_between_0_and_1(self, probs_bo3_from_00):
         """Path probability should always be between 0 and 1."""
-        ms = make_match_score(0, 0, bestOf=3)
-        paths = MatchPath.generateAllPaths(ms)
-        for path in paths:
-            prob = pathProbability(path, 0.65, 0.60)
-            assert 0 <= prob <= 1
+        assert np.all((probs_bo3_from_00 >= 0) & (probs_bo3_from_00 <= 1))
 
-    def test_extreme_probs_still_valid(self):
+    def test_extreme_probs_still_valid(self, paths_bo3_from_00):
         """Even with extreme probabilities, results should be valid."""
-        ms = make_match_score(0, 0, bestOf=3)
-        paths = MatchPath.generateAllPaths(ms)
-        for path in paths:
-            prob = pathProbability(path, 0.99, 0.01)
-            assert 0 <= prob <= 1
+        probs = pathProbabilities(paths_bo3_from_00, 0.99, 0.01)
+        assert np.all((probs >= 0) & (probs <= 1))
 
 
 # =============================================================================
@@ -221,17 +231,14 @@ class TestPathProbabilityBounds:
 class TestLoadCachedFunctionValidation:
     """Tests for _loadCachedFunction input validation."""
 
-    def test_invalid_init_score_type_string(self):
+    @pytest.mark.parametrize("invalid_score", ["not a score", None])
+    def test_invalid_init_score_type(self, invalid_score):
         with pytest.raises(ValueError, match="initScore must be a MatchScore"):
-            _loadCachedFunction("not a score")
-
-    def test_invalid_init_score_type_none(self):
-        with pytest.raises(ValueError, match="initScore must be a MatchScore"):
-            _loadCachedFunction(None)
+            _loadCachedFunction(invalid_score)
 
     def test_set_in_progress_raises_error(self):
         """Should raise error if set is in progress."""
-        mf = MatchFormat(bestOfSets=3)
+        mf = BEST_OF_3
         set_score = SetScore(3, 2, False, mf)
         ms = MatchScore(0, 0, mf, setScore=set_score)
         with pytest.raises(ValueError, match="initScore cannot have a set in progress"):
@@ -267,49 +274,36 @@ class TestLoadCachedFunctionBehavior:
 class TestProbabilityP1WinsMatchFromSetBoundaryValidation:
     """Tests for _probabilityP1WinsMatchFromSetBoundary input validation."""
 
-    def test_invalid_init_score_type_string(self):
-        with pytest.raises(ValueError, match="initScore must be a MatchScore"):
-            _probabilityP1WinsMatchFromSetBoundary("not a score", 0.6, 0.6)
-
-    def test_invalid_init_score_type_none(self):
+    @pytest.mark.parametrize("invalid_score", ["not a score", None])
+    def test_invalid_init_score_type(self, invalid_score):
         with pytest.raises(ValueError, match="initScore must be a MatchScore"):
-            _probabilityP1WinsMatchFromSetBoundary(None, 0.6, 0.6)
+            _probabilityP1WinsMatchFromSetBoundary(invalid_score, 0.6, 0.6)
 
     def test_set_in_progress_raises_error(self):
         """Should raise error if set is in progress."""
-        mf = MatchFormat(bestOfSets=3)
+        mf = BEST_OF_3
         set_score = SetScore(3, 2, False, mf)
         ms = MatchScore(0, 0, mf, setScore=set_score)
         with pytest.raises(ValueError, match="initScore cannot have a set in progress"):
             _probabilityP1WinsMatchFromSetBoundary(ms, 0.6, 0.6)
 
-    def test_invalid_prob_p1_negative(self):
-        ms = make_match_score(0, 0)
-        with pytest.raises(ValueError, match="probWinPointP1 must be a number"):
-            _probabilityP1WinsMatchFromSetBoundary(ms, -0.1, 0.6)
-
-    def test_invalid_prob_p1_greater_than_one(self):
+    @pytest.mark.parametrize("probWinPointP1, probWinPointP2, message", [
+        (-0.1, 0.6,  "probWinPointP1 must be a number"),
+        (1.1,  0.6,  "probWinPointP1 must be a number"),
+        (0.6,  -0.1, "probWinPointP2 must be a number"),
+        (0.6,  1.1,  "probWinPointP2 must be a number"),
+    ])
+    def test_invalid_probs(self, probWinPointP1, probWinPointP2, message):
         ms = make_match_score(0, 0)
-        with pytest.raises(ValueError, match="probWinPointP1 must be a number"):
-            _probabilityP1WinsMatchFromSetBoundary(ms, 1.1, 0.6)
+        with pytest.raises(ValueError, match=message):
+            _probabilityP1WinsMatchFromSetBoundary(ms, probWinPointP1, probWinPointP2)
 
-    def test_invalid_prob_p2_negative(self):
-        ms = make_match_score(0, 0)
-        with pytest.raises(ValueError, match="probWinPointP2 must be a number"):
-            _probabilityP1WinsMatchFromSetBoundary(ms, 0.6, -0.1)
-
-    def test_invalid_prob_p2_greater_than_one(self):
-        ms = make_match_score(0, 0)
-        with pytest.raises(ValueError, match="probWinPointP2 must be a number"):
-            _probabilityP1WinsMatchFromSetBoundary(ms, 0.6, 1.1)
-
-    def test_paths_must_start_with_init_score(self):
+    def test_paths_must_start_with_init_score(self, paths_bo3_from_10):
         """Provided paths must start with initScore."""
-        ms1 = make_match_score(0, 0, bestOf=3)
-        ms2 = make_match_score(1, 0, bestOf=3)
-        paths = MatchPath.generateAllPaths(ms2)  # paths starting from 1-0
+        ms = make_match_score(0, 0, bestOf=3)
+        paths = paths_bo3_from_10  # paths starting from 1-0
         with pytest.raises(ValueError, match="all paths must start with"):
-            _probabilityP1WinsMatchFromSetBoundary(ms1, 0.6, 0.6, paths=paths)
+            _probabilityP1WinsMatchFromSetBoundary(ms, 0.6, 0.6, paths=paths)
 
 
 # =============================================================================
@@ -325,45 +319,52 @@ class TestProbabilityP1WinsMatchFromSetBoundaryBehavior:
         assert isinstance(result, float)
 
     def test_returns_between_0_and_1(self):
-        ms = make_match_score(0, 0, bestOf=3)
-        result = _probabilityP1WinsMatchFromSetBoundary(ms, 0.65, 0.60)
+        result = p1_wins_from_boundary(0, 0, 3, 0.65, 0.60)
         assert 0 <= result <= 1
 
     def test_equal_probs_returns_half(self):
         """With equal serve probabilities, P1 should have ~50% chance."""
-        ms = make_match_score(0, 0, bestOf=3)
-        result = _probabilityP1WinsMatchFromSetBoundary(ms, 0.5, 0.5)
-        assert abs(result - 0.5) < 0.01
+        result = p1_wins_from_boundary(0, 0, 3, 0.5, 0.5)
+        assert result == pytest.approx(0.5, abs=0.01)
 
     def test_from_0_0_with_advantage(self):
         """P1 with serve advantage should have >50% chance from 0-0."""
-        ms = make_match_score(0, 0, bestOf=3)
-        result = _probabilityP1WinsMatchFromSetBoundary(ms, 0.65, 0.60)
+        result = p1_wins_from_boundary(0, 0, 3, 0.65, 0.60)
         assert result > 0.5
 
-    def test_from_1_0_higher_than_0_0(self):
+    def test_from_1_0_higher_than_0_0(self, boundary_table):
         """Being ahead 1-0 should give higher win probability than 0-0."""
-        ms_0_0 = make_match_score(0, 0, bestOf=3)
-        ms_1_0 = make_match_score(1, 0, bestOf=3)
-        prob_0_0 = _probabilityP1WinsMatchFromSetBoundary(ms_0_0, 0.65, 0.60)
-        prob_1_0 = _probabilityP1WinsMatchFromSetBoundary(ms_1_0, 0.65, 0.60)
-        assert prob_1_0 > prob_0_0
+        prob_0_0 = boundary_table[BOUNDARY_SCORES.index((0, 0))]
+        prob_1_0 = boundary_table[BOUNDARY_SCORES.index((1, 0))]
+        assert np.all(prob_1_0 > prob_0_0)
 
-    def test_from_0_1_lower_than_0_0(self):
+    def test_from_0_1_lower_than_0_0(self, boundary_table):
         """Being behind 0-1 should give lower win probability than 0-0."""
-        ms_0_0 = make_match_score(0, 0, bestOf=3)
-        ms_0_1 = make_match_score(0, 1, bestOf=3)
-        prob_0_0 = _probabilityP1WinsMatchFromSetBoundary(ms_0_0, 0.65, 0.60)
-        prob_0_1 = _probabilityP1WinsMatchFromSetBoundary(ms_0_1, 0.65, 0.60)
-        assert prob_0_1 < prob_0_0
-
-    def test_with_provided_paths(self):
+        prob_0_0 = boundary_table[BOUNDARY_SCORES.index((0, 0))]
+        prob_0_1 = boundary_table[BOUNDARY_SCORES.index((0, 1))]
+        assert np.all(prob_0_1 < prob_0_0)
+
+    @pytest.mark.parametrize("paths_fixture, sets, bestOf", [
+        ("paths_bo3_from_00", (0, 0), 3), ("paths_bo3_from_01", (0, 1), 3),
+        ("paths_bo5_from_00", (0, 0), 5), ("paths_bo5_from_22", (2, 2), 5),
+    ])
+    def test_set_score_kernel_matches_path_sum(self, request, paths_fixture, sets, bestOf):
+        """The closed-form sum over set counts equals the sum over the enumerated paths."""
+        paths = request.getfixturevalue(paths_fixture)
+        probP1WinsSet = np.array([0.0, 0.3, 0.55, 1.0])
+        expected = [sum(q**(p.scoreHistory[-1].sets(pov=1)[0] - sets[0]) *
+                        (1 - q)**(p.scoreHistory[-1].sets(pov=1)[1] - sets[1])
+                        for p in paths if p.scoreHistory[-1].winner == 1) for q in probP1WinsSet]
+        result = _probabilityP1WinsMatchFromSetScore(*sets, bestOf, probP1WinsSet)
+        np.testing.assert_allclose(result, expected, atol=1e-12)
+
+    def test_with_provided_paths(self, paths_bo3_from_00):
         """Should give same result with pre-generated paths."""
         ms = make_match_score(0, 0, bestOf=3)
-        paths = MatchPath.generateAllPaths(ms)
+        paths = paths_bo3_from_00
         result_with_paths = _probabilityP1WinsMatchFromSetBoundary(ms, 0.65, 0.60, paths=paths)
-        result_without_paths = _probabilityP1WinsMatchFromSetBoundary(ms, 0.65, 0.60)
-        assert abs(result_with_paths - result_without_paths) < 1e-10
+        result_without_paths = p1_wins_from_boundary(0, 0, 3, 0.65, 0.60)
+        assert result_with_paths == pytest.approx(result_without_paths, abs=1e-10)
 
 
 # =============================================================================
@@ -373,13 +374,9 @@ class TestProbabilityP1WinsMatchFromSetBoundaryBehavior:
 class TestProbabilityP1WinsMatchFromSetBoundaryMonotonicity:
     """Tests for monotonicity of _probabilityP1WinsMatchFromSetBoundary."""
 
-    def test_increases_with_p1_serve_prob(self):
-        """Win probability should increase with P1's serve probability."""
-        ms = make_match_score(0, 0, bestOf=3)
-        prob_low = _probabilityP1WinsMatchFromSetBoundary(ms, 0.55, 0.60)
-        prob_mid = _probabilityP1WinsMatchFromSetBoundary(ms, 0.65, 0.60)
-        prob_high = _probabilityP1WinsMatchFromSetBoundary(ms, 0.75, 0.60)
-        assert prob_low < prob_mid < prob_high
+    def test_increases_with_p1_serve_prob(self, boundary_table):
+        """Win probability should increase with P1's serve probability (from every score)."""
+        assert np.all(np.diff(boundary_table, axis=1) > 0)
 
     def test_decreases_with_p2_serve_prob(self):
         """Win probability should decrease with P2's serve probability."""
@@ -397,13 +394,10 @@ class TestProbabilityP1WinsMatchFromSetBoundaryMonotonicity:
 class TestProbabilityP1WinsMatchValidation:
     """Tests for probabilityP1WinsMatch input validation."""
 
-    def test_invalid_init_score_type_string(self):
+    @pytest.mark.parametrize("invalid_score", ["not a score", None])
+    def test_invalid_init_score_type(self, invalid_score):
         with pytest.raises(ValueError, match="initScore must be a MatchScore"):
-            probabilityP1WinsMatch("not a score", 1, [0.6], 0.6)
-
-    def test_invalid_init_score_type_none(self):
-        with pytest.raises(ValueError, match="initScore must be a MatchScore"):
-            probabilityP1WinsMatch(None, 1, [0.6], 0.6)
+            probabilityP1WinsMatch(invalid_score, 1, [0.6], 0.6)
 
     def test_invalid_player_serving_zero(self):
         ms = make_match_score(0, 0)
@@ -425,6 +419,12 @@ class TestProbabilityP1WinsMatchValidation:
         with pytest.raises(ValueError, match="all probWinPointP1s must be numbers"):
             probabilityP1WinsMatch(ms, 1, [1.1], 0.6)
 
+    @pytest.mark.parametrize("invalid_probs", [[0.6, "0.5"], [0.6, None], [float("nan")], [[0.6]]])
+    def test_invalid_prob_p1s_not_numbers(self, invalid_probs):
+        ms = make_match_score(0, 0)
+        with pytest.raises(ValueError, match="all probWinPointP1s must be numbers"):
+            probabilityP1WinsMatch(ms, 1, invalid_probs, 0.6)
+
     def test_invalid_prob_p2_negative(self):
         ms = make_match_score(0, 0)
         with pytest.raises(ValueError, match="probWinPointP2 must be a number"):
@@ -459,6 +459,39 @@ class TestProbabilityP1WinsMatchReturnType:
         result = probabilityP1WinsMatch(ms, 1, iter([0.5, 0.6, 0.7]), 0.6)
         assert len(result) == 3
 
+    def test_fast_path_matches_public_function(self):
+        """The unvalidated internal entry point gives the same result."""
+        ms = MatchScore(1, 0, BEST_OF_3, setScore=SetScore(2, 3, False, BEST_OF_3))
+        probs = [0.5, 0.6, 0.7]
+        np.testing.assert_allclose(_probabilityP1WinsMatchFast(ms, 1, np.array(probs), 0.6),
+                                   probabilityP1WinsMatch(ms, 1, probs, 0.6))
+
+
+# =============================================================================
+# Tests for probabilityP1WinsMatchGrid
+# =============================================================================
+
+class TestProbabilityP1WinsMatchGrid:
+    """Tests for probabilityP1WinsMatchGrid."""
+
+    def test_matches_probability_p1_wins_match(self):
+        ms = MatchScore(0, 1, BEST_OF_3, setScore=SetScore(4, 4, False, BEST_OF_3))
+        probs_p1, probs_p2 = [0.5, 0.6, 0.7], [0.55, 0.65]
+        grid = probabilityP1WinsMatchGrid(ms, 2, probs_p1, iter(probs_p2))
+        assert grid.shape == (3, 2)
+        for j, p2 in enumerate(probs_p2):
+            np.testing.assert_allclose(grid[:, j], probabilityP1WinsMatch(ms, 2, probs_p1, p2))
+
+    def test_monotonic_in_both_axes(self):
+        grid = probabilityP1WinsMatchGrid(make_match_score(0, 0), 1, [0.55, 0.6, 0.65], [0.55, 0.6, 0.65])
+        assert np.all(np.diff(grid, axis=0) > 0)
+        assert np.all(np.diff(grid, axis=1) < 0)
+
+    @pytest.mark.parametrize("invalid_probs", [[-0.1], [1.1], ["0.5"]])
+    def test_invalid_prob_p2s(self, invalid_probs):
+        with pytest.raises(ValueError, match="all probWinPointP2s must be numbers"):
+            probabilityP1WinsMatchGrid(make_match_score(0, 0), 1, [0.6], invalid_probs)
+
 
 # =============================================================================
 # Tests for probabilityP1WinsMatch at set boundary (Case 2)
@@ -494,7 +527,7 @@ class TestProbabilityP1WinsMatchSetBoundary:
         """With equal serve probabilities, P1 should have ~50% chance."""
         ms = make_match_score(0, 0)
         result = probabilityP1WinsMatch(ms, 1, [0.5], 0.5)
-        assert abs(result[0] - 0.5) < 0.01
+        assert result[0] == pytest.approx(0.5, abs=0.01)
 
 
 # =============================================================================
@@ -506,7 +539,7 @@ class TestProbabilityP1WinsMatchSetInProgress:
 
     def test_with_set_in_progress(self):
         """Should work when a set is in progress."""
-        mf = MatchFormat(bestOfSets=3)
+        mf = BEST_OF_3
         set_score = SetScore(3, 2, False, mf)
         ms = MatchScore(0, 0, mf, setScore=set_score)
         result = probabilityP1WinsMatch(ms, 1, [0.65], 0.60)
@@ -514,7 +547,7 @@ class TestProbabilityP1WinsMatchSetInProgress:
 
     def test_leading_in_set_higher_prob(self):
         """Leading in set should give higher prob than trailing."""
-        mf = MatchFormat(bestOfSets=3)
+        mf = BEST_OF_3
         set_score_leading = SetScore(4, 2, False, mf)
         set_score_trailing = SetScore(2, 4, False, mf)
         ms_leading = MatchScore(0, 0, mf, setScore=set_score_leading)
@@ -538,7 +571,13 @@ class TestProbabilityP1WinsMatchConsistency:
         result_main = probabilityP1WinsMatch(ms, 1, [0.65], 0.60)[0]
         result_boundary = _probabilityP1WinsMatchFromSetBoundary(ms, 0.65, 0.60)
         # Allow slightly larger tolerance due to floating point differences in calculation paths
-        assert abs(result_main - result_boundary) < 1e-5
+        assert result_main == pytest.approx(result_boundary, abs=1e-5)
+
+    def test_vectorized_consistent_with_set_boundary_func(self, boundary_table):
+        """Many P1 probabilities at once should agree with _probabilityP1WinsMatchFromSetBoundary for each one."""
+        ms = make_match_score(0, 0)
+        result = probabilityP1WinsMatch(ms, 1, BOUNDARY_P1_PROBS, 0.60)
+        np.testing.assert_allclose(result, boundary_table[BOUNDARY_SCORES.index((0, 0))], atol=1e-5)
 
     def test_player_serving_doesnt_matter_at_set_boundary(self):
         """At set boundary (0-0 games), player serving shouldn't change match probability."""
@@ -546,7 +585,7 @@ class TestProbabilityP1WinsMatchConsistency:
         result_p1_serves = probabilityP1WinsMatch(ms, 1, [0.65], 0.60)[0]
         result_p2_serves = probabilityP1WinsMatch(ms, 2, [0.65], 0.60)[0]
         # At set boundary (0-0 in games), it shouldn't matter who serves
-        assert abs(result_p1_serves - result_p2_serves) < 1e-6
+        assert result_p1_serves == pytest.approx(result_p2_serves, abs=1e-6)
 
 
 # =============================================================================
@@ -566,12 +605,11 @@ class TestBestOfFiveMatches:
         result = probabilityP1WinsMatch(ms, 1, [0.65], 0.60)
         assert 0 < result[0] < 1
 
-    def test_bo5_all_paths_sum_to_one(self):
+    def test_bo5_all_paths_sum_to_one(self, paths_bo5_from_00):
         """All possible paths from 0-0 in best-of-5 should sum to 1."""
-        ms = make_match_score(0, 0, bestOf=5)
-        paths = MatchPath.generateAllPaths(ms)
+        paths = paths_bo5_from_00
         total = sum(pathProbability(p, 0.65, 0.60) for p in paths)
-        assert abs(total - 1.0) < 1e-10
+        assert total == pytest.approx(1.0, abs=1e-10)
 
     def test_bo5_harder_to_upset(self):
         """Favorite should be more likely to win in best-of-5 than best-of-3."""
@@ -614,3 +652,18 @@ class TestEdgeCases:
         ms = make_match_score(0, 0)
         result = probabilityP1WinsMatch(ms, 1, [0.65], 0.60)
         assert len(result) == 1
+
+    @pytest.mark.parametrize("probWinPointP2", [0.0, 0.4, 1.0])
+    def test_certain_set_outcomes_agree_with_set_probability(self, probWinPointP2):
+        """Sets flagged as certain are won with probability 0 or 1 by the full calculation too."""
+        probWinPointP1s = np.array([0.0, 0.3, 0.7, 1.0])
+        certain = _certainSetOutcomes(probWinPointP1s, probWinPointP2)
+        known   = ~np.isnan(certain)
+        np.testing.assert_allclose(_probabilityP1WinsSetArray(probWinPointP1s, probWinPointP2)[known], certain[known], atol=1e-12)
+
+    @pytest.mark.parametrize("sets, playerServing", [((1, 0), 1), ((0, 0), 2)])
+    def test_certain_outcomes_bypass_cached_function(self, monkeypatch, sets, playerServing):
+        """With a cached match function, values with certain set outcomes are not interpolated."""
+        monkeypatch.setattr(match_probability, "_loadCachedFunction", lambda initScore: (lambda p1, p2: 0.42))
+        result = probabilityP1WinsMatch(make_match_score(*sets), playerServing, [0.0, 0.65, 1.0], 0.60)
+        np.testing.assert_array_equal(result, [0.0, 0.42, 1.0])
@@ -1,6 +1,7 @@
 """Tests for the SetPath class."""
 
 import pytest
+import numpy as np
 from tennis_lab.paths.set_path import SetPath
 from tennis_lab.core.set_score import SetScore
 from tennis_lab.core.game_score import GameScore
@@ -96,6 +97,13 @@ class TestSetPathScoreHistory:
         assert hasattr(entry, 'score')
         assert hasattr(entry, 'playerServing')
 
+    def test_score_array_matches_history(self):
+        ss = SetScore(3, 2, False, DEFAULT_FORMAT)
+        path1, _ = SetPath(ss, 2).increment()
+        scores = path1.scoreArray
+        assert scores.dtype == np.int8
+        assert scores.tolist() == [[3, 2, 2], [4, 2, 1]]
+
 
 class TestSetPathIncrement:
     """Tests for increment method."""
@@ -154,6 +162,16 @@ class TestSetPathIncrement:
         path1._entries.append(SetPath.PathEntry(score=SetScore(2, 0, False, DEFAULT_FORMAT), playerServing=1))
         assert len(path2.scoreHistory) == 2
 
+    def test_increment_shares_prefix_entries(self):
+        ss = SetScore(0, 0, False, DEFAULT_FORMAT)
+        path = SetPath(ss, 1)
+        path1, path2 = path.increment()
+
+        # the entries are immutable, so the new paths share the entries of the original path
+        assert path1.scoreHistory[0] is path.scoreHistory[0]
+        assert path2.scoreHistory[0] is path.scoreHistory[0]
+        assert path1._entries is not path._entries
+
     def test_increment_alternates_server(self):
         """Server should alternate after each game."""
         ss = SetScore(0, 0, False, DEFAULT_FORMAT)
@@ -3,7 +3,10 @@
 import pytest
 import math
 from tennis_lab.paths.set_path import SetPath
-from tennis_lab.paths.set_probability import pathProbability, _loadCachedFunction, _probabilityP1WinsSetFromGameBoundary, probabilityP1WinsSet
+from tennis_lab.paths.set_probability import pathProbability, pathProbabilities, _loadCachedFunction, _probabilityP1WinsSetFromGameBoundary, probabilityP1WinsSet
+from tennis_lab.paths.set_probability import _probabilityP1WinsSetFromGameProbs, _probabilityServerHoldsGame, _loadCachedTable
+from tennis_lab.paths.game_probability import probabilityServerWinsGame
+from tennis_lab.core.game_score import GameScore
 import numpy as np
 from tennis_lab.core.set_score import SetScore
 from tennis_lab.core.match_format import MatchFormat
@@ -114,10 +117,9 @@ class TestPathProbabilitySingleScore:
 class TestPathProbabilityLoveSet:
     """Tests for love set paths where one player wins all games."""
 
-    def test_love_set_p1_wins_p1_starts_serving(self):
+    def test_love_set_p1_wins_p1_starts_serving(self, readonly_set_paths):
         """Path: 0-0 -> 1-0 -> 2-0 -> 3-0 -> 4-0 -> 5-0 -> 6-0, P1 serves first."""
-        ss = make_set_score(0, 0)
-        paths = SetPath.generateAllPaths(ss, playerServing=1)
+        paths = readonly_set_paths(0, 0, 1)
 
         # Find the 6-0 path
         love_path = None
@@ -134,10 +136,9 @@ class TestPathProbabilityLoveSet:
         # Games P1 serves and wins: 3 games
         # Games P2 serves and P1 wins (breaks): 3 games
 
-    def test_love_set_p2_wins_p1_starts_serving(self):
+    def test_love_set_p2_wins_p1_starts_serving(self, readonly_set_paths):
         """Path: 0-0 -> 0-1 -> 0-2 -> 0-3 -> 0-4 -> 0-5 -> 0-6, P1 serves first."""
-        ss = make_set_score(0, 0)
-        paths = SetPath.generateAllPaths(ss, playerServing=1)
+        paths = readonly_set_paths(0, 0, 1)
 
         # Find the 0-6 path
         love_path = None
@@ -157,10 +158,9 @@ class TestPathProbabilityLoveSet:
 class TestPathProbabilityCalculations:
     """Tests for specific probability calculations."""
 
-    def test_all_paths_probs_sum_near_one(self):
+    def test_all_paths_probs_sum_near_one(self, readonly_set_paths):
         """Sum of all path probabilities should be close to 1 (excluding tied paths)."""
-        ss = make_set_score(0, 0)
-        paths = SetPath.generateAllPaths(ss, playerServing=1)
+        paths = readonly_set_paths(0, 0, 1)
 
         probP1 = 0.65
         probP2 = 0.60
@@ -176,10 +176,9 @@ class TestPathProbabilityCalculations:
         # But should still account for a significant fraction
         assert total > 0.5
 
-    def test_symmetric_probs_equal_paths(self):
+    def test_symmetric_probs_equal_paths(self, readonly_set_paths):
         """With equal serve probabilities, P1 winning 6-0 should equal P2 winning 0-6 when serving patterns are symmetric."""
-        ss = make_set_score(0, 0)
-        paths = SetPath.generateAllPaths(ss, playerServing=1)
+        paths = readonly_set_paths(0, 0, 1)
 
         prob = 0.65  # Same for both players
 
@@ -210,10 +209,9 @@ class TestPathProbabilityCalculations:
 class TestPathProbabilityMonotonicity:
     """Tests that probability changes appropriately with serve probabilities."""
 
-    def test_higher_p1_prob_increases_p1_win_probability(self):
+    def test_higher_p1_prob_increases_p1_win_probability(self, readonly_set_paths):
         """Higher P1 serve probability should increase P1 winning paths."""
-        ss = make_set_score(0, 0)
-        paths = SetPath.generateAllPaths(ss, playerServing=1)
+        paths = readonly_set_paths(0, 0, 1)
 
         # Find a path where P1 wins
         p1_wins_path = None
@@ -237,10 +235,9 @@ class TestPathProbabilityMonotonicity:
         for i in range(len(probs) - 1):
             assert probs[i] < probs[i + 1]
 
-    def test_higher_p2_prob_decreases_p1_win_probability(self):
+    def test_higher_p2_prob_decreases_p1_win_probability(self, readonly_set_paths):
         """Higher P2 serve probability should decrease P1 winning paths (P2 holds more)."""
-        ss = make_set_score(0, 0)
-        paths = SetPath.generateAllPaths(ss, playerServing=1)
+        paths = readonly_set_paths(0, 0, 1)
 
         # Find a path where P1 wins
         p1_wins_path = None
@@ -272,10 +269,9 @@ class TestPathProbabilityMonotonicity:
 class TestPathProbabilityFinalScores:
     """Tests for paths with final scores."""
 
-    def test_path_ending_6_4(self):
+    def test_path_ending_6_4(self, readonly_set_paths):
         """Test a path ending at 6-4."""
-        ss = make_set_score(0, 0)
-        paths = SetPath.generateAllPaths(ss, playerServing=1)
+        paths = readonly_set_paths(0, 0, 1)
 
         # Find a 6-4 path
         path_6_4 = None
@@ -291,10 +287,9 @@ class TestPathProbabilityFinalScores:
         prob = pathProbability(path_6_4, 0.65, 0.60)
         assert 0 < prob < 1
 
-    def test_path_ending_7_5(self):
+    def test_path_ending_7_5(self, readonly_set_paths):
         """Test a path ending at 7-5."""
-        ss = make_set_score(0, 0)
-        paths = SetPath.generateAllPaths(ss, playerServing=1)
+        paths = readonly_set_paths(0, 0, 1)
 
         # Find a 7-5 path
         path_7_5 = None
@@ -309,10 +304,9 @@ class TestPathProbabilityFinalScores:
         prob = pathProbability(path_7_5, 0.65, 0.60)
         assert 0 < prob < 1
 
-    def test_path_ending_tied_6_6(self):
+    def test_path_ending_tied_6_6(self, readonly_set_paths):
         """Test a path ending at 6-6 (tied, goes to tiebreak)."""
-        ss = make_set_score(0, 0)
-        paths = SetPath.generateAllPaths(ss, playerServing=1)
+        paths = readonly_set_paths(0, 0, 1)
 
         # Find a 6-6 path
         tied_path = None
@@ -335,19 +329,17 @@ class TestPathProbabilityFinalScores:
 class TestPathProbabilityBounds:
     """Tests that probabilities are always within valid bounds."""
 
-    def test_probability_between_zero_and_one(self):
+    def test_probability_between_zero_and_one(self, readonly_set_paths):
         """All path probabilities should be between 0 and 1."""
-        ss = make_set_score(0, 0)
-        paths = SetPath.generateAllPaths(ss, playerServing=1)
+        paths = readonly_set_paths(0, 0, 1)
 
         for path in paths:
             prob = pathProbability(path, 0.65, 0.60)
             assert 0 <= prob <= 1
 
-    def test_extreme_probabilities(self):
+    def test_extreme_probabilities(self, readonly_set_paths):
         """Test with extreme (but valid) probabilities."""
-        ss = make_set_score(0, 0)
-        paths = SetPath.generateAllPaths(ss, playerServing=1)
+        paths = readonly_set_paths(0, 0, 1)
 
         # Test with very low probabilities
         for path in paths[:5]:  # Just check first few paths
@@ -367,20 +359,18 @@ class TestPathProbabilityBounds:
 class TestPathProbabilityFromDifferentScores:
     """Tests for paths starting from non-zero scores."""
 
-    def test_from_3_2_score(self):
+    def test_from_3_2_score(self, readonly_set_paths):
         """Test path probability from 3-2."""
-        ss = make_set_score(3, 2)
-        paths = SetPath.generateAllPaths(ss, playerServing=1)
+        paths = readonly_set_paths(3, 2, 1)
 
         # All paths should have valid probabilities
         for path in paths:
             prob = pathProbability(path, 0.65, 0.60)
             assert 0 <= prob <= 1
 
-    def test_from_5_4_score(self):
+    def test_from_5_4_score(self, readonly_set_paths):
         """Test path probability from 5-4."""
-        ss = make_set_score(5, 4)
-        paths = SetPath.generateAllPaths(ss, playerServing=2)
+        paths = readonly_set_paths(5, 4, 2)
 
         # Should have relatively few paths from this score
         assert len(paths) > 0
@@ -389,10 +379,9 @@ class TestPathProbabilityFromDifferentScores:
             prob = pathProbability(path, 0.65, 0.60)
             assert 0 <= prob <= 1
 
-    def test_from_5_5_score(self):
+    def test_from_5_5_score(self, readonly_set_paths):
         """Test path probability from 5-5."""
-        ss = make_set_score(5, 5)
-        paths = SetPath.generateAllPaths(ss, playerServing=1)
+        paths = readonly_set_paths(5, 5, 1)
 
         # From 5-5, possible outcomes: 7-5, 5-7, or 6-6
         for path in paths:
@@ -407,12 +396,10 @@ class TestPathProbabilityFromDifferentScores:
 class TestPathProbabilityServerRotation:
     """Tests that server rotation is handled correctly."""
 
-    def test_different_starting_servers(self):
+    def test_different_starting_servers(self, readonly_set_paths):
         """Probability may differ based on who serves first."""
-        ss = make_set_score(0, 0)
-
-        paths_p1_first = SetPath.generateAllPaths(ss, playerServing=1)
-        paths_p2_first = SetPath.generateAllPaths(ss, playerServing=2)
+        paths_p1_first = readonly_set_paths(0, 0, 1)
+        paths_p2_first = readonly_set_paths(0, 0, 2)
 
         # Find 6-0 paths from each
         p1_first_6_0 = None
@@ -447,6 +434,38 @@ class TestPathProbabilityServerRotation:
         assert 0 < prob_p2_first < 1
 
 
+# =============================================================================
+# Tests for pathProbabilities (batched path probabilities)
+# =============================================================================
+
+class TestPathProbabilities:
+    """Tests for pathProbabilities."""
+
+    def test_invalid_path_type(self):
+        path = SetPath(make_set_score(0, 0), playerServing=1)
+        with pytest.raises(ValueError, match="all paths must be SetPath"):
+            pathProbabilities([path, "not a path"], 0.6, 0.6)
+
+    @pytest.mark.parametrize("probWinPointP1, probWinPointP2, message", [
+        (1.1, 0.6, "probWinPointP1 must be a number"),
+        (0.6, 1.1, "probWinPointP2 must be a number"),
+    ])
+    def test_invalid_probs(self, probWinPointP1, probWinPointP2, message):
+        path = SetPath(make_set_score(0, 0), playerServing=1)
+        with pytest.raises(ValueError, match=message):
+            pathProbabilities([path], probWinPointP1, probWinPointP2)
+
+    def test_no_paths(self):
+        assert pathProbabilities([], 0.65, 0.60).shape == (0,)
+
+    @pytest.mark.parametrize("gamesP1, gamesP2, playerServing", [(0, 0, 1), (0, 0, 2), (4, 3, 1), (5, 5, 2)])
+    def test_matches_path_probability(self, readonly_set_paths, gamesP1, gamesP2, playerServing):
+        """Each batched probability should equal the probability of the path computed on its own."""
+        paths = readonly_set_paths(gamesP1, gamesP2, playerServing)
+        expected = [pathProbability(p, 0.65, 0.60) for p in paths]
+        np.testing.assert_allclose(pathProbabilities(paths, 0.65, 0.60), expected, rtol=1e-12)
+
+
 # =============================================================================
 # Tests for _loadCachedFunction
 # =============================================================================
@@ -495,6 +514,25 @@ class TestLoadCachedFunctionBehavior:
         result = _loadCachedFunction(ss, 1)
         assert result is None or callable(result)
 
+    def test_table_loaded_once(self):
+        """The cache table is read at most once, whether it exists or not."""
+        _loadCachedFunction(make_set_score(2, 1), 2)
+        misses = _loadCachedTable.cache_info().misses
+        _loadCachedFunction(make_set_score(3, 4), 1)
+        assert _loadCachedTable.cache_info().misses == misses
+
+    def test_bilinear_interpolation(self, monkeypatch):
+        """Between grid points, the table is interpolated bilinearly (exact for a bilinear function)."""
+        Ps    = np.linspace(0, 1, 11)
+        table = np.full((2, 8, 8, 11, 11), np.nan)
+        table[0, 3, 2] = Ps[:, None] * (1 - Ps[None, :])
+        monkeypatch.setattr("tennis_lab.paths.set_probability._loadCachedTable", lambda: table)
+
+        cached_fn = _loadCachedFunction(make_set_score(3, 2), 1)
+        assert math.isclose(cached_fn(0.63, 0.57), 0.63 * 0.43)
+        np.testing.assert_allclose(cached_fn(np.array([0.0, 0.25, 1.0]), 0.57), [0.0, 0.25 * 0.43, 0.43])
+        assert _loadCachedFunction(make_set_score(3, 2), 2) is None   # score not in the table
+
     def test_cached_function_returns_float(self):
         """If cache available, returned function should return a float."""
         ss = make_set_score(0, 0)
@@ -906,6 +944,45 @@ class TestProbabilityP1WinsSetFromGameBoundarySymmetry:
         assert math.isclose(result, 0.5, rel_tol=0.01)
 
 
+class TestProbabilityServerHoldsGame:
+    """Tests for the closed-form game-winning probability _probabilityServerHoldsGame."""
+
+    def test_matches_lattice_calculation(self):
+        probs = np.linspace(0, 1, 21)
+        expected = [probabilityServerWinsGame(GameScore(0, 0), 1, float(p)) for p in probs]
+        np.testing.assert_allclose(_probabilityServerHoldsGame(probs), expected, atol=1e-12)
+
+    def test_scalar_input(self):
+        assert _probabilityServerHoldsGame(0.5) == pytest.approx(0.5)
+
+
+class TestProbabilityP1WinsSetFromGameProbs:
+    """Tests for the game-level set kernel _probabilityP1WinsSetFromGameProbs."""
+
+    def test_both_players_hold_reaches_tiebreak(self):
+        """If both players always hold, the set is decided by the tiebreak, served by the starting server."""
+        result = _probabilityP1WinsSetFromGameProbs(0, 0, 1, 6, 1.0, 1.0, 0.3, 0.8)
+        assert result == pytest.approx(0.3)
+        result = _probabilityP1WinsSetFromGameProbs(0, 0, 2, 6, 1.0, 1.0, 0.3, 0.8)
+        assert result == pytest.approx(0.8)
+
+    def test_p1_wins_every_game(self):
+        result = _probabilityP1WinsSetFromGameProbs(2, 4, 2, 6, 1.0, 0.0, 0.5, 0.5)
+        assert result == pytest.approx(1.0)
+
+    def test_broadcasts_over_arrays(self):
+        probHoldP1 = np.array([0.6, 0.8, 0.9])
+        result = _probabilityP1WinsSetFromGameProbs(0, 0, 1, 6, probHoldP1, 0.8, 0.5, 0.5)
+        expected = [_probabilityP1WinsSetFromGameProbs(0, 0, 1, 6, p, 0.8, 0.5, 0.5) for p in probHoldP1]
+        np.testing.assert_allclose(result, expected)
+        assert np.all(np.diff(result) > 0)
+
+    def test_final_score_from_game_boundary(self):
+        """A score which is already final gives a certain outcome."""
+        assert _probabilityP1WinsSetFromGameBoundary(make_set_score(6, 4), 1, 0.3, 0.9) == 1.0
+        assert _probabilityP1WinsSetFromGameBoundary(make_set_score(5, 7), 2, 0.9, 0.3) == 0.0
+
+
 # =============================================================================
 # Tests for probabilityP1WinsSet
 # =============================================================================
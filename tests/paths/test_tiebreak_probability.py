@@ -4,6 +4,8 @@ import pytest
 import math
 from tennis_lab.paths.tiebreak_path import TiebreakPath
 from tennis_lab.paths.tiebreak_probability import pathProbability, probabilityP1WinsTiebreak, _probabilityP1WinsTie, loadCachedFunction
+from tennis_lab.paths.tiebreak_probability import _probabilityP1WinsTiebreakArray
+import numpy as np
 from tennis_lab.core.tiebreak_score import TiebreakScore
 from tennis_lab.core.match_format import MatchFormat
 
@@ -469,6 +471,29 @@ class TestProbabilityP1WinsTiebreakProbabilitySum:
         assert math.isclose(prob_p1_wins + (1 - prob_p1_wins), 1.0, rel_tol=1e-9)
 
 
+class TestProbabilityP1WinsTiebreakArray:
+    """Tests for the vectorized lattice calculation _probabilityP1WinsTiebreakArray."""
+
+    @pytest.mark.parametrize("points, isSuper, server", [
+        ((3, 4), False, 1), ((5, 5), False, 2), ((6, 5), False, 1),
+        ((7, 7), False, 2), ((8, 7), True, 1), ((9, 9), True, 2),
+    ])
+    def test_matches_path_calculation(self, points, isSuper, server):
+        ts = TiebreakScore(*points, isSuper, DEFAULT_FORMAT)
+        probs = np.array([0.0, 0.3, 0.65, 1.0])
+        expected = [probabilityP1WinsTiebreak(ts, server, float(p), 0.60) for p in probs]
+        np.testing.assert_allclose(_probabilityP1WinsTiebreakArray(ts, server, probs, 0.60), expected, atol=1e-12)
+
+    def test_final_score(self):
+        ts = TiebreakScore(5, 7, False, DEFAULT_FORMAT)
+        np.testing.assert_array_equal(_probabilityP1WinsTiebreakArray(ts, 1, [0.2, 0.9], 0.60), [0.0, 0.0])
+
+    def test_equal_probs_gives_half(self):
+        ts = TiebreakScore(0, 0, False, DEFAULT_FORMAT)
+        result = _probabilityP1WinsTiebreakArray(ts, 1, [0.65], 0.65)
+        assert result[0] == pytest.approx(0.5)
+
+
 # =============================================================================
 # Tests for loadCachedFunction
 # =============================================================================